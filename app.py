@@ -23,7 +23,8 @@ from llm.validate_suggestion import SuggestionValidationError
 from llm.validate_v3 import ValidateContext, validate_and_sanitize_result
 from llm.validation_result import summarize_warnings
 from model.cost_driver import calibrate_alpha_beta
-from pipeline.cache import CacheError, load_cache, load_cache_meta_raw
+from pipeline.artifacts import cached_frame
+from pipeline.cache import CacheError, cache_data_exists, load_cache_meta_raw, load_cache_slice
 from pipeline.run_all import run_all
 from scenarios.presets_v3 import PRESETS_V3, PresetV3
 from scenarios.schema import ScenarioParamsV3
@@ -52,9 +53,10 @@ def _safe_error_text(value: object) -> str:
 
 
 def _load_series():
-    series_path = CACHE_SERIES_PRIMARY if CACHE_SERIES_PRIMARY.exists() else CACHE_SERIES_FALLBACK
-    rows, meta = load_cache(data_path=str(series_path))
-    return rows, meta, series_path
+    primary_exists = cache_data_exists(str(CACHE_SERIES_PRIMARY))
+    series_path = CACHE_SERIES_PRIMARY if primary_exists else CACHE_SERIES_FALLBACK
+    series_df, meta = load_cache_slice(data_path=str(series_path))
+    return series_df, meta, series_path
 
 
 def _display_metric_name(metric_name: str) -> str:
@@ -83,23 +85,27 @@ def _is_headcount(metric_name: str, unit: str) -> bool:
     return "fte" in combined or "headcount" in combined
 
 
+def _read_dated_csv(path: Path) -> pd.DataFrame:
+    df = pd.read_csv(path)
+    df["date"] = pd.to_datetime(df["date"])
+    return df
+
+
 def _load_forecast() -> pd.DataFrame:
     if not CACHE_FORECAST.exists():
         raise FileNotFoundError("forecast")
-    df = pd.read_csv(CACHE_FORECAST)
+    df = cached_frame("app_forecast", [str(CACHE_FORECAST)], lambda: _read_dated_csv(CACHE_FORECAST))
     if df.empty:
         raise ValueError("forecast empty")
-    df["date"] = pd.to_datetime(df["date"])
     return df
 
 
 def _load_scenarios() -> pd.DataFrame:
     if not CACHE_SCENARIOS.exists():
         raise FileNotFoundError("scenarios")
-    df = pd.read_csv(CACHE_SCENARIOS)
+    df = cached_frame("app_scenarios", [str(CACHE_SCENARIOS)], lambda: _read_dated_csv(CACHE_SCENARIOS))
     if df.empty:
         raise ValueError("scenarios empty")
-    df["date"] = pd.to_datetime(df["date"])
     return df
 
 
@@ -326,7 +332,7 @@ def _render_app() -> None:
     _inject_styles()
 
     try:
-        rows, meta, series_path = _load_series()
+        series_df, meta, series_path = _load_series()
         meta_raw = load_cache_meta_raw()
     except CacheError:
         st.error("Series cache missing. Run `python -m demo.refresh --source sac` first.")
@@ -367,9 +373,6 @@ def _render_app() -> None:
     st.caption(
         f"Data from SAP Analytics Cloud (SAC). Last refresh: {meta.last_refresh_time}. Scenarios modify baseline assumptions."
     )
-    series_df = pd.DataFrame(rows)
-    series_df["date"] = pd.to_datetime(series_df["date"])
-    series_df["value"] = pd.to_numeric(series_df["value"], errors="coerce")
     series_df = series_df.sort_values("date")
 
     with st.expander("Data provenance", expanded=False):
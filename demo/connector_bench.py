@@ -0,0 +1,74 @@
+import argparse
+import time
+
+from demo.fake_des import FakeDesSettings, start_fake_des
+from sac_connector.auth import clear_token_cache
+from sac_connector.ratelimit import AdaptiveRateLimiter, get_limiter, set_limiter
+from sac_connector.timeseries import DEFAULT_SLICE, fetch_timeseries, split_by_date
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark sac_connector.fetch_timeseries against a local fake DES."
+    )
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--page-size", type=int, default=1_000)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--error-rate-429", type=float, default=0.0)
+    parser.add_argument("--error-rate-5xx", type=float, default=0.0)
+    parser.add_argument("--prefetch", type=int, default=0)
+    parser.add_argument("--partitions", type=int, default=0, help="Split by Date into N slices.")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--rate", type=float, default=1000.0, help="Client rate limit (req/s).")
+    args = parser.parse_args()
+
+    settings = FakeDesSettings(
+        rows=args.rows,
+        page_size=args.page_size,
+        latency_ms=args.latency_ms,
+        error_rate_429=args.error_rate_429,
+        error_rate_5xx=args.error_rate_5xx,
+        retry_after_seconds=0,
+    )
+    server = start_fake_des(settings)
+    config = server.config()
+    partitions = None
+    if args.partitions:
+        partitions = split_by_date(
+            DEFAULT_SLICE, server.months[0], server.months[-1], args.partitions
+        )
+
+    clear_token_cache()
+    set_limiter(AdaptiveRateLimiter(rate=args.rate))
+    try:
+        for run in range(1, args.repeat + 1):
+            timings = []
+            started = time.perf_counter()
+            df = fetch_timeseries(
+                config.provider_id,
+                config=config,
+                prefetch=args.prefetch,
+                timings=timings,
+                partitions=partitions,
+                max_workers=args.workers,
+            )
+            elapsed = time.perf_counter() - started
+            fetch_seconds = sum(timing.fetch_seconds for timing in timings)
+            parse_seconds = sum(timing.parse_seconds for timing in timings)
+            print(
+                f"run={run} rows={len(df)} seconds={elapsed:.3f} "
+                f"rows_per_sec={len(df) / elapsed:,.0f} pages={len(timings) or 'n/a'} "
+                f"fetch_s={fetch_seconds:.3f} parse_s={parse_seconds:.3f}"
+            )
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    print(f"SERVER {server.counters}")
+    print(f"LIMITER {get_limiter().snapshot()}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
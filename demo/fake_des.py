@@ -0,0 +1,241 @@
+"""Local stand-in for the SAC OAuth token endpoint and Data Export Service FactData paging.
+
+Used for offline load testing of sac_connector (see demo.connector_bench).
+"""
+import argparse
+import gzip
+import json
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlparse
+
+from config import Config
+from sac_connector.timeseries import DEFAULT_DIM_FIELDS
+
+
+_EQ_FILTER = re.compile(r"(\w+) eq '([^']*)'")
+_DATE_BOUND = re.compile(r"Date (ge|le) '(\d{6})'")
+
+
+@dataclass(frozen=True)
+class FakeDesSettings:
+    rows: int = 10_000
+    page_size: int = 1_000
+    months: int = 120
+    start_month: str = "201501"
+    members: int = 50
+    latency_ms: float = 0.0
+    error_rate_429: float = 0.0
+    error_rate_5xx: float = 0.0
+    retry_after_seconds: int = 1
+    token_expires_in: int = 3600
+    seed: int = 7
+
+
+def _month_labels(start: str, count: int) -> List[str]:
+    ordinal = int(start[:4]) * 12 + int(start[4:]) - 1
+    return [f"{(ordinal + i) // 12:04d}{(ordinal + i) % 12 + 1:02d}" for i in range(count)]
+
+
+def _parse_filter(raw: str) -> Tuple[Dict[str, str], Optional[str], Optional[str]]:
+    equals = {key: value for key, value in _EQ_FILTER.findall(raw) if key != "Date"}
+    bounds = dict((op, value) for op, value in _DATE_BOUND.findall(raw))
+    return equals, bounds.get("ge"), bounds.get("le")
+
+
+class FakeDesServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], settings: FakeDesSettings):
+        super().__init__(address, _FakeDesHandler)
+        self.settings = settings
+        self.months = _month_labels(settings.start_month, settings.months)
+        self._random = random.Random(settings.seed)
+        self._lock = threading.Lock()
+        self.counters = {
+            "token_requests": 0,
+            "page_requests": 0,
+            "injected_429": 0,
+            "injected_5xx": 0,
+        }
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def config(self) -> Config:
+        return Config(
+            tenant_url=self.base_url,
+            auth_url=None,
+            token_url=f"{self.base_url}/oauth/token",
+            client_id="fake-client",
+            client_secret="fake-secret",
+            dataexport_base_url=f"{self.base_url}/api/v1/dataexport",
+            namespace_id="sac",
+            provider_id="FAKE",
+            provider_name="Fake DES",
+        )
+
+    def count(self, key: str) -> None:
+        with self._lock:
+            self.counters[key] += 1
+
+    def roll_error(self) -> Optional[int]:
+        with self._lock:
+            roll = self._random.random()
+        if roll < self.settings.error_rate_429:
+            return 429
+        if roll < self.settings.error_rate_429 + self.settings.error_rate_5xx:
+            return 503
+        return None
+
+    def page(self, query: Dict[str, str]) -> Dict[str, object]:
+        settings = self.settings
+        equals, date_from, date_to = _parse_filter(query.get("$filter", ""))
+        months = [
+            month
+            for month in self.months
+            if (not date_from or month >= date_from) and (not date_to or month <= date_to)
+        ]
+        # Row volume scales with the requested share of the history.
+        total = settings.rows * len(months) // max(1, len(self.months))
+        per_month = max(1, total // max(1, len(months))) if months else 0
+        total = per_month * len(months)
+        measure = query.get("$select", "SignedData").split(",")[-1]
+
+        start = int(query.get("$skiptoken", "0"))
+        end = min(total, start + settings.page_size)
+        rows = []
+        for index in range(start, end):
+            member = index % settings.members
+            row = {field: equals.get(field, f"{field}_{member}") for field in DEFAULT_DIM_FIELDS}
+            row["Date"] = months[index // per_month]
+            row[measure] = float(index % 97)
+            rows.append(row)
+
+        payload: Dict[str, object] = {"value": rows}
+        if end < total:
+            next_query = {key: value for key, value in query.items() if key != "$skiptoken"}
+            next_query["$skiptoken"] = str(end)
+            payload["@odata.nextLink"] = "?" + urlencode(next_query)
+        return payload
+
+
+class _FakeDesHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are separate writes; avoid Nagle/delayed-ACK stalls on keep-alive.
+    disable_nagle_algorithm = True
+    server: FakeDesServer
+
+    def log_message(self, *_args) -> None:
+        pass
+
+    def _send_json(
+        self,
+        status: int,
+        payload: Dict[str, object],
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body, compresslevel=1)
+            self.send_header("Content-Encoding", "gzip")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _maybe_fail(self) -> bool:
+        status = self.server.roll_error()
+        if status is None:
+            return False
+        if status == 429:
+            self.server.count("injected_429")
+            retry_after = str(self.server.settings.retry_after_seconds)
+            self._send_json(429, {"error": "Too many requests"}, {"Retry-After": retry_after})
+        else:
+            self.server.count("injected_5xx")
+            self._send_json(status, {"error": "Service unavailable"})
+        return True
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length", "0") or "0")
+        self.rfile.read(length)
+        if urlparse(self.path).path != "/oauth/token":
+            self._send_json(404, {"error": "not found"})
+            return
+        self.server.count("token_requests")
+        self._send_json(
+            200,
+            {
+                "access_token": "fake-token",
+                "token_type": "Bearer",
+                "expires_in": self.server.settings.token_expires_in,
+            },
+        )
+
+    def do_GET(self) -> None:
+        parsed = urlparse(self.path)
+        if not parsed.path.endswith("/FactData"):
+            self._send_json(404, {"error": "not found"})
+            return
+        if self.headers.get("Authorization") != "Bearer fake-token":
+            self._send_json(401, {"error": "unauthorized"})
+            return
+        if self.server.settings.latency_ms:
+            time.sleep(self.server.settings.latency_ms / 1000.0)
+        if self._maybe_fail():
+            return
+        self.server.count("page_requests")
+        self._send_json(200, self.server.page(dict(parse_qsl(parsed.query))))
+
+
+def start_fake_des(
+    settings: FakeDesSettings = FakeDesSettings(),
+    host: str = "127.0.0.1",
+    port: int = 0,
+) -> FakeDesServer:
+    server = FakeDesServer((host, port), settings)
+    thread = threading.Thread(target=server.serve_forever, name="fake-des", daemon=True)
+    thread.start()
+    return server
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run a local fake SAC Data Export Service.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--rows", type=int, default=FakeDesSettings.rows)
+    parser.add_argument("--page-size", type=int, default=FakeDesSettings.page_size)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate-429", type=float, default=0.0)
+    parser.add_argument("--error-rate-5xx", type=float, default=0.0)
+    args = parser.parse_args()
+
+    settings = FakeDesSettings(
+        rows=args.rows,
+        page_size=args.page_size,
+        latency_ms=args.latency_ms,
+        error_rate_429=args.error_rate_429,
+        error_rate_5xx=args.error_rate_5xx,
+    )
+    server = FakeDesServer((args.host, args.port), settings)
+    print(f"Fake DES listening on {server.base_url} (token: {server.base_url}/oauth/token)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -6,8 +6,8 @@ from typing import Dict
 from config import ConfigError, load_config
 from pipeline.cache import CacheError, CacheMeta, build_meta, load_cache, save_cache
 from pipeline.normalize_timeseries import NormalizeError, normalize_timeseries
-from pipeline.hr_cost_series import get_hr_cost_series
-from sac_connector.export import ExportError, export_all, normalize_rows
+from pipeline.hr_cost_series import get_hr_cost_series, refresh_measure_cache
+from sac_connector.export import ExportError, export_all, normalize_frame
 from sac_connector.timeseries import DEFAULT_SLICE, fetch_timeseries
 
 
@@ -23,7 +23,7 @@ def _parse_params(raw: str) -> Dict[str, str]:
     return {str(k): str(v) for k, v in data.items()}
 
 
-def refresh_from_sac(output_path: str) -> tuple[str, CacheMeta]:
+def refresh_from_sac(output_path: str, incremental: bool = False) -> tuple[str, CacheMeta]:
     config = load_config()
 
     export_url = os.getenv("SAC_EXPORT_URL", "").strip()
@@ -39,7 +39,9 @@ def refresh_from_sac(output_path: str) -> tuple[str, CacheMeta]:
 
     if provider_id:
         try:
-            get_hr_cost_series(source="sac", refresh=True, cache_path=output_path)
+            get_hr_cost_series(
+                source="sac", refresh=True, cache_path=output_path, incremental=incremental
+            )
         except CacheError as exc:
             raise ExportError(str(exc)) from exc
         try:
@@ -54,22 +56,18 @@ def refresh_from_sac(output_path: str) -> tuple[str, CacheMeta]:
                 "See docs/dataset_binding.md."
             )
         rows = export_all(config, export_url, params=params)
-        normalized = normalize_rows(
+        normalized = normalize_frame(
             rows,
             date_field=date_field,
             value_field=value_field,
             dim_fields=dim_fields,
             grain=grain,
         )
-    if not normalized:
+    if normalized.empty:
         raise ExportError("No rows returned from SAC export. See docs/dataset_binding.md.")
-    columns = list(normalized[0].keys()) if normalized else []
-    normalized_sorted = sorted(
-        normalized,
-        key=lambda r: tuple(r.get(col, "") for col in columns),
-    )
+    normalized_sorted = normalized.sort_values(list(normalized.columns)).reset_index(drop=True)
     meta = build_meta(normalized_sorted, source="sac")
-    save_cache(normalized_sorted, meta, data_path=output_path)
+    meta = save_cache(normalized_sorted, meta, data_path=output_path)
     return output_path, meta
 
 
@@ -85,14 +83,29 @@ def main() -> int:
     parser = argparse.ArgumentParser(description="Refresh cached dataset from SAC.")
     parser.add_argument("--source", default="sac", choices=["sac", "fixture"])
     parser.add_argument("--output", default="data/cache/sac_export.csv")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only re-pull months from the cached max_date minus an overlap window.",
+    )
+    parser.add_argument(
+        "--measures",
+        default="",
+        help="Comma-separated measures (SignedData,Cost) to also cache at month/quarter/year "
+        "grain in data/cache/measures.csv (SAC source only).",
+    )
     args = parser.parse_args()
+    measures = [name.strip() for name in args.measures.split(",") if name.strip()]
+    if measures and args.source != "sac":
+        print("--measures requires --source sac.")
+        return 1
 
     try:
         if args.source == "fixture":
             output = _refresh_from_fixture(args.output)
             _, meta = load_cache(data_path=args.output)
         else:
-            output, meta = refresh_from_sac(args.output)
+            output, meta = refresh_from_sac(args.output, incremental=args.incremental)
     except ExportError as exc:
         try:
             _, meta = load_cache(data_path=args.output)
@@ -121,6 +134,13 @@ def main() -> int:
         f"source={meta.source} row_count={meta.row_count} "
         f"min_date={meta.min_date} max_date={meta.max_date}"
     )
+    if measures:
+        try:
+            _, measure_meta = refresh_measure_cache(measures=measures)
+        except CacheError as exc:
+            print(str(exc))
+            return 1
+        print(f"OK wrote data/cache/measures.csv row_count={measure_meta['row_count']}")
     return 0
 
 
@@ -1,3 +1,3 @@
-from forecast.baseline import BaselineConfig, run_baseline
+from forecast.baseline import BaselineConfig, run_baseline, run_baseline_batch
 
-__all__ = ["BaselineConfig", "run_baseline"]
+__all__ = ["BaselineConfig", "run_baseline", "run_baseline_batch"]
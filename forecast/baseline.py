@@ -1,21 +1,31 @@
 from __future__ import annotations
 
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import date
-from typing import Literal
+from typing import List, Literal, Optional, Sequence, Tuple
 
 import numpy as np
 import pandas as pd
 from statsmodels.tsa.holtwinters import ExponentialSmoothing
 
 from config import BASELINE_GROWTH_YOY, BASELINE_INFLATION_PPY, BASELINE_FTE_GROWTH_YOY
+from forecast.fit_cache import EtsState, fit_key, load_fit, save_fit
 
 logger = logging.getLogger(__name__)
 
 
 Method = Literal["auto", "ets", "cagr"]
 
+# Worker processes for run_baseline_batch (0 uses os.cpu_count()).
+DEFAULT_BATCH_WORKERS = int(os.getenv("BASELINE_BATCH_WORKERS", "0"))
+# Series handed to a worker per task; small chunks keep workers busy, large ones cut pickling.
+DEFAULT_BATCH_CHUNK_SIZE = int(os.getenv("BASELINE_BATCH_CHUNK_SIZE", "64"))
+
+GroupKey = Tuple[object, ...]
+
 
 @dataclass(frozen=True)
 class BaselineConfig:
@@ -54,16 +64,33 @@ def _min_growth_path(last_value: float, horizon_months: int, growth_ppy: float)
     return np.array(values, dtype=float)
 
 
-def _fit_ets(series: pd.Series, horizon_months: int) -> pd.Series:
-    model = ExponentialSmoothing(
-        series,
-        trend="add",
-        seasonal=None,
-        initialization_method="estimated",
-    )
-    fit = model.fit(optimized=True)
-    forecast = fit.forecast(horizon_months)
-    return forecast
+def _fit_ets(
+    series: pd.Series, horizon_months: int, config: Optional[BaselineConfig] = None
+) -> pd.Series:
+    # Additive-trend ETS forecasts are level + h * trend, so a cached final state
+    # serves any horizon without refitting.
+    key = fit_key(series, config or BaselineConfig())
+    state = load_fit(key)
+    if state is None:
+        model = ExponentialSmoothing(
+            series,
+            trend="add",
+            seasonal=None,
+            initialization_method="estimated",
+        )
+        fit = model.fit(optimized=True)
+        params = {
+            name: float(value)
+            for name, value in fit.params.items()
+            if isinstance(value, (float, np.floating)) and np.isfinite(value)
+        }
+        state = EtsState(
+            level=float(np.asarray(fit.level)[-1]),
+            trend=float(np.asarray(fit.trend)[-1]),
+            params=params,
+        )
+        save_fit(key, state)
+    return state.forecast(horizon_months)
 
 
 def _fit_cagr(series: pd.Series, horizon_months: int, damping: float) -> pd.Series:
@@ -105,7 +132,7 @@ def run_baseline(
     forecast = None
     if method_used == "ets":
         try:
-            forecast = _fit_ets(series, horizon)
+            forecast = _fit_ets(series, horizon, config)
         except Exception as exc:
             logger.warning("ETS failed, falling back to CAGR: %s", exc)
             method_used = "cagr"
@@ -132,3 +159,69 @@ def run_baseline(
         }
     )
     return output
+
+
+def _forecast_chunk(
+    chunk: Sequence[Tuple[GroupKey, pd.DataFrame]],
+    horizon_months: int,
+    method: Method,
+    config: BaselineConfig,
+) -> List[Tuple[GroupKey, pd.DataFrame]]:
+    results = []
+    for key, frame in chunk:
+        try:
+            results.append((key, run_baseline(frame, horizon_months, method, config)))
+        except ValueError as exc:
+            raise ValueError(f"Baseline failed for group {key}: {exc}") from exc
+    return results
+
+
+def run_baseline_batch(
+    frame: pd.DataFrame,
+    horizon_months: int = 120,
+    method: Method = "auto",
+    config: BaselineConfig = BaselineConfig(),
+    max_workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+) -> pd.DataFrame:
+    """Forecast every dim_* group of a long-format frame (date, value, dim_*...).
+
+    Groups are fitted in chunks on a process pool; the result is long-format with the
+    dim_* columns followed by date, yhat and method, in sorted group order.
+    """
+    if "date" not in frame.columns or "value" not in frame.columns:
+        raise ValueError("Input series must have date and value columns.")
+    dims = [column for column in frame.columns if column.startswith("dim_")]
+    if not dims:
+        return run_baseline(frame, horizon_months, method, config)
+
+    groups = [
+        (key if isinstance(key, tuple) else (key,), group[["date", "value"]])
+        for key, group in frame.groupby(dims, sort=True, dropna=False, observed=True)
+    ]
+    if not groups:
+        raise ValueError("Input series is empty.")
+    workers = max_workers if max_workers is not None else DEFAULT_BATCH_WORKERS
+    workers = min(workers or os.cpu_count() or 1, len(groups))
+    size = chunk_size or DEFAULT_BATCH_CHUNK_SIZE
+    # Spread small batches across every worker instead of filling the first chunk.
+    size = max(1, min(size, -(-len(groups) // workers)))
+    chunks = [groups[i : i + size] for i in range(0, len(groups), size)]
+
+    if workers <= 1:
+        fitted = [_forecast_chunk(chunk, horizon_months, method, config) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_forecast_chunk, chunk, horizon_months, method, config)
+                for chunk in chunks
+            ]
+            fitted = [future.result() for future in futures]
+
+    pairs = [pair for results in fitted for pair in results]
+    output = pd.concat([forecast for _, forecast in pairs], ignore_index=True)
+    lengths = [len(forecast) for _, forecast in pairs]
+    for position, dim in enumerate(dims):
+        members = np.array([key[position] for key, _ in pairs], dtype=object)
+        output.insert(position, dim, np.repeat(members, lengths))
+    return output
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from dataclasses import asdict, dataclass
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+import statsmodels
+
+logger = logging.getLogger(__name__)
+
+# Directory for persisted ETS fits (empty disables the cache).
+FIT_CACHE_DIR = os.getenv("FORECAST_FIT_CACHE_DIR", "data/cache/ets_fits")
+# Bump when the ETS model specification in forecast.baseline changes.
+_MODEL_VERSION = "ets-add-v1"
+
+
+@dataclass(frozen=True)
+class EtsState:
+    level: float
+    trend: float
+    params: Dict[str, float]
+
+    def forecast(self, horizon_months: int) -> pd.Series:
+        steps = np.arange(1, horizon_months + 1, dtype=float)
+        return pd.Series(self.level + self.trend * steps)
+
+
+def fit_key(series: pd.Series, config: object) -> str:
+    """Hash the series values, dates and config (a dataclass) into a fit cache key."""
+    digest = hashlib.sha256()
+    digest.update(f"{_MODEL_VERSION}|{statsmodels.__version__}|".encode("utf-8"))
+    digest.update(json.dumps(asdict(config), sort_keys=True).encode("utf-8"))
+    digest.update(np.ascontiguousarray(series.to_numpy(dtype=float)).tobytes())
+    digest.update(pd.DatetimeIndex(series.index).as_unit("ns").asi8.tobytes())
+    return digest.hexdigest()
+
+
+def _entry_path(root: str, key: str) -> str:
+    return os.path.join(root, key[:2], f"{key}.json")
+
+
+def load_fit(key: str, root: Optional[str] = None) -> Optional[EtsState]:
+    root = FIT_CACHE_DIR if root is None else root
+    if not root:
+        return None
+    path = _entry_path(root, key)
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            payload = json.load(handle)
+        return EtsState(
+            level=float(payload["level"]),
+            trend=float(payload["trend"]),
+            params={name: float(value) for name, value in payload["params"].items()},
+        )
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError, AttributeError) as exc:
+        # A cache problem is a miss: the caller refits, so results never depend on the cache.
+        logger.warning("Ignoring unreadable ETS fit cache entry %s: %s", path, exc)
+        return None
+
+
+def save_fit(key: str, state: EtsState, root: Optional[str] = None) -> None:
+    root = FIT_CACHE_DIR if root is None else root
+    if not root:
+        return
+    path = _entry_path(root, key)
+    directory = os.path.dirname(path)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".fit-", suffix=".tmp")
+    except OSError as exc:
+        logger.warning("Could not write ETS fit cache entry %s: %s", path, exc)
+        return
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(asdict(state), handle, sort_keys=True)
+        os.replace(tmp_path, path)
+    except (OSError, ValueError) as exc:
+        logger.warning("Could not write ETS fit cache entry %s: %s", path, exc)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
@@ -10,13 +10,18 @@ from urllib.parse import urlparse
 
 from config import load_config
 from demo.refresh import refresh_from_sac
-from pipeline.cache import CacheError, load_cache
+from pipeline.artifacts import cached_rows
+from pipeline.cache import CacheError, frame_to_rows, load_cache, load_cache_slice
 from pipeline.forecast_runner import run_forecast
 from pipeline.scenario_runner import run_scenarios
+from pipeline.sqlite_store import default_store, string_rows
 from scenarios.presets_v2 import PRESETS_V2
 
 
 DEFAULT_CACHE_PATH = "data/cache/sac_export.csv"
+DEFAULT_META_PATH = "data/cache/meta.json"
+FORECAST_PATH = "data/cache/forecast.csv"
+SCENARIOS_PATH = "data/cache/scenarios.csv"
 
 
 def _parse_iso_date(value: str) -> date:
@@ -69,17 +74,34 @@ def get_timeseries(
     start: Optional[str] = None,
     end: Optional[str] = None,
     cache_path: str = DEFAULT_CACHE_PATH,
+    filters: Optional[Dict[str, str]] = None,
+    aggregate: Optional[str] = None,
+    meta_path: str = DEFAULT_META_PATH,
 ) -> Dict[str, Any]:
     if not from_cache:
         refresh_from_sac(cache_path)
-    rows, meta = load_cache(data_path=cache_path)
-    filtered = _filter_rows(rows, start, end)
-    return {"rows": filtered, "meta": asdict(meta)}
+    start_date = _parse_iso_date(start) if start else None
+    end_date = _parse_iso_date(end) if end else None
+    if start_date and end_date and start_date > end_date:
+        raise ValueError("start must be <= end")
+    store = default_store()
+    if store is not None:
+        table = store.sync_series(cache_path, meta_path)
+        # Rows and meta come from the same table version even if a sync rebuilds it meanwhile.
+        with store.read_snapshot():
+            rows = store.query(table, start=start, end=end, filters=filters, aggregate=aggregate)
+            meta = store.series_meta(cache_path)
+        return {"rows": string_rows(rows), "meta": asdict(meta)}
+    if filters or aggregate:
+        raise ValueError("filters and aggregate require the SQLite store (CACHE_SQLITE_PATH).")
+    # Range reads binary-search a date index (memory-mapped Arrow or a cached sorted frame).
+    frame, meta = load_cache_slice(
+        data_path=cache_path, meta_path=meta_path, start=start, end=end
+    )
+    return {"rows": frame_to_rows(frame), "meta": asdict(meta)}
 
 
-def _load_csv(path: str) -> List[Dict[str, str]]:
-    if not os.path.exists(path):
-        raise CacheError("Cache is missing or corrupt. Delete data/cache and rerun refresh.")
+def _read_csv_rows(path: str) -> List[Dict[str, str]]:
     with open(path, "r", encoding="utf-8", newline="") as handle:
         reader = csv.DictReader(handle)
         rows = [dict(row) for row in reader]
@@ -88,21 +110,44 @@ def _load_csv(path: str) -> List[Dict[str, str]]:
     return rows
 
 
-def get_forecast(from_cache: bool = True) -> Dict[str, Any]:
+def _load_csv(path: str) -> List[Dict[str, str]]:
+    if not os.path.exists(path):
+        raise CacheError("Cache is missing or corrupt. Delete data/cache and rerun refresh.")
+    return cached_rows("mcp_csv", [path], lambda: _read_csv_rows(path))
+
+
+def get_forecast(
+    from_cache: bool = True, start: Optional[str] = None, end: Optional[str] = None
+) -> Dict[str, Any]:
     if not from_cache:
         run_forecast()
-    rows = _load_csv("data/cache/forecast.csv")
+    store = default_store()
+    if store is not None:
+        store.sync_csv("forecast", FORECAST_PATH, indexes=[["date"]])
+        return {"rows": string_rows(store.query("forecast", start=start, end=end, by_date=False))}
+    rows = _filter_rows(_load_csv(FORECAST_PATH), start, end)
     return {"rows": rows}
 
 
-def get_scenarios(from_cache: bool = True, scenario: Optional[str] = None) -> Dict[str, Any]:
+def get_scenarios(
+    from_cache: bool = True,
+    scenario: Optional[str] = None,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+) -> Dict[str, Any]:
     if not from_cache:
         run_scenarios()
-    rows = _load_csv("data/cache/scenarios.csv")
+    if scenario and scenario not in PRESETS_V2:
+        valid = sorted(PRESETS_V2.keys())
+        raise ValueError(f"Unknown scenario '{scenario}'. Valid: {', '.join(valid)}")
+    store = default_store()
+    if store is not None:
+        store.sync_csv("scenarios", SCENARIOS_PATH, indexes=[["scenario", "date"], ["date"]])
+        filters = {"scenario": scenario} if scenario else None
+        rows = store.query("scenarios", start=start, end=end, filters=filters, by_date=False)
+        return {"rows": string_rows(rows)}
+    rows = _filter_rows(_load_csv(SCENARIOS_PATH), start, end)
     if scenario:
-        if scenario not in PRESETS_V2:
-            valid = sorted(PRESETS_V2.keys())
-            raise ValueError(f"Unknown scenario '{scenario}'. Valid: {', '.join(valid)}")
         rows = [row for row in rows if row.get("scenario") == scenario]
     return {"rows": rows}
 
@@ -122,6 +167,8 @@ def _tool_list() -> Dict[str, Any]:
                     "from_cache": "bool (default true)",
                     "start": "YYYY-MM-DD (optional)",
                     "end": "YYYY-MM-DD (optional)",
+                    "filters": "object of dim_* column -> member (optional)",
+                    "aggregate": "sum|mean|min|max of value per date (optional)",
                 },
             },
             {
@@ -129,6 +176,8 @@ def _tool_list() -> Dict[str, Any]:
                 "description": "Return baseline forecast from cache (or refresh on demand).",
                 "input_schema": {
                     "from_cache": "bool (default true)",
+                    "start": "YYYY-MM-DD (optional)",
+                    "end": "YYYY-MM-DD (optional)",
                 },
             },
             {
@@ -137,6 +186,8 @@ def _tool_list() -> Dict[str, Any]:
                 "input_schema": {
                     "from_cache": "bool (default true)",
                     "scenario": "string (optional)",
+                    "start": "YYYY-MM-DD (optional)",
+                    "end": "YYYY-MM-DD (optional)",
                 },
             },
         ]
@@ -180,18 +231,34 @@ class MCPHandler(BaseHTTPRequestHandler):
                 from_cache = bool(payload.get("from_cache", True))
                 start = payload.get("start")
                 end = payload.get("end")
-                result = get_timeseries(from_cache=from_cache, start=start, end=end)
+                filters = payload.get("filters")
+                if filters is not None and not isinstance(filters, dict):
+                    raise ValueError("filters must be an object")
+                result = get_timeseries(
+                    from_cache=from_cache,
+                    start=start,
+                    end=end,
+                    filters=filters,
+                    aggregate=payload.get("aggregate"),
+                )
                 self._send_json(200, result)
                 return
             if path == "/get_forecast":
                 from_cache = bool(payload.get("from_cache", True))
-                result = get_forecast(from_cache=from_cache)
+                result = get_forecast(
+                    from_cache=from_cache, start=payload.get("start"), end=payload.get("end")
+                )
                 self._send_json(200, result)
                 return
             if path == "/get_scenarios":
                 from_cache = bool(payload.get("from_cache", True))
                 scenario = payload.get("scenario")
-                result = get_scenarios(from_cache=from_cache, scenario=scenario)
+                result = get_scenarios(
+                    from_cache=from_cache,
+                    scenario=scenario,
+                    start=payload.get("start"),
+                    end=payload.get("end"),
+                )
                 self._send_json(200, result)
                 return
             if path == "/tools":
@@ -1,3 +1,21 @@
-from pipeline.cache import CacheError, CacheMeta, build_meta, load_cache, save_cache
+from pipeline.cache import (
+    CacheError,
+    CacheMeta,
+    build_meta,
+    list_snapshots,
+    load_cache,
+    load_cache_frame,
+    rollback_cache,
+    save_cache,
+)
 
-__all__ = ["CacheError", "CacheMeta", "build_meta", "load_cache", "save_cache"]
+__all__ = [
+    "CacheError",
+    "CacheMeta",
+    "build_meta",
+    "list_snapshots",
+    "load_cache",
+    "load_cache_frame",
+    "rollback_cache",
+    "save_cache",
+]
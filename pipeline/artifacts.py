@@ -0,0 +1,138 @@
+import os
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import fields, is_dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+import numpy as np
+import pandas as pd
+
+
+T = TypeVar("T")
+
+DEFAULT_MAX_BYTES = int(float(os.getenv("ARTIFACT_CACHE_MAX_MB", "256")) * 1024 * 1024)
+
+Signature = Tuple[Tuple[str, int, int], ...]
+
+
+def _signature(paths: Sequence[str]) -> Optional[Signature]:
+    parts = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        parts.append((path, stat.st_mtime_ns, stat.st_size))
+    return tuple(parts)
+
+
+def _estimate_bytes(value: object) -> int:
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, tuple):
+        return sum(_estimate_bytes(item) for item in value)
+    if is_dataclass(value) and not isinstance(value, type):
+        # Composite artifacts (e.g. the cache date index) are sized by their frames/arrays.
+        return sum(_estimate_bytes(getattr(value, field.name)) for field in fields(value))
+    if isinstance(value, list):
+        # Rows are small dicts of short strings; sample instead of walking every value.
+        sample = value[:100]
+        per_item = sum(sys.getsizeof(item) for item in sample) / max(1, len(sample))
+        return sys.getsizeof(value) + int(per_item * len(value) * 2)
+    return sys.getsizeof(value)
+
+
+class ArtifactCache:
+    """LRU of parsed artifacts keyed by file path, revalidated by (mtime, size).
+
+    Entries are dropped when any source file changes or disappears, and evicted least
+    recently used first once the estimated footprint exceeds max_bytes.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, Tuple[str, ...]], Tuple[Signature, object, int]]" = (
+            OrderedDict()
+        )
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _drop(self, key: Tuple[str, Tuple[str, ...]]) -> None:
+        _, _, size = self._entries.pop(key)
+        self._bytes -= size
+
+    def get(self, kind: str, paths: Sequence[str], loader: Callable[[], T]) -> T:
+        abs_paths = tuple(os.path.abspath(path) for path in paths)
+        key = (kind, abs_paths)
+        signature = _signature(abs_paths)
+        if signature is None:
+            with self._lock:
+                if key in self._entries:
+                    self._drop(key)
+            return loader()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == signature:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]  # type: ignore[return-value]
+            self.misses += 1
+
+        value = loader()
+        size = _estimate_bytes(value)
+        # Only keep the value if the files did not change while it was being loaded.
+        if size > self.max_bytes or _signature(abs_paths) != signature:
+            return value
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (signature, value, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes and self._entries:
+                self._drop(next(iter(self._entries)))
+        return value
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                self._bytes = 0
+                return
+            target = os.path.abspath(path)
+            for key in [key for key in self._entries if target in key[1]]:
+                self._drop(key)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+
+_ARTIFACTS = ArtifactCache()
+
+
+def get_artifact_cache() -> ArtifactCache:
+    return _ARTIFACTS
+
+
+def cached_frame(
+    kind: str, paths: Sequence[str], loader: Callable[[], pd.DataFrame]
+) -> pd.DataFrame:
+    """Memoized DataFrame load; callers get a copy so the cached frame is never mutated."""
+    return _ARTIFACTS.get(kind, paths, loader).copy()
+
+
+def cached_rows(
+    kind: str, paths: Sequence[str], loader: Callable[[], List[Dict[str, str]]]
+) -> List[Dict[str, str]]:
+    """Memoized row-list load; each row is copied so callers may edit their result."""
+    return [dict(row) for row in _ARTIFACTS.get(kind, paths, loader)]
+
+
+def invalidate_artifact(path: Optional[str] = None) -> None:
+    _ARTIFACTS.invalidate(path)
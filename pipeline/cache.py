@@ -1,15 +1,51 @@
 import csv
+import hashlib
 import json
+import logging
 import os
+import shutil
+import tempfile
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from pipeline.artifacts import cached_frame, cached_rows, get_artifact_cache, invalidate_artifact
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:  # pragma: no cover - optional dependency
+    HAS_PYARROW = False
+
+logger = logging.getLogger(__name__)
+
+# Storage format for series caches: csv (default), parquet or arrow (Arrow IPC / Feather v2).
+CACHE_FORMAT = os.getenv("CACHE_FORMAT", "csv").strip().lower() or "csv"
+_FORMAT_SUFFIXES = {"csv": ".csv", "parquet": ".parquet", "arrow": ".arrow"}
+_CORRUPT = "Cache is missing or corrupt. Delete data/cache and rerun refresh."
+# Data generations kept beside the live cache so readers pinned to an older meta.json can finish.
+CACHE_KEEP_GENERATIONS = int(os.getenv("CACHE_KEEP_GENERATIONS", "3"))
+GENERATIONS_DIR = "generations"
+
+# mkstemp creates 0600 files; committed cache files get the mode open() would give them.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_FILE_MODE = 0o666 & ~_UMASK
 
 
 class CacheError(Exception):
     pass
 
 
+# Cache payloads: row dicts, a DataFrame, or equal-length column arrays keyed by name.
+CacheData = Union[List[Dict], pd.DataFrame, Mapping[str, Sequence]]
+
+
 @dataclass(frozen=True)
 class CacheMeta:
     last_refresh_time: str
@@ -17,94 +53,599 @@ class CacheMeta:
     row_count: int
     min_date: str
     max_date: str
+    # sha256 of the committed data file; empty for caches written before snapshots.
+    content_hash: str = ""
+
+
+def _fsync_dir(directory: str) -> None:
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:  # pragma: no cover - platforms without directory handles
+        return
+    try:
+        os.fsync(fd)
+    except OSError:  # pragma: no cover - filesystems that reject directory fsync
+        pass
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def _staged(directory: str, prefix: str) -> Iterator[str]:
+    # Temp file beside the destination (same filesystem, so the final rename is atomic).
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=prefix, suffix=".tmp")
+    os.close(fd)
+    try:
+        yield tmp_path
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _commit(tmp_path: str, path: str) -> None:
+    with open(tmp_path, "rb+") as handle:
+        os.fsync(handle.fileno())
+    os.chmod(tmp_path, _FILE_MODE)
+    os.replace(tmp_path, path)
+    _fsync_dir(os.path.dirname(path) or ".")
+
+
+@contextmanager
+def atomic_output(path: str) -> Iterator[str]:
+    """Yield a temp path beside `path`; on success it is fsynced and renamed over `path`.
+
+    Readers see either the previous file or the complete new one, never a partial write.
+    """
+    with _staged(os.path.dirname(path) or ".", os.path.basename(path) + ".") as tmp_path:
+        yield tmp_path
+        _commit(tmp_path, path)
+
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
 
 
 def _read_csv(path: str) -> List[Dict[str, str]]:
     if not os.path.exists(path):
-        raise CacheError("Cache is missing or corrupt. Delete data/cache and rerun refresh.")
+        raise CacheError(_CORRUPT)
     with open(path, "r", encoding="utf-8") as handle:
         reader = csv.DictReader(handle)
         rows = [dict(row) for row in reader]
     if not rows:
-        raise CacheError("Cache is missing or corrupt. Delete data/cache and rerun refresh.")
+        raise CacheError(_CORRUPT)
     return rows
 
 
 def _write_csv(path: str, rows: List[Dict]) -> None:
     if not rows:
         raise CacheError("Cache save failed: no rows to write.")
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    columns = list(rows[0].keys())
-    for row in rows:
-        if list(row.keys()) != columns:
-            raise CacheError("Cache save failed: rows must share the same schema.")
+    columns = rows[0].keys()
+    # Key views compare as sets without allocating; DictWriter orders fields by the header.
+    if any(row.keys() != columns for row in rows):
+        raise CacheError("Cache save failed: rows must share the same schema.")
     with open(path, "w", encoding="utf-8", newline="") as handle:
-        writer = csv.DictWriter(handle, fieldnames=columns)
+        writer = csv.DictWriter(handle, fieldnames=list(columns))
         writer.writeheader()
         writer.writerows(rows)
 
 
+def _as_frame(data: CacheData) -> pd.DataFrame:
+    """Bulk payloads as a DataFrame; the schema is checked once for the whole batch."""
+    if isinstance(data, pd.DataFrame):
+        frame = data
+    else:
+        try:
+            frame = pd.DataFrame(dict(data))
+        except ValueError as exc:
+            raise CacheError("Cache save failed: columns must have the same length.") from exc
+    if frame.empty:
+        raise CacheError("Cache save failed: no rows to write.")
+    if frame.columns.has_duplicates:
+        raise CacheError("Cache save failed: duplicate column names.")
+    return frame
+
+
+def _write_frame_csv(path: str, frame: pd.DataFrame) -> None:
+    # Same dialect as csv.DictWriter; missing values are written as empty fields.
+    frame.to_csv(path, index=False, date_format="%Y-%m-%d", lineterminator="\r\n")
+
+
+def _resolve_format(fmt: Optional[str]) -> str:
+    fmt = (fmt or CACHE_FORMAT).strip().lower()
+    if fmt not in _FORMAT_SUFFIXES:
+        allowed = ", ".join(sorted(_FORMAT_SUFFIXES))
+        raise CacheError(f"Unsupported CACHE_FORMAT '{fmt}'. Allowed: {allowed}.")
+    if fmt != "csv" and not HAS_PYARROW:
+        logger.warning("CACHE_FORMAT=%s requires pyarrow; falling back to csv.", fmt)
+        return "csv"
+    return fmt
+
+
+def data_file_path(data_path: str, fmt: str) -> str:
+    """Path of the data file for `fmt`; the CSV-style data_path keeps its stem."""
+    root, _ = os.path.splitext(data_path)
+    return root + _FORMAT_SUFFIXES[fmt]
+
+
+def _rows_to_frame(rows: List[Dict]) -> pd.DataFrame:
+    return _typed_frame(pd.DataFrame(rows))
+
+
+def _typed_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    frame = frame.copy(deep=False)
+    if "date" in frame.columns and not pd.api.types.is_datetime64_any_dtype(frame["date"]):
+        frame["date"] = pd.to_datetime(frame["date"], format="%Y-%m-%d")
+    if "value" in frame.columns:
+        frame["value"] = pd.to_numeric(frame["value"]).astype(float)
+    return frame
+
+
+def frame_to_rows(frame: pd.DataFrame) -> List[Dict[str, str]]:
+    # String rows for callers of load_cache. Values are rendered from the typed columns, so
+    # floats always carry a decimal ("100.0", as save_cache writes them) even when a CSV
+    # edited by hand holds "100".
+    out = frame.copy()
+    for column in out.columns:
+        if pd.api.types.is_datetime64_any_dtype(out[column]):
+            out[column] = out[column].dt.strftime("%Y-%m-%d")
+        out[column] = out[column].map(lambda v: "" if pd.isna(v) else str(v))
+    return out.to_dict(orient="records")
+
+
+def _write_columnar(path: str, data: CacheData, fmt: str) -> None:
+    if isinstance(data, list):
+        if not data:
+            raise CacheError("Cache save failed: no rows to write.")
+        frame = _rows_to_frame(data)
+    else:
+        frame = _typed_frame(_as_frame(data))
+    if fmt == "parquet":
+        frame.to_parquet(path, index=False)
+    else:
+        # Uncompressed IPC buffers can be memory-mapped and sliced without copying.
+        frame.to_feather(path, compression="uncompressed")
+
+
+def _read_columnar(path: str, fmt: str) -> pd.DataFrame:
+    try:
+        if fmt == "parquet":
+            frame = pd.read_parquet(path)
+        else:
+            frame = pd.read_feather(path)
+    except (OSError, ValueError) as exc:
+        raise CacheError(_CORRUPT) from exc
+    if frame.empty:
+        raise CacheError(_CORRUPT)
+    return frame
+
+
+def _read_csv_frame(path: str) -> pd.DataFrame:
+    try:
+        frame = pd.read_csv(path, dtype=str, keep_default_na=False)
+    except (OSError, pd.errors.ParserError, pd.errors.EmptyDataError) as exc:
+        raise CacheError(_CORRUPT) from exc
+    if frame.empty:
+        raise CacheError(_CORRUPT)
+    try:
+        if "date" in frame.columns:
+            frame["date"] = pd.to_datetime(frame["date"], format="%Y-%m-%d")
+        if "value" in frame.columns:
+            frame["value"] = pd.to_numeric(frame["value"]).astype(float)
+    except (TypeError, ValueError) as exc:
+        raise CacheError(_CORRUPT) from exc
+    return frame
+
+
+def _load_frame(path: str, fmt: str) -> pd.DataFrame:
+    # Parsed frames are memoized per (path, mtime, size); see pipeline.artifacts.
+    if fmt == "csv":
+        return cached_frame("cache_frame", [path], lambda: _read_csv_frame(path))
+    return cached_frame("cache_frame", [path], lambda: _read_columnar(path, fmt))
+
+
+def cache_data_exists(data_path: str) -> bool:
+    """True when a data file exists for data_path in any supported format."""
+    if os.path.exists(data_path):
+        return True
+    return any(os.path.exists(data_file_path(data_path, fmt)) for fmt in _FORMAT_SUFFIXES)
+
+
+def generation_path(target: str, generation: str) -> str:
+    """Immutable snapshot of the data file `target` for `generation`."""
+    directory, name = os.path.split(target)
+    stem, ext = os.path.splitext(name)
+    return os.path.join(directory, GENERATIONS_DIR, f"{stem}.{generation}{ext}")
+
+
+def _snapshot_meta_path(target: str, generation: str) -> str:
+    return os.path.splitext(generation_path(target, generation))[0] + ".meta.json"
+
+
+def _locate_data(data_path: str, meta_raw: Dict[str, object]) -> Tuple[str, str]:
+    stored = str(meta_raw.get("data_format", "csv"))
+    candidates = [stored] + [fmt for fmt in _FORMAT_SUFFIXES if fmt != stored]
+    for fmt in candidates:
+        if fmt not in _FORMAT_SUFFIXES:
+            continue
+        path = data_path if fmt == "csv" else data_file_path(data_path, fmt)
+        if os.path.exists(path) and (fmt == "csv" or HAS_PYARROW):
+            return path, fmt
+    raise CacheError(_CORRUPT)
+
+
+def load_pinned_data(data_path: str, meta_path: str) -> Tuple[Dict[str, object], str, str]:
+    """Meta plus the data file of the same generation.
+
+    A refresh may replace the live files between reading meta.json and opening the data, so
+    readers open the generation named in meta.json. If that generation was pruned in the
+    meantime, meta.json is re-read once; caches written before generations fall back to
+    the live data file.
+    """
+    for attempt in range(2):
+        meta_raw = load_cache_meta_raw(meta_path)
+        generation = meta_raw.get("generation")
+        fmt = str(meta_raw.get("data_format", "csv"))
+        if not generation or fmt not in _FORMAT_SUFFIXES:
+            break
+        target = data_path if fmt == "csv" else data_file_path(data_path, fmt)
+        pinned = generation_path(target, str(generation))
+        if os.path.exists(pinned) and (fmt == "csv" or HAS_PYARROW):
+            return meta_raw, pinned, fmt
+        if not os.path.exists(target) or attempt:
+            # meta.json belongs to another data file (shared meta) or the pin is gone.
+            break
+    path, fmt = _locate_data(data_path, meta_raw)
+    # The hash in meta.json only describes the data when it came from the pinned snapshot.
+    meta_raw = {key: value for key, value in meta_raw.items() if key != "content_hash"}
+    return meta_raw, path, fmt
+
+
+def _write_snapshot(target: str, rows: CacheData, fmt: str) -> str:
+    """Write rows as an immutable snapshot named after its content; returns the sha256."""
+    directory = os.path.dirname(generation_path(target, "x"))
+    stem = os.path.splitext(os.path.basename(target))[0]
+    with _staged(directory, stem + ".") as tmp_path:
+        if fmt == "csv" and isinstance(rows, list):
+            _write_csv(tmp_path, rows)
+        elif fmt == "csv":
+            _write_frame_csv(tmp_path, _as_frame(rows))
+        else:
+            _write_columnar(tmp_path, rows, fmt)
+        content_hash = file_sha256(tmp_path)
+        _commit(tmp_path, generation_path(target, content_hash[:16]))
+    return content_hash
+
+
+def _is_generation(value: str) -> bool:
+    return bool(value) and all(char in "0123456789abcdef" for char in value)
+
+
+def _publish(source: str, target: str) -> None:
+    # Hard-link the finished generation over the live path (copy where links are unsupported).
+    with atomic_output(target) as tmp_path:
+        os.remove(tmp_path)
+        try:
+            os.link(source, tmp_path)
+        except OSError:
+            shutil.copyfile(source, tmp_path)
+
+
+def _snapshot_paths(target: str) -> List[str]:
+    """Snapshot data files for `target`, newest first."""
+    directory = os.path.dirname(generation_path(target, "x"))
+    stem, ext = os.path.splitext(os.path.basename(target))
+    prefix = stem + "."
+    try:
+        names = [
+            name
+            for name in os.listdir(directory)
+            if name.startswith(prefix)
+            and name.endswith(ext)
+            and _is_generation(name[len(prefix) : len(name) - len(ext)])
+        ]
+    except FileNotFoundError:
+        return []
+    return sorted(
+        (os.path.join(directory, name) for name in names),
+        key=lambda path: os.stat(path).st_mtime_ns,
+        reverse=True,
+    )
+
+
+def _prune_generations(target: str, keep: int, current: str) -> None:
+    # Retention: the current snapshot plus the newest keep - 1 others.
+    current_path = generation_path(target, current)
+    older = [path for path in _snapshot_paths(target) if path != current_path]
+    for path in older[max(0, keep - 1) :]:
+        try:
+            os.remove(path)
+            os.remove(os.path.splitext(path)[0] + ".meta.json")
+        except FileNotFoundError:
+            pass
+        except OSError:
+            logger.warning("Could not prune cache snapshot %s", path)
+
+
+def meta_from_dict(meta_raw: Dict[str, object]) -> CacheMeta:
+    """CacheMeta from a raw meta.json payload; missing required fields raise CacheError."""
+    required = {"last_refresh_time", "source", "row_count", "min_date", "max_date"}
+    if not required.issubset(meta_raw):
+        raise CacheError(_CORRUPT)
+    return CacheMeta(
+        last_refresh_time=str(meta_raw["last_refresh_time"]),
+        source=str(meta_raw["source"]),
+        row_count=int(meta_raw["row_count"]),
+        min_date=str(meta_raw["min_date"]),
+        max_date=str(meta_raw["max_date"]),
+        content_hash=str(meta_raw.get("content_hash", "")),
+    )
+
+
 def save_cache(
-    rows: List[Dict],
+    rows: CacheData,
     meta: CacheMeta,
     data_path: str = "data/cache/data.csv",
     meta_path: str = "data/cache/meta.json",
     extra_meta: Optional[Dict] = None,
-) -> None:
-    _write_csv(data_path, rows)
-    os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+    fmt: Optional[str] = None,
+) -> CacheMeta:
+    """Write rows as a new snapshot and make it current; returns meta with its content_hash.
+
+    `rows` may also be a DataFrame or a mapping of column arrays, which are written in bulk.
+    """
+    fmt = _resolve_format(fmt)
+    if not isinstance(rows, (list, pd.DataFrame)):
+        # Convert a column mapping once; the writer and the sort check share the frame.
+        rows = _as_frame(rows)
+    target = data_path if fmt == "csv" else data_file_path(data_path, fmt)
+    content_hash = _write_snapshot(target, rows, fmt)
+    generation = content_hash[:16]
+
     payload = meta.__dict__.copy()
     if extra_meta:
         payload.update(extra_meta)
-    with open(meta_path, "w", encoding="utf-8") as handle:
-        json.dump(payload, handle, indent=2, sort_keys=True)
+    payload["data_format"] = fmt
+    payload["date_sorted"] = _is_date_sorted(rows)
+    payload["generation"] = generation
+    payload["content_hash"] = content_hash
+    with atomic_output(_snapshot_meta_path(target, generation)) as tmp_path:
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, indent=2, sort_keys=True)
+    _activate(target, generation, payload, meta_path)
+    _prune_generations(target, CACHE_KEEP_GENERATIONS, generation)
+    return meta_from_dict(payload)
+
+
+def _activate(target: str, generation: str, payload: Dict[str, object], meta_path: str) -> None:
+    _publish(generation_path(target, generation), target)
+    invalidate_artifact(target)
+    # Renaming meta.json is the commit point: pinned readers switch snapshot here.
+    with atomic_output(meta_path) as tmp_path:
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, indent=2, sort_keys=True)
+
+
+def list_snapshots(
+    data_path: str = "data/cache/data.csv", fmt: Optional[str] = None
+) -> List[Dict[str, object]]:
+    """Meta of the retained snapshots for data_path, newest first."""
+    fmt = _resolve_format(fmt)
+    target = data_path if fmt == "csv" else data_file_path(data_path, fmt)
+    snapshots = []
+    for path in _snapshot_paths(target):
+        try:
+            with open(os.path.splitext(path)[0] + ".meta.json", "r", encoding="utf-8") as handle:
+                snapshots.append(json.load(handle))
+        except (OSError, json.JSONDecodeError):
+            continue
+    return snapshots
+
+
+def rollback_cache(
+    generation: str,
+    data_path: str = "data/cache/data.csv",
+    meta_path: str = "data/cache/meta.json",
+    fmt: Optional[str] = None,
+) -> CacheMeta:
+    """Make a retained snapshot current again without re-pulling from SAC."""
+    fmt = _resolve_format(fmt)
+    target = data_path if fmt == "csv" else data_file_path(data_path, fmt)
+    snapshot_meta = _snapshot_meta_path(target, generation)
+    if not os.path.exists(generation_path(target, generation)) or not os.path.exists(
+        snapshot_meta
+    ):
+        raise CacheError(f"Cache snapshot not found: {generation}")
+    with open(snapshot_meta, "r", encoding="utf-8") as handle:
+        payload = json.load(handle)
+    _activate(target, generation, payload, meta_path)
+    return meta_from_dict(payload)
 
 
 def load_cache(
     data_path: str = "data/cache/data.csv",
     meta_path: str = "data/cache/meta.json",
 ) -> Tuple[List[Dict[str, str]], CacheMeta]:
-    rows = _read_csv(data_path)
-    if not os.path.exists(meta_path):
-        raise CacheError("Cache is missing or corrupt. Delete data/cache and rerun refresh.")
-    try:
-        with open(meta_path, "r", encoding="utf-8") as handle:
-            meta_raw = json.load(handle)
-    except json.JSONDecodeError as exc:
-        raise CacheError("Cache is missing or corrupt. Delete data/cache and rerun refresh.") from exc
+    meta_raw, path, fmt = load_pinned_data(data_path, meta_path)
+    if fmt == "csv":
+        rows = cached_rows("cache_rows", [path], lambda: _read_csv(path))
+    else:
+        rows = cached_rows("cache_rows", [path], lambda: frame_to_rows(_read_columnar(path, fmt)))
+    return rows, meta_from_dict(meta_raw)
 
-    required = {"last_refresh_time", "source", "row_count", "min_date", "max_date"}
-    if not required.issubset(meta_raw):
-        raise CacheError("Cache is missing or corrupt. Delete data/cache and rerun refresh.")
 
-    return rows, CacheMeta(
-        last_refresh_time=str(meta_raw["last_refresh_time"]),
-        source=str(meta_raw["source"]),
-        row_count=int(meta_raw["row_count"]),
-        min_date=str(meta_raw["min_date"]),
-        max_date=str(meta_raw["max_date"]),
-    )
+def load_cache_frame(
+    data_path: str = "data/cache/data.csv",
+    meta_path: str = "data/cache/meta.json",
+) -> Tuple[pd.DataFrame, CacheMeta]:
+    """Typed variant of load_cache: `date` as datetime64 and `value` as float64.
+
+    Parquet/Arrow caches are returned as stored, without any parsing.
+    """
+    meta_raw, path, fmt = load_pinned_data(data_path, meta_path)
+    frame = _load_frame(path, fmt)
+    return frame, meta_from_dict(meta_raw)
 
 
 def load_cache_meta_raw(meta_path: str = "data/cache/meta.json") -> Dict[str, object]:
     if not os.path.exists(meta_path):
-        raise CacheError("Cache is missing or corrupt. Delete data/cache and rerun refresh.")
+        raise CacheError(_CORRUPT)
     try:
         with open(meta_path, "r", encoding="utf-8") as handle:
             meta_raw = json.load(handle)
     except json.JSONDecodeError as exc:
-        raise CacheError("Cache is missing or corrupt. Delete data/cache and rerun refresh.") from exc
+        raise CacheError(_CORRUPT) from exc
+    if not isinstance(meta_raw, dict):
+        raise CacheError(_CORRUPT)
     return meta_raw
 
 
-def build_meta(rows: List[Dict], source: str) -> CacheMeta:
-    dates = [row.get("date", "") for row in rows if row.get("date")]
-    if not dates:
+def load_pinned_meta(
+    data_path: str = "data/cache/data.csv", meta_path: str = "data/cache/meta.json"
+) -> CacheMeta:
+    """Meta of the data snapshot a load would read, without loading the data."""
+    meta_raw, _, _ = load_pinned_data(data_path, meta_path)
+    return meta_from_dict(meta_raw)
+
+
+def load_run_meta(meta_path: str) -> Dict[str, object]:
+    """Meta written by a previous runner; empty when missing or unreadable."""
+    try:
+        with open(meta_path, "r", encoding="utf-8") as handle:
+            previous: Optional[object] = json.load(handle)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return previous if isinstance(previous, dict) else {}
+
+
+def _read_arrow_table(path: str) -> "pa.Table":
+    try:
+        source = pa.memory_map(path, "r")
+        return pa.ipc.open_file(source).read_all()
+    except (OSError, pa.ArrowInvalid) as exc:
+        raise CacheError(_CORRUPT) from exc
+
+
+def _bound(value: Optional[str], name: str) -> Optional[pd.Timestamp]:
+    if not value:
+        return None
+    try:
+        return pd.Timestamp(value)
+    except ValueError as exc:
+        raise CacheError(f"Invalid {name} date: {value}") from exc
+
+
+def load_cache_slice(
+    data_path: str = "data/cache/data.csv",
+    meta_path: str = "data/cache/meta.json",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+) -> Tuple[pd.DataFrame, CacheMeta]:
+    """Typed rows with start <= date <= end (inclusive, ISO dates; either bound optional).
+
+    Arrow caches are memory-mapped: processes share the OS page cache and only the
+    selected date range is materialized. Other formats keep a date-sorted copy in the
+    artifact cache, so repeated queries are a binary search plus a slice.
+    """
+    start_ts, end_ts = _bound(start, "start"), _bound(end, "end")
+    meta_raw, path, fmt = load_pinned_data(data_path, meta_path)
+    meta = meta_from_dict(meta_raw)
+
+    if fmt == "arrow":
+        table = _read_arrow_table(path)
+        if table.num_rows == 0:
+            raise CacheError(_CORRUPT)
+        dates = table.column("date").to_numpy()
+        # meta.json records whether the writer saw sorted dates; older caches are checked here.
+        if meta_raw.get("date_sorted") or (dates[1:] >= dates[:-1]).all():
+            lo, hi = _date_range(dates, start_ts, end_ts)
+            return table.slice(lo, hi - lo).to_pandas(), meta
+
+    index = _date_index(path, fmt)
+    lo, hi = _date_range(index.dates, start_ts, end_ts)
+    return index.frame.iloc[lo:hi].reset_index(drop=True).copy(), meta
+
+
+@dataclass(frozen=True)
+class _DateIndex:
+    frame: pd.DataFrame
+    dates: np.ndarray
+
+
+def _date_index(path: str, fmt: str) -> _DateIndex:
+    """Rows stably sorted by date plus their datetime64 keys, built once per file version."""
+
+    def build() -> _DateIndex:
+        if fmt == "arrow":
+            frame = _read_arrow_table(path).to_pandas()
+        elif fmt == "csv":
+            frame = _read_csv_frame(path)
+        else:
+            frame = _read_columnar(path, fmt)
+        if not frame["date"].is_monotonic_increasing:
+            frame = frame.sort_values("date", kind="mergesort").reset_index(drop=True)
+        return _DateIndex(frame=frame, dates=frame["date"].to_numpy())
+
+    return get_artifact_cache().get("cache_date_index", [path], build)
+
+
+def _date_range(
+    dates: np.ndarray, start_ts: Optional[pd.Timestamp], end_ts: Optional[pd.Timestamp]
+) -> Tuple[int, int]:
+    # Binary search over sorted datetime64 keys: O(log n) regardless of history length.
+    lo, hi = 0, len(dates)
+    if start_ts is not None:
+        lo = int(dates.searchsorted(start_ts.to_datetime64(), side="left"))
+    if end_ts is not None:
+        hi = int(dates.searchsorted(end_ts.to_datetime64(), side="right"))
+    return lo, max(lo, hi)
+
+
+def build_meta(rows: CacheData, source: str) -> CacheMeta:
+    if isinstance(rows, list):
+        dates = [row.get("date", "") for row in rows if row.get("date")]
+        row_count = len(rows)
+        min_date, max_date = (min(dates), max(dates)) if dates else ("", "")
+    elif isinstance(rows, pd.DataFrame):
+        row_count = len(rows)
+        min_date, max_date = _date_bounds(rows["date"] if "date" in rows.columns else None)
+    else:
+        # Column mappings are only read for their date column; save_cache builds the frame.
+        row_count = len(next(iter(rows.values()), ()))
+        min_date, max_date = _date_bounds(pd.Series(rows["date"]) if "date" in rows else None)
+    if not min_date:
         raise CacheError("Cache metadata failed: missing date values.")
     return CacheMeta(
         last_refresh_time=datetime.now(timezone.utc).isoformat(),
         source=source,
-        row_count=len(rows),
-        min_date=min(dates),
-        max_date=max(dates),
+        row_count=row_count,
+        min_date=min_date,
+        max_date=max_date,
     )
+
+
+def _is_date_sorted(rows: Union[List[Dict], pd.DataFrame]) -> bool:
+    if isinstance(rows, list):
+        dates = [row.get("date") or "" for row in rows]
+        return all(a <= b for a, b in zip(dates, dates[1:]))
+    return "date" in rows.columns and bool(rows["date"].is_monotonic_increasing)
+
+
+def _date_bounds(dates: Optional[pd.Series]) -> Tuple[str, str]:
+    if dates is None:
+        return "", ""
+    if pd.api.types.is_datetime64_any_dtype(dates):
+        dates = dates.dropna()
+        if dates.empty:
+            return "", ""
+        return dates.min().strftime("%Y-%m-%d"), dates.max().strftime("%Y-%m-%d")
+    dates = dates[dates.notna()].astype(str)
+    dates = dates[dates != ""]
+    if dates.empty:
+        return "", ""
+    return str(dates.min()), str(dates.max())
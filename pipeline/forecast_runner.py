@@ -1,12 +1,25 @@
+import hashlib
 import json
+import os
 from dataclasses import asdict
 from datetime import datetime, timezone
-from typing import Dict
+from typing import Dict, Optional
 
-import pandas as pd
+from forecast.baseline import BaselineConfig, Method, run_baseline
+from pipeline.artifacts import invalidate_artifact
+from pipeline.cache import (
+    CacheError,
+    atomic_output,
+    load_cache_frame,
+    load_pinned_meta,
+    load_run_meta,
+)
 
-from forecast.baseline import BaselineConfig, run_baseline
-from pipeline.cache import CacheError, load_cache
+
+def baseline_config_hash(config: BaselineConfig, method: Method = "auto") -> str:
+    """sha256 of the effective baseline settings (env-derived growth defaults included)."""
+    payload = json.dumps({"method": method, **asdict(config)}, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
 
 def run_forecast(
@@ -14,18 +27,46 @@ def run_forecast(
     output_path: str = "data/cache/forecast.csv",
     meta_path: str = "data/cache/forecast_meta.json",
     horizon_months: int = 120,
+    force: bool = False,
+    cache_meta_path: str = "data/cache/meta.json",
+    config: Optional[BaselineConfig] = None,
 ) -> Dict[str, str]:
+    config = config or BaselineConfig()
+    config_hash = baseline_config_hash(config)
     try:
-        rows, meta = load_cache(data_path=cache_path)
+        # meta.json alone (pinned to the data snapshot) decides whether the forecast is current.
+        content_hash = load_pinned_meta(cache_path, cache_meta_path).content_hash
     except CacheError as exc:
         raise CacheError("Run `python -m demo.refresh --source sac` first.") from exc
 
-    df = pd.DataFrame(rows)
+    previous = load_run_meta(meta_path)
+    if (
+        not force
+        and content_hash
+        and os.path.exists(output_path)
+        and previous.get("input_content_hash") == content_hash
+        and previous.get("horizon_months") == horizon_months
+        and previous.get("baseline_config_hash") == config_hash
+    ):
+        # Same input snapshot, horizon and baseline settings: the forecast is still current.
+        return {
+            "output_path": output_path,
+            "meta_path": meta_path,
+            "horizon_months": str(horizon_months),
+            "skipped": "true",
+        }
+
+    try:
+        df, meta = load_cache_frame(data_path=cache_path, meta_path=cache_meta_path)
+    except CacheError as exc:
+        raise CacheError("Run `python -m demo.refresh --source sac` first.") from exc
     if df.empty:
         raise CacheError("Series cache is empty. Run demo.refresh again.")
 
-    forecast_df = run_baseline(df, horizon_months=horizon_months, method="auto")
-    forecast_df.to_csv(output_path, index=False)
+    forecast_df = run_baseline(df, horizon_months=horizon_months, method="auto", config=config)
+    with atomic_output(output_path) as tmp_path:
+        forecast_df.to_csv(tmp_path, index=False)
+    invalidate_artifact(output_path)
 
     meta_out = {
         "generated_at": datetime.now(timezone.utc).isoformat(),
@@ -33,14 +74,20 @@ def run_forecast(
         "method_used": forecast_df["method"].iloc[0] if not forecast_df.empty else "unknown",
         "input_min_date": meta.min_date,
         "input_max_date": meta.max_date,
+        "input_content_hash": meta.content_hash,
+        "baseline_config": asdict(config),
+        "baseline_config_hash": config_hash,
         "output_min_date": forecast_df["date"].min(),
         "output_max_date": forecast_df["date"].max(),
     }
-    with open(meta_path, "w", encoding="utf-8") as handle:
-        json.dump(meta_out, handle, indent=2, sort_keys=True)
+    with atomic_output(meta_path) as tmp_path:
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump(meta_out, handle, indent=2, sort_keys=True)
 
     return {
         "output_path": output_path,
         "meta_path": meta_path,
         "horizon_months": str(horizon_months),
+        "skipped": "false",
     }
+
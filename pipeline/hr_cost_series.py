@@ -1,14 +1,34 @@
 import os
-from dataclasses import asdict, dataclass
-from typing import Dict, Optional, Tuple
+from dataclasses import asdict, dataclass, replace
+from datetime import date
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import pandas as pd
 
 from config import load_config
-from pipeline.cache import CacheError, build_meta, load_cache, save_cache
-from pipeline.metric_mapping import MetricMappingError, get_metric_mapping
-from pipeline.normalize_timeseries import NormalizeError, NormalizeSpec, normalize_timeseries
-from sac_connector.timeseries import SliceSpec, fetch_timeseries
+from pipeline.cache import (
+    CacheError,
+    build_meta,
+    load_cache,
+    load_cache_frame,
+    load_cache_meta_raw,
+    save_cache,
+)
+from pipeline.metric_mapping import (
+    _ALLOWED_MEASURES,
+    MetricMappingError,
+    get_metric_mapping,
+    measure_filters,
+)
+from pipeline.normalize_timeseries import (
+    MeasureSpec,
+    NormalizeError,
+    NormalizeSpec,
+    normalize_measures_pages,
+    normalize_timeseries_pages,
+)
+from sac_connector.export import ExportError
+from sac_connector.timeseries import SliceSpec, iter_fact_pages
 
 
 @dataclass(frozen=True)
@@ -29,6 +49,19 @@ class HrCostMeta:
 
 
 DEFAULT_AVG_COST_PER_FTE = float(os.getenv("AVG_COST_PER_FTE_MONTHLY", "8000"))
+# Pages fetched ahead of normalization during SAC refresh (0 disables read-ahead).
+DEFAULT_PREFETCH_PAGES = int(os.getenv("SAC_PREFETCH_PAGES", "2"))
+# Months before the cached max_date that an incremental refresh re-pulls to pick up restatements.
+DEFAULT_INCREMENTAL_OVERLAP_MONTHS = int(os.getenv("SAC_INCREMENTAL_OVERLAP_MONTHS", "3"))
+# Cache meta fields that must match for an incremental refresh to extend the cached series.
+_INCREMENTAL_MATCH_FIELDS = (
+    "provider_id",
+    "namespace_id",
+    "measure_used",
+    "filters_used",
+    "calculation",
+    "avg_cost_per_fte_monthly",
+)
 
 
 def _build_hr_cost_meta(provider_id: str, namespace_id: str, provider_name: str) -> HrCostMeta:
@@ -50,15 +83,53 @@ def _build_hr_cost_meta(provider_id: str, namespace_id: str, provider_name: str)
     )
 
 
+def _incremental_cutoff(max_date: str, overlap_months: int) -> date:
+    last = date.fromisoformat(max_date)
+    ordinal = last.year * 12 + last.month - 1 - max(0, overlap_months)
+    return date(ordinal // 12, ordinal % 12 + 1, 1)
+
+
+def _load_incremental_base(
+    cache_path: str,
+    meta_path: str,
+    extra: Dict[str, object],
+    overlap_months: int,
+) -> Optional[Tuple[pd.DataFrame, date]]:
+    """Return the cached series and tail cutoff, or None when a full refresh is required."""
+    try:
+        rows, meta = load_cache(data_path=cache_path, meta_path=meta_path)
+        meta_raw = load_cache_meta_raw(meta_path=meta_path)
+    except CacheError:
+        return None
+    if meta.source != "sac":
+        return None
+    if any(meta_raw.get(field) != extra[field] for field in _INCREMENTAL_MATCH_FIELDS):
+        return None
+    existing = pd.DataFrame(rows)
+    if list(existing.columns) != ["date", "value"]:
+        return None
+    existing["value"] = existing["value"].astype(float)
+    return existing, _incremental_cutoff(meta.max_date, overlap_months)
+
+
+def _merge_tail(existing: pd.DataFrame, tail: pd.DataFrame, cutoff: date) -> pd.DataFrame:
+    # The re-pulled tail is authoritative from the cutoff onward (restated months overwrite).
+    kept = existing[existing["date"] < cutoff.isoformat()]
+    merged = pd.concat([kept, tail[["date", "value"]]], ignore_index=True)
+    return merged.sort_values("date").reset_index(drop=True)
+
+
 def get_hr_cost_series(
     source: str = "sac",
     refresh: bool = False,
     cache_path: str = "data/cache/sac_export.csv",
+    meta_path: str = "data/cache/meta.json",
+    incremental: bool = False,
+    overlap_months: int = DEFAULT_INCREMENTAL_OVERLAP_MONTHS,
 ) -> Tuple[pd.DataFrame, Dict[str, object]]:
     if source == "cache":
-        rows, meta = load_cache(data_path=cache_path)
-        df = pd.DataFrame(rows)
-        df["value"] = df["value"].astype(float)
+        df, meta = load_cache_frame(data_path=cache_path, meta_path=meta_path)
+        df["date"] = df["date"].dt.strftime("%Y-%m-%d")
         return df, {**asdict(_build_hr_cost_meta("unknown", "unknown", "unknown")), **asdict(meta)}
 
     if source == "fixture":
@@ -73,10 +144,9 @@ def get_hr_cost_series(
             df["value"] = df["value"].astype(float) * DEFAULT_AVG_COST_PER_FTE
         else:
             df["value"] = df["value"].astype(float)
-        rows = df.to_dict(orient="records")
-        meta = build_meta(rows, source="fixture")
+        meta = build_meta(df, source="fixture")
         extra = asdict(_build_hr_cost_meta("fixture", "fixture", "fixture"))
-        save_cache(rows, meta, data_path=cache_path, extra_meta=extra)
+        meta = save_cache(df, meta, data_path=cache_path, meta_path=meta_path, extra_meta=extra)
         return df, {**extra, **asdict(meta)}
 
     cfg = load_config()
@@ -90,15 +160,28 @@ def get_hr_cost_series(
     except MetricMappingError as exc:
         raise CacheError(str(exc)) from exc
 
-    raw_df = fetch_timeseries(
+    extra = asdict(_build_hr_cost_meta(provider_id, namespace_id, provider_name))
+    base = None
+    if incremental:
+        base = _load_incremental_base(cache_path, meta_path, extra, overlap_months)
+    slice_spec = SliceSpec(measure=mapping.measure, filters=mapping.filters)
+    if base is not None:
+        slice_spec = SliceSpec(
+            measure=mapping.measure,
+            filters=mapping.filters,
+            date_from=base[1].strftime("%Y%m"),
+        )
+
+    pages = iter_fact_pages(
         provider_id=provider_id,
         namespace_id=namespace_id,
         config=cfg,
-        slice_spec=SliceSpec(measure=mapping.measure, filters=mapping.filters),
+        slice_spec=slice_spec,
+        prefetch=DEFAULT_PREFETCH_PAGES,
     )
     try:
-        normalized = normalize_timeseries(
-            raw_df,
+        normalized = normalize_timeseries_pages(
+            pages,
             NormalizeSpec(
                 value_field=mapping.measure,
                 allow_non_numeric=(mapping.measure != "SignedData"),
@@ -111,8 +194,117 @@ def get_hr_cost_series(
         normalized["value"] = normalized["value"].astype(float) * DEFAULT_AVG_COST_PER_FTE
     else:
         normalized["value"] = normalized["value"].astype(float)
-    rows = normalized.to_dict(orient="records")
-    meta = build_meta(rows, source="sac")
-    extra = asdict(_build_hr_cost_meta(provider_id, namespace_id, provider_name))
-    save_cache(rows, meta, data_path=cache_path, extra_meta=extra)
+    if base is not None:
+        existing, cutoff = base
+        normalized = _merge_tail(existing, normalized, cutoff)
+        extra["refresh_mode"] = "incremental"
+        extra["incremental_from"] = cutoff.isoformat()
+    else:
+        extra["refresh_mode"] = "full"
+    meta = build_meta(normalized, source="sac")
+    meta = save_cache(
+        normalized, meta, data_path=cache_path, meta_path=meta_path, extra_meta=extra
+    )
+    return normalized, {**extra, **asdict(meta)}
+
+
+def _measure_pulls(measures: Sequence[str]) -> List[Tuple[Dict[str, str], Tuple[str, ...]]]:
+    """Group measures that share filters so each group is fetched with one FactData pull."""
+    pulls: Dict[Tuple[Tuple[str, str], ...], List[str]] = {}
+    filters_by_key: Dict[Tuple[Tuple[str, str], ...], Dict[str, str]] = {}
+    for measure in measures:
+        filters = measure_filters(measure)
+        key = tuple(sorted(filters.items()))
+        filters_by_key[key] = filters
+        pulls.setdefault(key, []).append(measure)
+    return [(filters_by_key[key], tuple(group)) for key, group in pulls.items()]
+
+
+def _measure_series_meta(frame: pd.DataFrame) -> List[Dict[str, object]]:
+    stats = frame.groupby(["measure", "grain", "aggregate"], sort=True)["date"].agg(
+        ["count", "min", "max"]
+    )
+    return [
+        {
+            "measure": measure,
+            "grain": grain,
+            "aggregate": aggregate,
+            "row_count": int(row["count"]),
+            "min_date": row["min"],
+            "max_date": row["max"],
+        }
+        for (measure, grain, aggregate), row in stats.iterrows()
+    ]
+
+
+def refresh_measure_cache(
+    measures: Sequence[str] = ("SignedData", "Cost"),
+    grains: Sequence[str] = ("month", "quarter", "year"),
+    aggregates: Sequence[str] = ("sum", "mean", "last"),
+    group_dims: Optional[Sequence[str]] = None,
+    cache_path: str = "data/cache/measures.csv",
+    meta_path: str = "data/cache/measures_meta.json",
+) -> Tuple[pd.DataFrame, Dict[str, object]]:
+    """Cache several measures at every grain/aggregate; see normalize_timeseries.select_measure.
+
+    Each measure uses the filters of the series it stands for (metric_mapping.measure_filters),
+    so SignedData matches fte mode and Cost matches cost mode. Measures that share filters are
+    fetched with one FactData pull.
+    """
+    unknown = sorted(set(measures) - _ALLOWED_MEASURES)
+    if not measures or unknown:
+        allowed = ", ".join(sorted(_ALLOWED_MEASURES))
+        requested = ", ".join(unknown) or "none"
+        raise CacheError(f"Unsupported measures: {requested}. Allowed: {allowed}.")
+    cfg = load_config()
+    if not cfg.provider_id:
+        raise CacheError("Missing SAC_PROVIDER_ID for HR cost series.")
+    namespace_id = cfg.namespace_id or "sac"
+    try:
+        pulls = _measure_pulls(measures)
+    except MetricMappingError as exc:
+        raise CacheError(str(exc)) from exc
+
+    frames = []
+    for filters, group in pulls:
+        slice_spec = SliceSpec(measure=group[0], filters=filters, extra_measures=group[1:])
+        pages = iter_fact_pages(
+            provider_id=cfg.provider_id,
+            namespace_id=namespace_id,
+            config=cfg,
+            slice_spec=slice_spec,
+            prefetch=DEFAULT_PREFETCH_PAGES,
+        )
+        spec = MeasureSpec(
+            measures=group,
+            grains=tuple(grains),
+            aggregates=tuple(aggregates),
+            # FTE must be numeric, as in get_hr_cost_series; other measures may have gaps.
+            allow_non_numeric="SignedData" not in group,
+        )
+        try:
+            # Pages are fetched lazily while normalizing, so export failures surface here.
+            frames.append(normalize_measures_pages(pages, spec, group_dims))
+        except (ExportError, NormalizeError) as exc:
+            raise CacheError(str(exc)) from exc
+    normalized = pd.concat(frames, ignore_index=True)
+
+    series = _measure_series_meta(normalized)
+    extra = {
+        "provider_id": cfg.provider_id,
+        "namespace_id": namespace_id,
+        "filters_used": {measure: measure_filters(measure) for measure in measures},
+        "measures": list(measures),
+        "grains": list(grains),
+        "aggregates": list(aggregates),
+        "series": series,
+    }
+    # Rollups are labelled with their period start, so the cached date range comes from the
+    # monthly rows when present; per-series ranges are listed under "series".
+    monthly = normalized[normalized["grain"] == "month"]
+    meta = build_meta(monthly if not monthly.empty else normalized, source="sac")
+    meta = replace(meta, row_count=len(normalized))
+    meta = save_cache(
+        normalized, meta, data_path=cache_path, meta_path=meta_path, extra_meta=extra
+    )
     return normalized, {**extra, **asdict(meta)}
@@ -56,6 +56,15 @@ def _load_filters(output_mode: str) -> Dict[str, str]:
     return filters
 
 
+def measure_filters(measure: str) -> Dict[str, str]:
+    """Filters of the series a measure stands for: SignedData is FTE, Cost is HR cost."""
+    if measure not in _ALLOWED_MEASURES:
+        raise MetricMappingError(
+            f"Unsupported measure '{measure}'. Allowed: {', '.join(sorted(_ALLOWED_MEASURES))}."
+        )
+    return _load_filters("fte" if measure == "SignedData" else "cost")
+
+
 def get_metric_mapping() -> MetricMapping:
     output_mode = _load_output_mode()
     default_measure = "Cost" if output_mode == "cost" else "SignedData"
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
-from datetime import date
-from typing import Iterable, Optional
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
 
@@ -18,51 +18,291 @@ class NormalizeSpec:
     allow_non_numeric: bool = False
 
 
-def _parse_yyyymm(value: str) -> date:
-    if len(value) != 6 or not value.isdigit():
-        raise NormalizeError(f"Invalid Date format (expected YYYYMM): {value}")
-    year = int(value[:4])
-    month = int(value[4:])
-    if month < 1 or month > 12:
-        raise NormalizeError(f"Invalid Date month: {value}")
-    return date(year, month, 1)
+@dataclass(frozen=True)
+class MeasureSpec:
+    """Several measures at several grains in one pass (see normalize_measures).
 
+    The month grain is the monthly total of each measure; quarter and year roll those
+    monthly totals up with each of `aggregates` (sum, mean or last month in the period).
+    """
 
-def normalize_timeseries(
+    measures: Tuple[str, ...] = ("SignedData",)
+    date_field: str = "Date"
+    grains: Tuple[str, ...] = ("month",)
+    aggregates: Tuple[str, ...] = ("sum",)
+    allow_non_numeric: bool = False
+
+
+# Months per period; period starts are ordinals divisible by this (ordinals start at January).
+_GRAIN_MONTHS = {"month": 1, "quarter": 3, "year": 12}
+_ROLLUPS = ("sum", "mean", "last")
+
+
+# Month ordinal (year * 12 + month - 1) of 1970-01, the datetime64[M] epoch.
+_EPOCH_ORDINAL = 1970 * 12
+
+
+def _sample(values: Iterable[object], limit: int = 5) -> str:
+    values = list(values)
+    shown = ", ".join(str(value) for value in values[:limit])
+    more = len(values) - limit
+    return f"{shown} (+{more} more)" if more > 0 else shown
+
+
+def _month_ordinals(values: pd.Series) -> np.ndarray:
+    """YYYYMM values as month ordinals, validated and reporting all offending values.
+
+    Integer columns are split with integer division/modulo directly; other columns are
+    factorized first so each distinct value is checked once (a slice has few months).
+    """
+    codes: Optional[np.ndarray] = None
+    if pd.api.types.is_integer_dtype(values):
+        # Nullable Int64 columns may hold NA, which cannot be cast to int64.
+        present = values.notna().to_numpy()
+        missing = not present.all()
+        number = values.to_numpy(dtype=np.int64, na_value=0)
+        labels = pd.Series(number)
+        bad = present & ((number < 100000) | (number > 999999))
+    else:
+        codes, uniques = pd.factorize(values, use_na_sentinel=True)
+        missing = bool((codes < 0).any())
+        labels = pd.Series(np.asarray(uniques, dtype=object)).astype(str)
+        bad = ~labels.str.fullmatch(r"\d{6}").to_numpy()
+        number = np.where(bad, "0", labels).astype(np.int64)
+    if bad.any() or missing:
+        offending = [str(label) for label in pd.unique(labels[bad])]
+        if missing:
+            offending.append("missing value")
+        raise NormalizeError(f"Invalid Date format (expected YYYYMM): {_sample(offending)}")
+
+    year, month = number // 100, number % 100
+    bad_month = (month < 1) | (month > 12)
+    if bad_month.any():
+        raise NormalizeError(f"Invalid Date month: {_sample(pd.unique(labels[bad_month]))}")
+    ordinals = year * 12 + month - 1
+    return ordinals if codes is None else ordinals[codes]
+
+
+def _ordinals_to_iso(ordinals: pd.Series) -> np.ndarray:
+    months = (ordinals.to_numpy(dtype=np.int64) - _EPOCH_ORDINAL).astype("datetime64[M]")
+    return np.datetime_as_string(months.astype("datetime64[D]"), unit="D")
+
+
+def _finish(aggregated: pd.DataFrame) -> pd.DataFrame:
+    # Groups are keyed by month ordinal; only the aggregated rows are formatted as ISO dates.
+    aggregated = aggregated.sort_values("date", kind="mergesort").reset_index(drop=True)
+    aggregated["date"] = _ordinals_to_iso(aggregated["date"]).astype(object)
+    return aggregated
+
+
+def _prepare_frame(
     df: pd.DataFrame,
-    spec: NormalizeSpec = NormalizeSpec(),
-    group_dims: Optional[Iterable[str]] = None,
+    spec: NormalizeSpec,
+    dims: Iterable[str],
 ) -> pd.DataFrame:
-    if df.empty:
-        raise NormalizeError("Empty dataset; check filters in docs/dataset_binding.md.")
-
     if spec.date_field not in df.columns or spec.value_field not in df.columns:
         raise NormalizeError("Missing required fields for normalization.")
 
     working = df[[spec.date_field, spec.value_field]].copy()
-    working[spec.date_field] = working[spec.date_field].astype(str).map(_parse_yyyymm)
+    working["date"] = _month_ordinals(working[spec.date_field])
     working[spec.value_field] = pd.to_numeric(working[spec.value_field], errors="coerce")
 
     if working[spec.value_field].isna().any():
         if spec.allow_non_numeric:
             working = working.dropna(subset=[spec.value_field])
-            if working.empty:
-                raise NormalizeError("No numeric values found in measure column.")
         else:
             raise NormalizeError("Non-numeric values found in measure column.")
 
-    working["date"] = working[spec.date_field].map(lambda d: d.isoformat())
     working["value"] = working[spec.value_field].astype(float)
 
-    group_cols = ["date"]
-    if group_dims:
-        for dim in group_dims:
-            if dim in df.columns:
-                working[f"dim_{dim}"] = df[dim].astype(str)
-                group_cols.append(f"dim_{dim}")
+    for dim in dims:
+        if dim not in df.columns:
+            raise NormalizeError(f"Missing dimension column for normalization: {dim}")
+        working[f"dim_{dim}"] = df[dim].astype(str)
+    return working
+
+
+def _present_dims(df: pd.DataFrame, group_dims: Optional[Iterable[str]]) -> List[str]:
+    return [dim for dim in (group_dims or []) if dim in df.columns]
+
+
+def normalize_timeseries(
+    df: pd.DataFrame,
+    spec: NormalizeSpec = NormalizeSpec(),
+    group_dims: Optional[Iterable[str]] = None,
+) -> pd.DataFrame:
+    if df.empty:
+        raise NormalizeError("Empty dataset; check filters in docs/dataset_binding.md.")
+
+    dims = _present_dims(df, group_dims)
+    working = _prepare_frame(df, spec, dims)
+    if working.empty:
+        raise NormalizeError("No numeric values found in measure column.")
 
     if spec.aggregate != "sum":
         raise NormalizeError(f"Unsupported aggregation: {spec.aggregate}")
 
+    group_cols = ["date"] + [f"dim_{dim}" for dim in dims]
     aggregated = working.groupby(group_cols, as_index=False)["value"].sum()
-    return aggregated.sort_values("date").reset_index(drop=True)
+    return _finish(aggregated)
+
+
+def normalize_timeseries_pages(
+    pages: Iterable[Union[pd.DataFrame, Sequence[Dict]]],
+    spec: NormalizeSpec = NormalizeSpec(),
+    group_dims: Optional[Iterable[str]] = None,
+) -> pd.DataFrame:
+    """Streaming variant of normalize_timeseries: sums are folded in page by page.
+
+    Peak memory is one page plus the running per-group totals.
+    """
+    if spec.aggregate != "sum":
+        raise NormalizeError(f"Unsupported aggregation: {spec.aggregate}")
+
+    dims: Optional[List[str]] = None
+    totals: Optional[pd.Series] = None
+    saw_rows = False
+    for page in pages:
+        frame = page if isinstance(page, pd.DataFrame) else pd.DataFrame(page)
+        if frame.empty:
+            continue
+        saw_rows = True
+        if dims is None:
+            dims = _present_dims(frame, group_dims)
+        working = _prepare_frame(frame, spec, dims)
+        if working.empty:
+            continue
+        group_cols = ["date"] + [f"dim_{dim}" for dim in dims]
+        partial = working.groupby(group_cols)["value"].sum()
+        totals = partial if totals is None else totals.add(partial, fill_value=0.0)
+
+    if not saw_rows:
+        raise NormalizeError("Empty dataset; check filters in docs/dataset_binding.md.")
+    if totals is None:
+        raise NormalizeError("No numeric values found in measure column.")
+
+    return _finish(totals.sort_index().reset_index())
+
+
+def _validate_measure_spec(spec: MeasureSpec) -> None:
+    if not spec.measures:
+        raise NormalizeError("MeasureSpec needs at least one measure.")
+    unknown_grains = sorted(set(spec.grains) - set(_GRAIN_MONTHS))
+    if unknown_grains or not spec.grains:
+        raise NormalizeError(f"Unsupported grain: {', '.join(unknown_grains) or 'none'}")
+    unknown_aggregates = sorted(set(spec.aggregates) - set(_ROLLUPS))
+    if unknown_aggregates or not spec.aggregates:
+        raise NormalizeError(f"Unsupported aggregation: {', '.join(unknown_aggregates) or 'none'}")
+
+
+def _monthly_measures(
+    df: pd.DataFrame, spec: MeasureSpec, dims: Sequence[str]
+) -> Optional[pd.DataFrame]:
+    """Monthly totals per (month ordinal, dims) with one column per measure."""
+    missing = [field for field in (spec.date_field, *spec.measures) if field not in df.columns]
+    if missing:
+        raise NormalizeError(f"Missing required fields for normalization: {', '.join(missing)}")
+
+    working = pd.DataFrame({"date": _month_ordinals(df[spec.date_field])}, index=df.index)
+    for dim in dims:
+        working[f"dim_{dim}"] = df[dim].astype(str)
+    measures = list(spec.measures)
+    for measure in measures:
+        working[measure] = pd.to_numeric(df[measure], errors="coerce").astype(float)
+    if working[measures].isna().to_numpy().any() and not spec.allow_non_numeric:
+        raise NormalizeError("Non-numeric values found in measure column.")
+    working = working.dropna(subset=measures, how="all")
+    if working.empty:
+        return None
+    group_cols = ["date"] + [f"dim_{dim}" for dim in dims]
+    # min_count keeps months where a measure had no numeric value at all as missing.
+    return working.groupby(group_cols)[measures].sum(min_count=1)
+
+
+def _rollup(monthly: pd.DataFrame, spec: MeasureSpec, dims: Sequence[str]) -> pd.DataFrame:
+    dim_cols = [f"dim_{dim}" for dim in dims]
+    long = (
+        monthly.reset_index()
+        .melt(
+            id_vars=["date"] + dim_cols,
+            value_vars=list(spec.measures),
+            var_name="measure",
+            value_name="value",
+        )
+        .dropna(subset=["value"])
+        .sort_values("date", kind="mergesort")
+    )
+    outputs = []
+    for grain in spec.grains:
+        if grain == "month":
+            outputs.append(long.assign(grain="month", aggregate="sum"))
+            continue
+        months = _GRAIN_MONTHS[grain]
+        keys = ["date"] + dim_cols + ["measure"]
+        periods = long.assign(date=long["date"] - long["date"] % months)
+        rolled = periods.groupby(keys, sort=False)["value"].agg(list(spec.aggregates))
+        stacked = rolled.reset_index().melt(
+            id_vars=keys, value_vars=list(spec.aggregates), var_name="aggregate"
+        )
+        outputs.append(stacked.assign(grain=grain))
+
+    result = pd.concat(outputs, ignore_index=True)
+    order = ["measure", "grain", "aggregate", "date"] + dim_cols
+    result = result.sort_values(order, kind="mergesort").reset_index(drop=True)
+    result["date"] = _ordinals_to_iso(result["date"]).astype(object)
+    return result[["date"] + dim_cols + ["measure", "grain", "aggregate", "value"]]
+
+
+def normalize_measures(
+    df: pd.DataFrame,
+    spec: MeasureSpec = MeasureSpec(),
+    group_dims: Optional[Iterable[str]] = None,
+) -> pd.DataFrame:
+    """Long frame with one row per (date, dims, measure, grain, aggregate).
+
+    The raw rows are grouped once for all measures; grains are rolled up from the small
+    monthly table, so the output can be written to the cache with a single save_cache call.
+    """
+    return normalize_measures_pages([df], spec, group_dims)
+
+
+def normalize_measures_pages(
+    pages: Iterable[Union[pd.DataFrame, Sequence[Dict]]],
+    spec: MeasureSpec = MeasureSpec(),
+    group_dims: Optional[Iterable[str]] = None,
+) -> pd.DataFrame:
+    """Streaming variant of normalize_measures; monthly totals are folded in page by page."""
+    _validate_measure_spec(spec)
+    dims: Optional[List[str]] = None
+    totals: Optional[pd.DataFrame] = None
+    saw_rows = False
+    for page in pages:
+        frame = page if isinstance(page, pd.DataFrame) else pd.DataFrame(page)
+        if frame.empty:
+            continue
+        saw_rows = True
+        if dims is None:
+            dims = _present_dims(frame, group_dims)
+        partial = _monthly_measures(frame, spec, dims)
+        if partial is None:
+            continue
+        totals = partial if totals is None else totals.add(partial, fill_value=0.0)
+
+    if not saw_rows:
+        raise NormalizeError("Empty dataset; check filters in docs/dataset_binding.md.")
+    if totals is None or dims is None:
+        raise NormalizeError("No numeric values found in measure column.")
+    return _rollup(totals.sort_index(), spec, dims)
+
+
+def select_measure(
+    normalized: pd.DataFrame, measure: str, grain: str = "month", aggregate: str = "sum"
+) -> pd.DataFrame:
+    """One series out of a normalize_measures frame, shaped like normalize_timeseries output."""
+    mask = (
+        (normalized["measure"] == measure)
+        & (normalized["grain"] == grain)
+        & (normalized["aggregate"] == aggregate)
+    )
+    selected = normalized.loc[mask].drop(columns=["measure", "grain", "aggregate"])
+    return selected.reset_index(drop=True)
@@ -0,0 +1,144 @@
+import json
+import os
+import shutil
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Dict, Optional, Tuple
+from urllib.parse import quote
+
+import pandas as pd
+
+from pipeline.cache import (
+    CacheError,
+    CacheMeta,
+    atomic_output,
+    build_meta,
+    load_cache_slice,
+    save_cache,
+)
+
+# One cache per dimension member under root, e.g. root/dim_CostCenters=CC100/data.csv.
+DEFAULT_PARTITION_ROOT = "data/cache/partitions"
+MANIFEST_NAME = "manifest.json"
+
+
+@dataclass(frozen=True)
+class PartitionInfo:
+    member: str
+    data_path: str
+    row_count: int
+    min_date: str
+    max_date: str
+    content_hash: str
+
+
+def partition_column(dimension: str) -> str:
+    return dimension if dimension.startswith("dim_") else f"dim_{dimension}"
+
+
+def _partition_dir(root: str, column: str, member: str) -> str:
+    # Hive-style directory names; members are percent-encoded so any value is a safe name.
+    return os.path.join(root, f"{column}={quote(member, safe='')}")
+
+
+def partition_paths(root: str, column: str, member: str) -> Tuple[str, str]:
+    """Data and meta paths of one member's cache (data.csv is the stem for every format)."""
+    directory = _partition_dir(root, column, member)
+    return os.path.join(directory, "data.csv"), os.path.join(directory, "meta.json")
+
+
+def save_partitioned_cache(
+    frame: pd.DataFrame,
+    dimension: str,
+    root: str = DEFAULT_PARTITION_ROOT,
+    source: str = "sac",
+    extra_meta: Optional[Dict] = None,
+    fmt: Optional[str] = None,
+) -> Dict[str, PartitionInfo]:
+    """Split frame by dimension member and write each member as its own cache.
+
+    Each partition is an independent snapshot-backed cache (see save_cache); the manifest is
+    written last, so readers only discover partitions whose data is already committed.
+    """
+    column = partition_column(dimension)
+    if column not in frame.columns:
+        raise CacheError(f"Cache save failed: missing partition column '{column}'.")
+    if frame.empty:
+        raise CacheError("Cache save failed: no rows to write.")
+    if frame[column].isna().any():
+        raise CacheError(f"Cache save failed: '{column}' has missing members.")
+
+    partitions: Dict[str, PartitionInfo] = {}
+    for member, part in frame.groupby(frame[column].astype(str), sort=True):
+        data_path, meta_path = partition_paths(root, column, member)
+        part = part.reset_index(drop=True)
+        meta = save_cache(
+            part,
+            build_meta(part, source=source),
+            data_path=data_path,
+            meta_path=meta_path,
+            extra_meta=extra_meta,
+            fmt=fmt,
+        )
+        partitions[member] = PartitionInfo(
+            member=member,
+            data_path=os.path.relpath(data_path, root),
+            row_count=meta.row_count,
+            min_date=meta.min_date,
+            max_date=meta.max_date,
+            content_hash=meta.content_hash,
+        )
+
+    manifest = {
+        "dimension": column,
+        "source": source,
+        "last_refresh_time": datetime.now(timezone.utc).isoformat(),
+        "partitions": {member: asdict(info) for member, info in partitions.items()},
+    }
+    with atomic_output(os.path.join(root, MANIFEST_NAME)) as tmp_path:
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump(manifest, handle, indent=2, sort_keys=True)
+    _remove_stale_partitions(root, column, partitions)
+    return partitions
+
+
+def _remove_stale_partitions(root: str, column: str, partitions: Dict[str, PartitionInfo]) -> None:
+    # Only this dimension's member directories; other dimensions' layouts are left alone.
+    prefix = f"{column}="
+    live = {os.path.basename(_partition_dir(root, column, member)) for member in partitions}
+    for name in os.listdir(root):
+        path = os.path.join(root, name)
+        if name.startswith(prefix) and name not in live and os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def load_partition_manifest(root: str = DEFAULT_PARTITION_ROOT) -> Dict[str, object]:
+    path = os.path.join(root, MANIFEST_NAME)
+    if not os.path.exists(path):
+        raise CacheError(
+            f"Partitioned cache is missing under {root}. "
+            "Write it with pipeline.partitions.save_partitioned_cache."
+        )
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            manifest = json.load(handle)
+    except json.JSONDecodeError as exc:
+        raise CacheError("Partition manifest is corrupt. Delete it and rerun refresh.") from exc
+    if not isinstance(manifest, dict) or not isinstance(manifest.get("partitions"), dict):
+        raise CacheError("Partition manifest is corrupt. Delete it and rerun refresh.")
+    return manifest
+
+
+def load_partition(
+    member: str,
+    root: str = DEFAULT_PARTITION_ROOT,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+) -> Tuple[pd.DataFrame, CacheMeta]:
+    """Typed rows of one member (optionally a date range), reading only its partition."""
+    manifest = load_partition_manifest(root)
+    if member not in manifest["partitions"]:
+        known = ", ".join(sorted(manifest["partitions"]))
+        raise CacheError(f"Unknown partition '{member}'. Available: {known}")
+    data_path, meta_path = partition_paths(root, str(manifest["dimension"]), member)
+    return load_cache_slice(data_path=data_path, meta_path=meta_path, start=start, end=end)
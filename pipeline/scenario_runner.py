@@ -1,11 +1,13 @@
 import json
+import os
 from dataclasses import asdict
 from datetime import datetime, timezone
-from typing import Dict, Optional
+from typing import Dict
 
 import pandas as pd
 
-from pipeline.cache import CacheError
+from pipeline.artifacts import invalidate_artifact
+from pipeline.cache import CacheError, atomic_output, file_sha256, load_run_meta
 from scenarios.overlay_v2 import apply_presets_v2
 from scenarios.presets_v2 import PRESETS_V2
 from scenarios.validate import validate_params
@@ -26,12 +28,30 @@ def run_scenarios(
     forecast_path: str = "data/cache/forecast.csv",
     output_path: str = "data/cache/scenarios.csv",
     meta_path: str = "data/cache/scenarios_meta.json",
+    force: bool = False,
 ) -> Dict[str, str]:
     try:
+        input_hash = file_sha256(forecast_path)
         forecast_df = pd.read_csv(forecast_path)
     except FileNotFoundError as exc:
         raise CacheError("Run `python -m demo.forecast` first.") from exc
 
+    presets = json.loads(json.dumps(_serialize_presets()))
+    previous = load_run_meta(meta_path)
+    if (
+        not force
+        and os.path.exists(output_path)
+        and previous.get("input_content_hash") == input_hash
+        and previous.get("presets") == presets
+    ):
+        # Forecast and presets are unchanged: the existing scenarios are still current.
+        return {
+            "output_path": output_path,
+            "meta_path": meta_path,
+            "scenario_count": str(len(PRESETS_V2)),
+            "skipped": "true",
+        }
+
     if forecast_df.empty:
         raise CacheError("Forecast cache is empty. Run demo.forecast again.")
 
@@ -48,21 +68,27 @@ def run_scenarios(
         forecast_df[["date", "yhat"]],
         validated_presets,
     )
-    scenarios_df.to_csv(output_path, index=False)
+    with atomic_output(output_path) as tmp_path:
+        scenarios_df.to_csv(tmp_path, index=False)
+    invalidate_artifact(output_path)
 
     meta_out = {
         "generated_at": datetime.now(timezone.utc).isoformat(),
-        "presets": _serialize_presets(),
+        "presets": presets,
+        "input_content_hash": input_hash,
         "preset_warnings": preset_warnings,
         "horizon_months": len(forecast_df),
         "output_min_date": scenarios_df["date"].min(),
         "output_max_date": scenarios_df["date"].max(),
     }
-    with open(meta_path, "w", encoding="utf-8") as handle:
-        json.dump(meta_out, handle, indent=2, sort_keys=True)
+    with atomic_output(meta_path) as tmp_path:
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump(meta_out, handle, indent=2, sort_keys=True)
 
     return {
         "output_path": output_path,
         "meta_path": meta_path,
         "scenario_count": str(len(PRESETS_V2)),
+        "skipped": "false",
     }
+
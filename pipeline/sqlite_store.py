@@ -0,0 +1,258 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from dataclasses import asdict
+from typing import Dict, Iterator, List, Optional, Sequence
+
+import pandas as pd
+
+from pipeline.cache import (
+    CacheError,
+    CacheMeta,
+    load_cache_frame,
+    load_pinned_data,
+    meta_from_dict,
+)
+
+# SQLite mirror of the file caches for MCP queries; empty disables it.
+CACHE_SQLITE_PATH = os.getenv("CACHE_SQLITE_PATH", "data/cache/cache.sqlite").strip()
+_AGGREGATES = {"sum": "SUM", "mean": "AVG", "min": "MIN", "max": "MAX"}
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _sql_type(series: pd.Series) -> str:
+    if pd.api.types.is_bool_dtype(series) or pd.api.types.is_integer_dtype(series):
+        return "INTEGER"
+    if pd.api.types.is_float_dtype(series):
+        return "REAL"
+    return "TEXT"
+
+
+def _file_version(path: str) -> str:
+    stat = os.stat(path)
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def series_table(cache_path: str) -> str:
+    """Name of the SQLite table mirroring one series cache file."""
+    digest = hashlib.sha256(os.path.abspath(cache_path).encode("utf-8")).hexdigest()
+    return f"series_{digest[:16]}"
+
+
+def _series_version(cache_path: str, content_hash: str, data_path: str) -> str:
+    # Content hash when the data came from a pinned snapshot, else the data file's stat.
+    return f"{os.path.abspath(cache_path)}|{content_hash or _file_version(data_path)}"
+
+
+class SqliteStore:
+    """Series, forecast and scenario tables kept in sync with the file caches.
+
+    Tables are rebuilt inside one write transaction when their source changes (content hash
+    for series caches, mtime/size for forecast and scenario CSVs). Each series cache file gets
+    its own table (`series_table`). WAL mode lets readers keep querying the previous version
+    while a rebuild is in progress; `read_snapshot` pins one version across several reads.
+    """
+
+    def __init__(self, path: str = CACHE_SQLITE_PATH):
+        self.path = path
+        self._local = threading.local()
+
+    def _connect(self) -> sqlite3.Connection:
+        # sqlite3 connections are per thread; ThreadingHTTPServer handles requests on many.
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS _versions "
+                "(name TEXT PRIMARY KEY, version TEXT NOT NULL, meta TEXT NOT NULL)"
+            )
+            self._local.conn = conn
+        return conn
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def version(self, table: str) -> Optional[str]:
+        row = self._connect().execute(
+            "SELECT version FROM _versions WHERE name = ?", (table,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def meta(self, table: str) -> Dict[str, object]:
+        row = self._connect().execute(
+            "SELECT meta FROM _versions WHERE name = ?", (table,)
+        ).fetchone()
+        return json.loads(row[0]) if row else {}
+
+    @contextmanager
+    def read_snapshot(self) -> Iterator[None]:
+        """Serve every read in the block from one database version."""
+        conn = self._connect()
+        conn.execute("BEGIN")
+        try:
+            yield
+        finally:
+            conn.execute("COMMIT")
+
+    def series_meta(self, cache_path: str = "data/cache/sac_export.csv") -> CacheMeta:
+        """Meta of the cache snapshot the series table for cache_path was built from."""
+        meta_raw = self.meta(series_table(cache_path))
+        if not meta_raw:
+            raise CacheError(f"SQLite series table for {cache_path} is missing. Rerun refresh.")
+        return meta_from_dict(meta_raw)
+
+    def _replace_table(
+        self,
+        table: str,
+        frame: pd.DataFrame,
+        version: str,
+        meta: Dict[str, object],
+        indexes: Sequence[Sequence[str]],
+    ) -> None:
+        conn = self._connect()
+        columns = list(frame.columns)
+        values = frame.astype(object).where(frame.notna(), None)
+        column_sql = ", ".join(f"{_quote(col)} {_sql_type(frame[col])}" for col in columns)
+        placeholders = ", ".join("?" for _ in columns)
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if self.version(table) == version:
+                # Another thread or process rebuilt the table while we waited for the lock.
+                conn.execute("ROLLBACK")
+                return
+            conn.execute(f"DROP TABLE IF EXISTS {_quote(table)}")
+            conn.execute(f"CREATE TABLE {_quote(table)} ({column_sql})")
+            conn.executemany(
+                f"INSERT INTO {_quote(table)} VALUES ({placeholders})",
+                values.itertuples(index=False, name=None),
+            )
+            for index_columns in indexes:
+                name = _quote(f"idx_{table}_{'_'.join(index_columns)}")
+                cols = ", ".join(_quote(col) for col in index_columns)
+                conn.execute(f"CREATE INDEX {name} ON {_quote(table)} ({cols})")
+            conn.execute(
+                "INSERT OR REPLACE INTO _versions (name, version, meta) VALUES (?, ?, ?)",
+                (table, version, json.dumps(meta, sort_keys=True)),
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def sync_series(
+        self,
+        cache_path: str = "data/cache/sac_export.csv",
+        meta_path: str = "data/cache/meta.json",
+    ) -> str:
+        """Mirror the series cache at cache_path into its own table; returns the table name."""
+        table = series_table(cache_path)
+        meta_raw, data_path, _ = load_pinned_data(cache_path, meta_path)
+        content_hash = str(meta_raw.get("content_hash") or "")
+        if self.version(table) == _series_version(cache_path, content_hash, data_path):
+            return table
+        # Version the table by the meta returned with the data, which is pinned to one snapshot.
+        frame, meta = load_cache_frame(data_path=cache_path, meta_path=meta_path)
+        version = _series_version(cache_path, meta.content_hash, data_path)
+        frame = frame.copy()
+        frame["date"] = frame["date"].dt.strftime("%Y-%m-%d")
+        dims = [col for col in frame.columns if col.startswith("dim_")]
+        indexes = [["date"]] + [[dim, "date"] for dim in dims]
+        self._replace_table(table, frame, version, asdict(meta), indexes)
+        return table
+
+    def sync_csv(self, table: str, csv_path: str, indexes: Sequence[Sequence[str]]) -> None:
+        if not os.path.exists(csv_path):
+            raise CacheError("Cache is missing or corrupt. Delete data/cache and rerun refresh.")
+        version = _file_version(csv_path)
+        if self.version(table) == version:
+            return
+        frame = pd.read_csv(csv_path, dtype={"date": str})
+        if frame.empty:
+            raise CacheError("Cache is missing or empty.")
+        self._replace_table(table, frame, version, {"source_path": csv_path}, indexes)
+
+    def columns(self, table: str) -> List[str]:
+        rows = self._connect().execute(f"PRAGMA table_info({_quote(table)})").fetchall()
+        return [row[1] for row in rows]
+
+    def query(
+        self,
+        table: str,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        filters: Optional[Dict[str, str]] = None,
+        aggregate: Optional[str] = None,
+        value_column: str = "value",
+        by_date: bool = True,
+    ) -> List[Dict[str, object]]:
+        """Rows with start <= date <= end and column == value filters, ordered by date.
+
+        `by_date=False` keeps the mirrored file's row order instead. With `aggregate` (sum,
+        mean, min, max), value_column is aggregated per date over the rows left after filtering.
+        """
+        known = set(self.columns(table))
+        if not known:
+            raise CacheError(f"SQLite table '{table}' is missing. Rerun refresh.")
+        clauses, params = [], []
+        if start:
+            clauses.append('"date" >= ?')
+            params.append(start)
+        if end:
+            clauses.append('"date" <= ?')
+            params.append(end)
+        for column, value in (filters or {}).items():
+            if column not in known:
+                raise ValueError(f"Unknown filter column '{column}'.")
+            clauses.append(f"{_quote(column)} = ?")
+            params.append(value)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        if aggregate:
+            func = _AGGREGATES.get(aggregate)
+            if func is None:
+                allowed = ", ".join(sorted(_AGGREGATES))
+                raise ValueError(f"Unsupported aggregate '{aggregate}'. Allowed: {allowed}.")
+            if value_column not in known:
+                raise ValueError(f"Unknown value column '{value_column}'.")
+            sql = (
+                f'SELECT "date", {func}({_quote(value_column)}) AS {_quote(value_column)} '
+                f'FROM {_quote(table)}{where} GROUP BY "date" ORDER BY "date"'
+            )
+        else:
+            order = '"date", rowid' if by_date else "rowid"
+            sql = f"SELECT * FROM {_quote(table)}{where} ORDER BY {order}"
+        cursor = self._connect().execute(sql, params)
+        names = [col[0] for col in cursor.description]
+        return [dict(zip(names, row)) for row in cursor.fetchall()]
+
+
+_STORE: Optional[SqliteStore] = None
+_STORE_LOCK = threading.Lock()
+
+
+def default_store() -> Optional[SqliteStore]:
+    global _STORE
+    if not CACHE_SQLITE_PATH:
+        return None
+    with _STORE_LOCK:
+        if _STORE is None:
+            _STORE = SqliteStore(CACHE_SQLITE_PATH)
+        return _STORE
+
+
+def string_rows(rows: List[Dict[str, object]]) -> List[Dict[str, str]]:
+    # MCP responses keep the CSV-era contract of string values.
+    return [
+        {key: "" if value is None else str(value) for key, value in row.items()} for row in rows
+    ]
@@ -1,3 +1,10 @@
-from sac_connector.auth import AuthError, TokenInfo, request_token
+from sac_connector.auth import (
+    AuthError,
+    TokenCache,
+    TokenInfo,
+    clear_token_cache,
+    get_token,
+    request_token,
+)
 
-__all__ = ["AuthError", "TokenInfo", "request_token"]
+__all__ = ["AuthError", "TokenCache", "TokenInfo", "clear_token_cache", "get_token", "request_token"]
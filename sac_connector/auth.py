@@ -1,11 +1,21 @@
 import base64
 import json
+import logging
+import threading
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Callable, Dict, Optional, Tuple
 from urllib import error, parse, request
 
 from config import Config
+from sac_connector.ratelimit import get_limiter, parse_retry_after
+
+logger = logging.getLogger(__name__)
+
+# Tokens are treated as expired this many seconds before their real expiry.
+TOKEN_EXPIRY_MARGIN_SECONDS = 60
+# Within this window before expiry, callers get the cached token and a refresh starts in the background.
+TOKEN_REFRESH_AHEAD_SECONDS = 300
 
 
 class AuthError(Exception):
@@ -59,6 +69,8 @@ def _error_message(status: int, body: str) -> str:
 
 def request_token(config: Config, timeout: int = 30) -> TokenInfo:
     req = _build_request(config.token_url, config.client_id, config.client_secret)
+    limiter = get_limiter()
+    limiter.acquire()
     try:
         with request.urlopen(req, timeout=timeout) as resp:
             payload = resp.read().decode("utf-8")
@@ -68,6 +80,9 @@ def request_token(config: Config, timeout: int = 30) -> TokenInfo:
             body = exc.read().decode("utf-8")
         except Exception:
             body = ""
+        if exc.code == 429 or exc.code >= 500:
+            retry_after = parse_retry_after(exc.headers.get("Retry-After") if exc.headers else None)
+            limiter.record_throttle(exc.code, retry_after)
         message = _error_message(exc.code, body)
         raise AuthError(f"Auth failed ({exc.code}): {message}") from exc
     except error.URLError as exc:
@@ -90,3 +105,101 @@ def request_token(config: Config, timeout: int = 30) -> TokenInfo:
         expires_in=int(expires_in),
         obtained_at=datetime.now(timezone.utc),
     )
+
+
+TokenFetcher = Callable[[Config], TokenInfo]
+
+
+class _TokenEntry:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.token: Optional[TokenInfo] = None
+        self.refreshing = False
+
+
+class TokenCache:
+    """Process-wide OAuth token cache keyed by (token_url, client_id).
+
+    Concurrent callers for the same key share a single in-flight token request.
+    """
+
+    def __init__(
+        self,
+        margin_seconds: int = TOKEN_EXPIRY_MARGIN_SECONDS,
+        refresh_ahead_seconds: int = TOKEN_REFRESH_AHEAD_SECONDS,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ):
+        self.margin = timedelta(seconds=margin_seconds)
+        self.refresh_ahead = timedelta(seconds=max(refresh_ahead_seconds, margin_seconds))
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple[str, str], _TokenEntry] = {}
+
+    def _entry(self, key: Tuple[str, str]) -> _TokenEntry:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = _TokenEntry()
+                self._entries[key] = entry
+            return entry
+
+    def _is_usable(self, token: Optional[TokenInfo]) -> bool:
+        return token is not None and self._clock() < token.expires_at - self.margin
+
+    def _needs_refresh(self, token: TokenInfo) -> bool:
+        # Short-lived tokens refresh at half their lifetime rather than as soon as they arrive.
+        ahead = min(self.refresh_ahead, timedelta(seconds=token.expires_in / 2))
+        return self._clock() >= token.expires_at - ahead
+
+    def _refresh_in_background(self, entry: _TokenEntry, config: Config, fetch: TokenFetcher) -> None:
+        def _run() -> None:
+            token = None
+            try:
+                token = fetch(config)
+            except Exception as exc:
+                # Timeouts/OSErrors from the token endpoint are not wrapped in AuthError; any
+                # failure must still clear `refreshing` so a later call can retry.
+                logger.warning("Background token refresh failed: %s", exc)
+            finally:
+                with entry.lock:
+                    if token is not None:
+                        entry.token = token
+                    entry.refreshing = False
+
+        thread = threading.Thread(target=_run, name="sac-token-refresh", daemon=True)
+        thread.start()
+
+    def get(self, config: Config, fetch: Optional[TokenFetcher] = None) -> TokenInfo:
+        fetch = fetch or request_token
+        token_url = getattr(config, "token_url", None)
+        client_id = getattr(config, "client_id", None)
+        if not token_url or not client_id:
+            return fetch(config)
+
+        entry = self._entry((token_url, client_id))
+        with entry.lock:
+            token = entry.token
+            if not self._is_usable(token):
+                # Blocking refresh under the entry lock so concurrent callers wait for one request.
+                token = fetch(config)
+                entry.token = token
+                return token
+            if self._needs_refresh(token) and not entry.refreshing:
+                entry.refreshing = True
+                self._refresh_in_background(entry, config, fetch)
+            return token
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_TOKEN_CACHE = TokenCache()
+
+
+def get_token(config: Config, fetch: Optional[TokenFetcher] = None) -> TokenInfo:
+    return _TOKEN_CACHE.get(config, fetch=fetch)
+
+
+def clear_token_cache() -> None:
+    _TOKEN_CACHE.clear()
@@ -0,0 +1,68 @@
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import pandas as pd
+
+
+class ColumnarRows:
+    """Accumulates FactData pages as per-column lists instead of per-row dicts.
+
+    Pages still arrive as json.loads row dicts; only one page's dicts are alive at a time,
+    and they are transposed into the column lists as the page is added. Values of
+    categorical (dimension) columns are interned so repeated members share one string
+    object. to_frame() infers dtypes like pd.DataFrame(rows); with categorical=True the
+    dimension columns become pandas categoricals. Columns appear in first-seen order and
+    are backfilled with None, matching pd.DataFrame(list_of_dicts).
+    """
+
+    def __init__(self, categorical: Iterable[str] = ()):
+        self.categorical = set(categorical)
+        self._columns: Dict[str, List[object]] = {}
+        self._interned: Dict[str, Dict[object, object]] = {}
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _ensure_column(self, name: str) -> None:
+        if name not in self._columns:
+            self._columns[name] = [None] * self._length
+
+    def _intern(self, name: str, values: List[object]) -> List[object]:
+        if name not in self.categorical:
+            return values
+        table = self._interned.setdefault(name, {})
+        return [table.setdefault(value, value) for value in values]
+
+    def _append(self, columns: Dict[str, List[object]], count: int) -> None:
+        for name in columns:
+            self._ensure_column(name)
+        for name, column in self._columns.items():
+            values = columns.get(name)
+            column.extend(self._intern(name, values) if values is not None else [None] * count)
+        self._length += count
+
+    def add_page(self, rows: Sequence[Dict]) -> None:
+        if not rows:
+            return
+        names: Dict[str, None] = dict.fromkeys(self._columns)
+        for row in rows:
+            if len(row) != len(names) or any(key not in names for key in row):
+                names.update(dict.fromkeys(row))
+        columns = {name: [row.get(name) for row in rows] for name in names}
+        self._append(columns, len(rows))
+
+    def extend(self, other: "ColumnarRows") -> None:
+        self._append(other._columns, len(other))
+
+    def to_frame(
+        self, columns: Optional[Sequence[str]] = None, categorical: bool = False
+    ) -> pd.DataFrame:
+        names = list(columns) if columns is not None else list(self._columns)
+        data = {}
+        for name in names:
+            values = self._columns.get(name, [None] * self._length)
+            if categorical and name in self.categorical:
+                data[name] = pd.Categorical(values)
+            else:
+                data[name] = values
+        return pd.DataFrame(data, columns=names)
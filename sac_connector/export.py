@@ -1,11 +1,21 @@
 import json
+import queue
+import re
+import threading
 import time
+import zlib
 from dataclasses import dataclass
 from datetime import date, datetime
-from typing import Dict, Iterable, List, Optional, Sequence
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 from urllib import error, parse, request
 
-from sac_connector.auth import AuthError, TokenInfo, request_token
+import numpy as np
+import pandas as pd
+
+from sac_connector.auth import AuthError, TokenInfo, get_token, request_token
+from sac_connector.pool import PoolError, get_pool, uses_proxy
+from sac_connector.ratelimit import AdaptiveRateLimiter, get_limiter, parse_retry_after
+from sac_connector.recorder import RecorderError, ResponseRecorder, default_recorder
 from config import Config
 
 
@@ -14,10 +24,11 @@ class ExportError(Exception):
 
 
 class ExportHttpError(Exception):
-    def __init__(self, status: int, body: str):
+    def __init__(self, status: int, body: str, retry_after: Optional[float] = None):
         super().__init__(f"HTTP {status}")
         self.status = status
         self.body = body
+        self.retry_after = retry_after
 
 
 @dataclass(frozen=True)
@@ -27,21 +38,101 @@ class ExportRequest:
     headers: Dict[str, str]
 
 
-def _request_json(url: str, headers: Dict[str, str], timeout: int) -> Dict:
+@dataclass(frozen=True)
+class PageTiming:
+    page: int
+    rows: int
+    # Network round trip including retries and JSON decode.
+    fetch_seconds: float
+    # Row extraction plus the time the consumer spent before asking for the next page.
+    parse_seconds: float
+
+
+_ACCEPT_ENCODING = "gzip, deflate"
+_CHUNK_SIZE = 64 * 1024
+
+
+def _deflate_wbits(first_chunk: bytes) -> int:
+    # "deflate" is meant to be zlib-wrapped, but some servers send raw deflate streams.
+    if len(first_chunk) >= 2 and first_chunk[0] & 0x0F == 8:
+        if ((first_chunk[0] << 8) | first_chunk[1]) % 31 == 0:
+            return zlib.MAX_WBITS
+    return -zlib.MAX_WBITS
+
+
+def _decode_chunks(chunks: Iterable[bytes], content_encoding: Optional[str]) -> bytes:
+    """Decompress a response body chunk by chunk as it is read.
+
+    Only the decompressed document is accumulated (json.loads needs all of it); compressed
+    chunks are dropped as soon as they are inflated.
+    """
+    encoding = (content_encoding or "identity").strip().lower()
+    if encoding in ("", "identity"):
+        return b"".join(chunks)
+    if encoding not in ("gzip", "x-gzip", "deflate"):
+        raise ExportError(f"Export failed: unsupported Content-Encoding '{encoding}'.")
+    decoder = None
+    parts: List[bytes] = []
+    try:
+        for chunk in chunks:
+            if decoder is None:
+                if encoding == "deflate":
+                    decoder = zlib.decompressobj(_deflate_wbits(bytes(chunk[:2])))
+                else:
+                    decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            parts.append(decoder.decompress(chunk))
+        if decoder is not None:
+            parts.append(decoder.flush())
+    except zlib.error as exc:
+        raise ExportError("Export failed: corrupt compressed response.") from exc
+    return b"".join(parts)
+
+
+def _read_urllib(url: str, headers: Dict[str, str], timeout: int) -> str:
     req = request.Request(url, headers=headers, method="GET")
     try:
         with request.urlopen(req, timeout=timeout) as resp:
-            payload = resp.read().decode("utf-8")
+            chunks = iter(lambda: resp.read(_CHUNK_SIZE), b"")
+            return _decode_chunks(chunks, resp.headers.get("Content-Encoding")).decode("utf-8")
     except error.HTTPError as exc:
         body = ""
         try:
-            body = exc.read().decode("utf-8")
+            encoding = exc.headers.get("Content-Encoding") if exc.headers else None
+            body = _decode_chunks([exc.read()], encoding).decode("utf-8")
         except Exception:
             body = ""
-        raise ExportHttpError(exc.code, body) from exc
+        retry_after = parse_retry_after(exc.headers.get("Retry-After") if exc.headers else None)
+        raise ExportHttpError(exc.code, body, retry_after=retry_after) from exc
     except error.URLError as exc:
         raise ExportError(f"Export failed: {exc.reason}") from exc
 
+
+def _read_pooled(url: str, headers: Dict[str, str], timeout: int) -> str:
+    try:
+        with get_pool().stream("GET", url, headers=headers, timeout=timeout) as response:
+            encoding = response.headers.get("content-encoding")
+            if response.status >= 400:
+                try:
+                    raw = _decode_chunks([response.read()], encoding)
+                except ExportError:
+                    raw = b""
+                body = raw.decode("utf-8", errors="replace")
+                retry_after = parse_retry_after(response.headers.get("retry-after"))
+                raise ExportHttpError(response.status, body, retry_after=retry_after)
+            raw = _decode_chunks(response.iter_chunks(_CHUNK_SIZE), encoding)
+    except PoolError as exc:
+        raise ExportError(f"Export failed: {exc}") from exc
+    return raw.decode("utf-8", errors="replace")
+
+
+def _request_json(url: str, headers: Dict[str, str], timeout: int) -> Dict:
+    headers = {"Accept-Encoding": _ACCEPT_ENCODING, **headers}
+    # Keep-alive pool for direct connections; proxied environments go through urllib.
+    if uses_proxy(url):
+        payload = _read_urllib(url, headers, timeout)
+    else:
+        payload = _read_pooled(url, headers, timeout)
+
     try:
         return json.loads(payload)
     except json.JSONDecodeError as exc:
@@ -61,16 +152,27 @@ def request_json_with_retry(
     headers: Dict[str, str],
     timeout: int = 30,
     max_attempts: int = 5,
+    limiter: Optional[AdaptiveRateLimiter] = None,
 ) -> Dict:
+    limiter = limiter or get_limiter()
     for attempt in range(1, max_attempts + 1):
+        limiter.acquire()
         try:
-            return _request_json(url, headers=headers, timeout=timeout)
+            payload = _request_json(url, headers=headers, timeout=timeout)
         except ExportHttpError as exc:
+            if _should_retry(exc.status):
+                limiter.record_throttle(exc.status, exc.retry_after)
             if not _should_retry(exc.status) or attempt == max_attempts:
                 message = exc.body.strip() or f"HTTP {exc.status}"
                 raise ExportError(f"Export failed ({exc.status}): {message}") from exc
-            sleep_seconds = _retry_backoff(attempt)
-            time.sleep(sleep_seconds)
+            # A Retry-After pause is enforced by the shared limiter on the next acquire(); when
+            # it is shorter than the backoff (e.g. Retry-After: 0) the backoff still applies.
+            backoff = _retry_backoff(attempt)
+            if exc.retry_after is None or exc.retry_after < backoff:
+                time.sleep(backoff)
+            continue
+        limiter.record_success()
+        return payload
     raise ExportError("Export failed: retries exhausted.")
 
 
@@ -171,6 +273,130 @@ def normalize_rows(
     return normalized
 
 
+# Date layouts recognized for a whole column; mirrors the branches of _normalize_date.
+_DATE_PATTERNS = {
+    "timestamp": r"\d{4}-\d{2}-\d{2}T.*",
+    "iso": r"\d{4}-\d{2}-\d{2}",
+    "year_month": r"\d{4}-\d{2}",
+    "year": r"\d{4}",
+    "quarter": r"\d{4}-?Q[1-4]",
+}
+
+
+def _detect_date_format(text: pd.Series) -> Optional[str]:
+    sample = text.dropna()
+    sample = sample[sample != ""]
+    if sample.empty:
+        return None
+    first = sample.iloc[0]
+    for name, pattern in _DATE_PATTERNS.items():
+        if re.fullmatch(pattern, first):
+            return name
+    return None
+
+
+def _convert_dates(text: pd.Series, fmt: str) -> pd.Series:
+    """ISO dates for rows matching `fmt`; other rows are left missing for the fallback."""
+    matching = text.where(text.str.fullmatch(_DATE_PATTERNS[fmt]).fillna(False).astype(bool))
+    if fmt in ("timestamp", "iso"):
+        parsed = pd.to_datetime(matching.str.slice(0, 10), format="%Y-%m-%d", errors="coerce")
+    elif fmt == "year_month":
+        parsed = pd.to_datetime(matching, format="%Y-%m", errors="coerce")
+    elif fmt == "year":
+        parsed = pd.to_datetime(matching, format="%Y", errors="coerce")
+    else:
+        quarter = pd.to_numeric(matching.str.slice(-1), errors="coerce")
+        month = ((quarter - 1) * 3 + 1).astype("Int64").astype(str).str.zfill(2)
+        year_month = matching.str.slice(0, 4) + "-" + month
+        parsed = pd.to_datetime(year_month, format="%Y-%m", errors="coerce")
+    return parsed.dt.strftime("%Y-%m-%d")
+
+
+def _normalize_date_column(values: pd.Series, grain: str) -> pd.Series:
+    # Exports repeat a few hundred periods across many rows: convert each distinct value once.
+    codes, uniques = pd.factorize(values)
+    if (codes < 0).any():
+        _normalize_date(None, grain)
+    distinct = pd.Series(np.asarray(uniques, dtype=object))
+    text = distinct.astype(str).str.strip()
+    fmt = _detect_date_format(text)
+    converted = _convert_dates(text, fmt) if fmt else pd.Series(index=text.index, dtype=object)
+    converted = converted.astype(object)
+    outliers = converted.isna()
+    if outliers.any():
+        # Values that do not match the column's layout go through the per-value parser;
+        # invalid values raise exactly as in normalize_rows.
+        converted[outliers] = [_normalize_date(value, grain) for value in distinct[outliers]]
+    return pd.Series(converted.to_numpy()[codes], index=values.index, dtype=object)
+
+
+def normalize_frame(
+    rows: Union[Sequence[Dict], pd.DataFrame],
+    date_field: str,
+    value_field: str,
+    dim_fields: Sequence[str],
+    grain: str = "month",
+) -> pd.DataFrame:
+    """Column-wise normalize_rows: same output columns, returned as a DataFrame.
+
+    The date layout is detected once per column and converted vectorized; only rows that
+    do not match it fall back to the per-value parser.
+    """
+    if isinstance(rows, pd.DataFrame):
+        frame = rows
+        if date_field not in frame.columns or value_field not in frame.columns:
+            raise ExportError("Normalization failed: missing date or value field.")
+        dims = {dim: frame[dim].tolist() for dim in dim_fields if dim in frame.columns}
+    else:
+        if any(date_field not in row or value_field not in row for row in rows):
+            raise ExportError("Normalization failed: missing date or value field.")
+        # Only the needed fields are gathered, column by column, instead of whole rows.
+        fields = dict.fromkeys([date_field, value_field])
+        frame = pd.DataFrame({field: [row.get(field) for row in rows] for field in fields})
+        # Dimension members stay Python objects: a DataFrame column would turn [1, None]
+        # into floats and change the member strings.
+        dims = {dim: [row.get(dim) for row in rows] for dim in dim_fields}
+    if frame.empty:
+        return pd.DataFrame(columns=["date", "value"] + [f"dim_{dim}" for dim in dim_fields])
+
+    out = pd.DataFrame(index=frame.index)
+    out["date"] = _normalize_date_column(frame[date_field], grain)
+    raw_values = frame[value_field]
+    values = pd.to_numeric(raw_values, errors="coerce").astype(float)
+    bad = values.isna() & raw_values.notna()
+    if bad.any():
+        # float() accepts spellings to_numeric rejects (e.g. "inf", " 1e3 ") and raises otherwise.
+        values[bad] = [float(value) for value in raw_values[bad]]
+    missing = raw_values.isna()
+    if missing.any():
+        # None raises TypeError as in normalize_rows; float NaN passes through unchanged.
+        float(raw_values[missing].iloc[0])
+    out["value"] = values
+    for dim in dim_fields:
+        out[f"dim_{dim}"] = _dim_strings(dims[dim]) if dim in dims else ""
+    return out.reset_index(drop=True)
+
+
+def _dim_strings(values: Sequence) -> List[str]:
+    """Apply normalize_rows' member rule (None -> "", else str()) once per distinct member."""
+    strings: Dict[Tuple[type, object], str] = {}
+    result = []
+    for value in values:
+        if value is None:
+            result.append("")
+            continue
+        # Keyed by type as well, since 1 == 1.0 == True but their strings differ.
+        key = (type(value), value)
+        try:
+            text = strings.get(key)
+            if text is None:
+                text = strings[key] = str(value)
+        except TypeError:  # unhashable member
+            text = str(value)
+        result.append(text)
+    return result
+
+
 def _build_headers(token_info: TokenInfo) -> Dict[str, str]:
     return {
         "Authorization": f"{token_info.token_type} {token_info.access_token}",
@@ -188,31 +414,188 @@ def build_export_request(
     return ExportRequest(url=full_url, params=params or {}, headers=_build_headers(token_info))
 
 
+_PREFETCH_DONE = object()
+
+
+def _fetch_payload(
+    url: str,
+    headers: Dict[str, str],
+    timeout: int,
+    max_attempts: int,
+    recorder: Optional[ResponseRecorder],
+) -> Dict:
+    if recorder is None:
+        return request_json_with_retry(
+            url, headers=headers, timeout=timeout, max_attempts=max_attempts
+        )
+    try:
+        if recorder.replaying:
+            payload = recorder.load(url)
+            if payload is None:
+                raise ExportError(f"Export failed: no recorded response for {url}")
+            return payload
+        payload = request_json_with_retry(
+            url, headers=headers, timeout=timeout, max_attempts=max_attempts
+        )
+        recorder.save(url, payload)
+        return payload
+    except RecorderError as exc:
+        raise ExportError(f"Export failed: {exc}") from exc
+
+
+def resolve_recorder(recorder: Optional[ResponseRecorder] = None) -> Optional[ResponseRecorder]:
+    """Return `recorder` or the one set by SAC_RESPONSE_CACHE; bad settings raise ExportError."""
+    if recorder is not None:
+        return recorder
+    try:
+        return default_recorder()
+    except RecorderError as exc:
+        raise ExportError(f"Export failed: {exc}") from exc
+
+
+def _sequential_payloads(
+    url: str,
+    headers: Dict[str, str],
+    timeout: int,
+    max_attempts: int,
+    recorder: Optional[ResponseRecorder] = None,
+) -> Iterator[Tuple[Dict, float]]:
+    next_url: Optional[str] = url
+    while next_url:
+        started = time.perf_counter()
+        payload = _fetch_payload(next_url, headers, timeout, max_attempts, recorder)
+        yield payload, time.perf_counter() - started
+        next_url = _next_url(payload, next_url)
+
+
+def _prefetched_payloads(
+    url: str,
+    headers: Dict[str, str],
+    timeout: int,
+    max_attempts: int,
+    depth: int,
+    recorder: Optional[ResponseRecorder] = None,
+) -> Iterator[Tuple[Dict, float]]:
+    buffer: "queue.Queue[object]" = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def _offer(item: object) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce() -> None:
+        try:
+            for item in _sequential_payloads(url, headers, timeout, max_attempts, recorder):
+                if not _offer(item):
+                    return
+        except BaseException as exc:
+            _offer(exc)
+            return
+        _offer(_PREFETCH_DONE)
+
+    producer = threading.Thread(target=_produce, name="sac-page-prefetch", daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _PREFETCH_DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+
+
+def iter_pages(
+    url: str,
+    headers: Dict[str, str],
+    timeout: int = 30,
+    max_attempts: int = 5,
+    prefetch: int = 0,
+    timings: Optional[List[PageTiming]] = None,
+    recorder: Optional[ResponseRecorder] = None,
+) -> Iterator[List[Dict]]:
+    """Yield the rows of each page, following server-driven next links.
+
+    With prefetch > 0 a background thread fetches up to that many pages ahead while
+    the caller processes the current one. Per-page timings are appended to `timings`.
+    A `recorder` records raw page payloads to disk or replays them without network access.
+    """
+    if prefetch > 0:
+        payloads = _prefetched_payloads(url, headers, timeout, max_attempts, prefetch, recorder)
+    else:
+        payloads = _sequential_payloads(url, headers, timeout, max_attempts, recorder)
+
+    try:
+        for index, (payload, fetch_seconds) in enumerate(payloads):
+            started = time.perf_counter()
+            page_rows = _extract_rows(payload)
+            try:
+                yield page_rows
+            finally:
+                if timings is not None:
+                    timings.append(
+                        PageTiming(
+                            page=index,
+                            rows=len(page_rows),
+                            fetch_seconds=fetch_seconds,
+                            parse_seconds=time.perf_counter() - started,
+                        )
+                    )
+    finally:
+        payloads.close()
+
+
+def iter_export_pages(
+    config: Config,
+    export_url: str,
+    params: Optional[Dict[str, str]] = None,
+    timeout: int = 30,
+    max_attempts: int = 5,
+    recorder: Optional[ResponseRecorder] = None,
+) -> Iterator[List[Dict]]:
+    recorder = resolve_recorder(recorder)
+    if recorder is not None and recorder.replaying:
+        url, headers = _append_query(export_url, params or {}), {}
+    else:
+        try:
+            token_info = get_token(config, fetch=request_token)
+        except AuthError as exc:
+            raise ExportError(str(exc)) from exc
+        export_request = build_export_request(export_url, params, token_info)
+        url, headers = export_request.url, export_request.headers
+
+    yield from iter_pages(
+        url,
+        headers=headers,
+        timeout=timeout,
+        max_attempts=max_attempts,
+        recorder=recorder,
+    )
+
+
 def export_all(
     config: Config,
     export_url: str,
     params: Optional[Dict[str, str]] = None,
     timeout: int = 30,
     max_attempts: int = 5,
+    recorder: Optional[ResponseRecorder] = None,
 ) -> List[Dict]:
-    try:
-        token_info = request_token(config)
-    except AuthError as exc:
-        raise ExportError(str(exc)) from exc
-
-    export_request = build_export_request(export_url, params, token_info)
     rows: List[Dict] = []
-    next_url: Optional[str] = export_request.url
-
-    while next_url:
-        payload = request_json_with_retry(
-            next_url,
-            headers=export_request.headers,
-            timeout=timeout,
-            max_attempts=max_attempts,
-        )
-        page_rows = _extract_rows(payload)
+    for page_rows in iter_export_pages(
+        config,
+        export_url,
+        params=params,
+        timeout=timeout,
+        max_attempts=max_attempts,
+        recorder=recorder,
+    ):
         rows.extend(page_rows)
-        next_url = _next_url(payload, next_url)
-
     return rows
@@ -0,0 +1,209 @@
+import http.client
+import os
+import threading
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Deque, Dict, Iterator, Optional, Tuple
+from urllib import parse, request
+
+
+DEFAULT_POOL_SIZE = int(os.getenv("SAC_HTTP_POOL_SIZE", "4"))
+_MAX_REDIRECTS = 5
+_REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+# Errors that indicate the server dropped an idle keep-alive connection.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+HostKey = Tuple[str, str, int]
+
+
+class PoolError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class HttpResponse:
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+
+
+class StreamedResponse:
+    """Response whose body is read from the socket on demand."""
+
+    def __init__(self, resp: http.client.HTTPResponse):
+        self._resp = resp
+        self.status = resp.status
+        self.headers = {name.lower(): value for name, value in resp.getheaders()}
+
+    def read(self, amt: Optional[int] = None) -> bytes:
+        try:
+            return self._resp.read(amt)
+        except (OSError, http.client.HTTPException) as exc:
+            raise PoolError(str(exc) or exc.__class__.__name__) from exc
+
+    def iter_chunks(self, size: int) -> Iterator[bytes]:
+        while True:
+            chunk = self.read(size)
+            if not chunk:
+                return
+            yield chunk
+
+
+def _host_key(url: str) -> HostKey:
+    parsed = parse.urlsplit(url)
+    scheme = parsed.scheme.lower()
+    if scheme not in ("http", "https"):
+        raise PoolError(f"Unsupported URL scheme: {parsed.scheme or url}")
+    if not parsed.hostname:
+        raise PoolError(f"Missing host in URL: {url}")
+    port = parsed.port or (443 if scheme == "https" else 80)
+    return scheme, parsed.hostname, port
+
+
+def _request_target(url: str) -> str:
+    parsed = parse.urlsplit(url)
+    target = parsed.path or "/"
+    if parsed.query:
+        target = f"{target}?{parsed.query}"
+    return target
+
+
+class ConnectionPool:
+    """Keep-alive HTTP(S) connections, bounded per host and shared across threads."""
+
+    def __init__(self, max_per_host: int = DEFAULT_POOL_SIZE):
+        self.max_per_host = max(1, max_per_host)
+        self._lock = threading.Lock()
+        self._idle: Dict[HostKey, Deque[http.client.HTTPConnection]] = {}
+
+    def _new_connection(self, key: HostKey, timeout: float) -> http.client.HTTPConnection:
+        scheme, host, port = key
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=timeout)
+        return http.client.HTTPConnection(host, port, timeout=timeout)
+
+    def _acquire(self, key: HostKey, timeout: float) -> Tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                conn = idle.pop()
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                return conn, True
+        return self._new_connection(key, timeout), False
+
+    def _release(self, key: HostKey, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, deque())
+            if len(idle) < self.max_per_host:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def _open(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        timeout: float,
+    ) -> Tuple[HostKey, http.client.HTTPConnection, http.client.HTTPResponse]:
+        key = _host_key(url)
+        target = _request_target(url)
+        conn, reused = self._acquire(key, timeout)
+        try:
+            try:
+                conn.request(method, target, headers=headers)
+                return key, conn, conn.getresponse()
+            except _STALE_CONNECTION_ERRORS:
+                conn.close()
+                if not reused:
+                    raise
+                conn = self._new_connection(key, timeout)
+                conn.request(method, target, headers=headers)
+                return key, conn, conn.getresponse()
+        except (OSError, http.client.HTTPException) as exc:
+            conn.close()
+            raise PoolError(str(exc) or exc.__class__.__name__) from exc
+
+    def _finish(
+        self, key: HostKey, conn: http.client.HTTPConnection, resp: http.client.HTTPResponse
+    ) -> None:
+        # Only a fully drained keep-alive response leaves the connection reusable.
+        if resp.isclosed() and not resp.will_close:
+            self._release(key, conn)
+        else:
+            conn.close()
+
+    @contextmanager
+    def stream(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 30,
+    ) -> Iterator[StreamedResponse]:
+        """Follow redirects and yield the final response with its body still on the socket.
+
+        The connection returns to the pool when the block exits after the body was read to
+        the end; otherwise it is closed.
+        """
+        current_url = url
+        for _ in range(_MAX_REDIRECTS + 1):
+            key, conn, resp = self._open(method, current_url, headers or {}, timeout)
+            location = resp.getheader("location")
+            if resp.status in _REDIRECT_STATUSES and location:
+                try:
+                    resp.read()
+                except (OSError, http.client.HTTPException):
+                    pass
+                self._finish(key, conn, resp)
+                current_url = parse.urljoin(current_url, location)
+                continue
+            try:
+                yield StreamedResponse(resp)
+            finally:
+                self._finish(key, conn, resp)
+            return
+        raise PoolError(f"Too many redirects for {url}")
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 30,
+    ) -> HttpResponse:
+        with self.stream(method, url, headers, timeout) as response:
+            body = response.read()
+        return HttpResponse(status=response.status, headers=response.headers, body=body)
+
+    def close(self) -> None:
+        with self._lock:
+            idle_lists = list(self._idle.values())
+            self._idle = {}
+        for idle in idle_lists:
+            for conn in idle:
+                conn.close()
+
+
+_POOL = ConnectionPool()
+
+
+def get_pool() -> ConnectionPool:
+    return _POOL
+
+
+def uses_proxy(url: str) -> bool:
+    scheme = parse.urlsplit(url).scheme.lower()
+    proxies = request.getproxies()
+    if scheme not in proxies:
+        return False
+    host = parse.urlsplit(url).hostname or ""
+    return not request.proxy_bypass(host)
@@ -0,0 +1,125 @@
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Optional
+
+
+DEFAULT_RATE_PER_SECOND = float(os.getenv("SAC_RATE_LIMIT_RPS", "10"))
+DEFAULT_MIN_RATE_PER_SECOND = 0.5
+MAX_RETRY_AFTER_SECONDS = 120.0
+
+
+def parse_retry_after(
+    value: Optional[str],
+    cap_seconds: float = MAX_RETRY_AFTER_SECONDS,
+) -> Optional[float]:
+    """Parse a Retry-After header (delta seconds or HTTP date) into seconds to wait."""
+    if not value:
+        return None
+    text = value.strip()
+    try:
+        seconds = float(text)
+    except ValueError:
+        try:
+            when = parsedate_to_datetime(text)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        seconds = (when - datetime.now(timezone.utc)).total_seconds()
+    return min(cap_seconds, max(0.0, seconds))
+
+
+class AdaptiveRateLimiter:
+    """Token bucket shared by concurrent callers with AIMD rate adaptation.
+
+    Each throttled response (429/5xx) halves the rate down to `min_rate`; each success
+    adds `increase` back up to `max_rate`. A Retry-After pauses every caller.
+    """
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE_PER_SECOND,
+        burst: Optional[float] = None,
+        min_rate: float = DEFAULT_MIN_RATE_PER_SECOND,
+        max_rate: Optional[float] = None,
+        increase: float = 0.5,
+        decrease: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.max_rate = max_rate or rate
+        self.min_rate = min(min_rate, self.max_rate)
+        self.rate = min(rate, self.max_rate)
+        self.burst = burst or max(1.0, self.max_rate)
+        self.increase = increase
+        self.decrease = decrease
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._counters = {
+            "requests": 0,
+            "successes": 0,
+            "throttled": 0,
+            "server_errors": 0,
+            "retry_after_honored": 0,
+            "wait_seconds": 0.0,
+        }
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated)
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def acquire(self) -> float:
+        """Reserve one request slot, sleeping as needed. Returns the seconds waited."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens -= 1
+            wait = 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+            wait = max(wait, self._paused_until - now)
+            self._counters["requests"] += 1
+            self._counters["wait_seconds"] += wait
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._counters["successes"] += 1
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def record_throttle(self, status: int, retry_after: Optional[float] = None) -> None:
+        with self._lock:
+            if status == 429:
+                self._counters["throttled"] += 1
+            else:
+                self._counters["server_errors"] += 1
+            now = self._clock()
+            self._refill(now)
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            if retry_after is not None:
+                self._counters["retry_after_honored"] += 1
+                self._paused_until = max(self._paused_until, now + retry_after)
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            return {**self._counters, "rate": self.rate}
+
+
+_LIMITER = AdaptiveRateLimiter()
+
+
+def get_limiter() -> AdaptiveRateLimiter:
+    return _LIMITER
+
+
+def set_limiter(limiter: AdaptiveRateLimiter) -> None:
+    global _LIMITER
+    _LIMITER = limiter
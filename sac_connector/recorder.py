@@ -0,0 +1,91 @@
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+from typing import Dict, Optional
+from urllib import parse
+
+
+RECORD = "record"
+REPLAY = "replay"
+_MODES = {RECORD, REPLAY}
+DEFAULT_RECORDER_DIR = "data/cache/des_responses"
+
+
+class RecorderError(Exception):
+    pass
+
+
+def normalize_url(url: str) -> str:
+    """Canonical form of a request URL: lower-cased scheme/host and sorted query parameters."""
+    parsed = parse.urlsplit(url)
+    query = sorted(parse.parse_qsl(parsed.query, keep_blank_values=True))
+    return parse.urlunsplit(
+        (
+            parsed.scheme.lower(),
+            parsed.netloc.lower(),
+            parsed.path or "/",
+            parse.urlencode(query),
+            "",
+        )
+    )
+
+
+def response_key(url: str) -> str:
+    return hashlib.sha256(normalize_url(url).encode("utf-8")).hexdigest()
+
+
+class ResponseRecorder:
+    """On-disk store of raw DES page payloads keyed by normalized request URL.
+
+    In record mode pages are fetched live and written; in replay mode pages are served from
+    disk only and a missing page is an error (no network, no token request).
+    """
+
+    def __init__(self, root: str = DEFAULT_RECORDER_DIR, mode: str = REPLAY):
+        if mode not in _MODES:
+            raise RecorderError(f"Unsupported recorder mode '{mode}'. Allowed: record, replay.")
+        self.root = root
+        self.mode = mode
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == REPLAY
+
+    def path_for(self, url: str) -> str:
+        key = response_key(url)
+        return os.path.join(self.root, key[:2], f"{key}.json.gz")
+
+    def load(self, url: str) -> Optional[Dict]:
+        path = self.path_for(url)
+        if not os.path.exists(path):
+            return None
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as handle:
+                entry = json.load(handle)
+        except (OSError, json.JSONDecodeError) as exc:
+            raise RecorderError(f"Recorded response is corrupt: {path}") from exc
+        return entry["payload"]
+
+    def save(self, url: str, payload: Dict) -> None:
+        path = self.path_for(url)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        entry = {"url": normalize_url(url), "payload": payload}
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb") as handle:
+                handle.write(json.dumps(entry).encode("utf-8"))
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+
+def default_recorder() -> Optional[ResponseRecorder]:
+    mode = os.getenv("SAC_RESPONSE_CACHE", "").strip().lower()
+    if not mode or mode == "off":
+        return None
+    root = os.getenv("SAC_RESPONSE_CACHE_DIR", "").strip() or DEFAULT_RECORDER_DIR
+    return ResponseRecorder(root=root, mode=mode)
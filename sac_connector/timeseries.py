@@ -1,12 +1,15 @@
-from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 from urllib import parse
 
 import pandas as pd
 
 from config import Config, load_config
-from sac_connector.auth import AuthError, TokenInfo, request_token
-from sac_connector.export import ExportError, _extract_rows, _next_url, request_json_with_retry
+from sac_connector.auth import AuthError, TokenInfo, get_token, request_token
+from sac_connector.columnar import ColumnarRows
+from sac_connector.export import ExportError, PageTiming, iter_pages, resolve_recorder
+from sac_connector.recorder import ResponseRecorder
 
 
 DEFAULT_DIM_FIELDS = [
@@ -21,6 +24,8 @@ DEFAULT_DIM_FIELDS = [
     "CostCenters",
     "Positions",
 ]
+# Dimension columns that fetch_timeseries can return as categoricals (Date stays a string).
+_CATEGORICAL_DIMS = [field for field in DEFAULT_DIM_FIELDS if field != "Date"]
 
 
 @dataclass(frozen=True)
@@ -28,6 +33,11 @@ class SliceSpec:
     measure: str
     filters: Dict[str, str]
     orderby: str = "Date asc"
+    # Inclusive YYYYMM bounds on the Date dimension.
+    date_from: Optional[str] = None
+    date_to: Optional[str] = None
+    # Further measure columns selected in the same request (e.g. Cost next to SignedData).
+    extra_measures: Tuple[str, ...] = ()
 
 
 DEFAULT_SLICE = SliceSpec(
@@ -46,11 +56,74 @@ DEFAULT_SLICE = SliceSpec(
 )
 
 
-def _build_filter_clause(filters: Dict[str, str]) -> str:
+def _build_filter_clause(
+    filters: Dict[str, str],
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+) -> str:
     parts = [f"{key} eq '{value}'" for key, value in filters.items()]
+    if date_from:
+        parts.append(f"Date ge '{date_from}'")
+    if date_to:
+        parts.append(f"Date le '{date_to}'")
     return " and ".join(parts)
 
 
+def _month_ordinal(yyyymm: str) -> int:
+    if len(yyyymm) != 6 or not yyyymm.isdigit() or not 1 <= int(yyyymm[4:]) <= 12:
+        raise ValueError(f"Invalid month (expected YYYYMM): {yyyymm}")
+    return int(yyyymm[:4]) * 12 + int(yyyymm[4:]) - 1
+
+
+def _month_label(ordinal: int) -> str:
+    return f"{ordinal // 12:04d}{ordinal % 12 + 1:02d}"
+
+
+def split_by_date(slice_spec: SliceSpec, start: str, end: str, parts: int) -> List[SliceSpec]:
+    """Split [start, end] (YYYYMM, inclusive) into up to `parts` contiguous, disjoint sub-slices."""
+    first = _month_ordinal(start)
+    last = _month_ordinal(end)
+    if first > last:
+        raise ValueError("start must be <= end")
+    months = last - first + 1
+    parts = max(1, min(parts, months))
+    size, extra = divmod(months, parts)
+    partitions = []
+    cursor = first
+    for index in range(parts):
+        span = size + (1 if index < extra else 0)
+        partitions.append(
+            replace(
+                slice_spec,
+                date_from=_month_label(cursor),
+                date_to=_month_label(cursor + span - 1),
+            )
+        )
+        cursor += span
+    return partitions
+
+
+def split_by_members(
+    slice_spec: SliceSpec,
+    dimension: str,
+    members: Sequence[str],
+) -> List[SliceSpec]:
+    """One sub-slice per dimension member; members must be distinct for the split to be disjoint."""
+    if dimension == "Date":
+        raise ValueError("Use split_by_date to partition on Date.")
+    if len(set(members)) != len(members):
+        raise ValueError(f"Duplicate members for {dimension}.")
+    pinned = slice_spec.filters.get(dimension)
+    if pinned is not None and any(member != pinned for member in members):
+        raise ValueError(
+            f"Slice already filters {dimension}={pinned!r}; drop that filter before splitting."
+        )
+    return [
+        replace(slice_spec, filters={**slice_spec.filters, dimension: member})
+        for member in members
+    ]
+
+
 def _build_headers(token_info: TokenInfo) -> Dict[str, str]:
     return {
         "Authorization": f"{token_info.token_type} {token_info.access_token}",
@@ -59,50 +132,179 @@ def _build_headers(token_info: TokenInfo) -> Dict[str, str]:
     }
 
 
-def fetch_timeseries(
+def _fact_data_request(
     provider_id: str,
-    namespace_id: str = "sac",
-    config: Optional[Config] = None,
-    slice_spec: SliceSpec = DEFAULT_SLICE,
-    max_rows: Optional[int] = None,
-    page_size: Optional[int] = None,
-    timeout: int = 30,
-    max_attempts: int = 5,
-) -> pd.DataFrame:
-    cfg = config or load_config()
+    namespace_id: str,
+    cfg: Config,
+    slice_spec: SliceSpec,
+    authenticate: bool = True,
+) -> Tuple[str, Dict[str, str]]:
     if not cfg.tenant_url:
         raise ExportError("Missing SAC_TENANT_URL for timeseries fetch.")
 
-    try:
-        token_info = request_token(cfg)
-    except AuthError as exc:
-        raise ExportError(str(exc)) from exc
+    headers: Dict[str, str] = {}
+    if authenticate:
+        try:
+            headers = _build_headers(get_token(cfg, fetch=request_token))
+        except AuthError as exc:
+            raise ExportError(str(exc)) from exc
 
-    select_fields = DEFAULT_DIM_FIELDS + [slice_spec.measure]
+    select_fields = DEFAULT_DIM_FIELDS + [slice_spec.measure, *slice_spec.extra_measures]
     params = {
         "$select": ",".join(select_fields),
-        "$filter": _build_filter_clause(slice_spec.filters),
+        "$filter": _build_filter_clause(
+            slice_spec.filters, slice_spec.date_from, slice_spec.date_to
+        ),
         "$orderby": slice_spec.orderby,
     }
     base_url = (
         f"{cfg.tenant_url.rstrip('/')}/api/v1/dataexport/providers/"
         f"{namespace_id}/{provider_id}/FactData"
     )
-    headers = _build_headers(token_info)
+    return base_url + "?" + parse.urlencode(params), headers
+
+
+def iter_fact_pages(
+    provider_id: str,
+    namespace_id: str = "sac",
+    config: Optional[Config] = None,
+    slice_spec: SliceSpec = DEFAULT_SLICE,
+    max_rows: Optional[int] = None,
+    timeout: int = 30,
+    max_attempts: int = 5,
+    prefetch: int = 0,
+    timings: Optional[List[PageTiming]] = None,
+    recorder: Optional[ResponseRecorder] = None,
+) -> Iterator[List[Dict]]:
+    """Yield FactData rows page by page so callers never hold the full slice in memory."""
+    cfg = config or load_config()
+    recorder = resolve_recorder(recorder)
+    # Replays are served from disk, so no token round trip is needed.
+    authenticate = recorder is None or not recorder.replaying
+    url, headers = _fact_data_request(
+        provider_id, namespace_id, cfg, slice_spec, authenticate=authenticate
+    )
 
-    rows: List[Dict] = []
-    next_url: Optional[str] = base_url + "?" + parse.urlencode(params)
+    remaining = max_rows
     # Prefer server-driven paging; avoid $skip/$top loops when possible.
-    while next_url:
-        payload = request_json_with_retry(
-            next_url, headers=headers, timeout=timeout, max_attempts=max_attempts
-        )
-        page_rows = _extract_rows(payload)
-        rows.extend(page_rows)
-        if max_rows and len(rows) >= max_rows:
-            rows = rows[:max_rows]
+    for page_rows in iter_pages(
+        url,
+        headers=headers,
+        timeout=timeout,
+        max_attempts=max_attempts,
+        prefetch=prefetch,
+        timings=timings,
+        recorder=recorder,
+    ):
+        if max_rows:
+            page_rows = page_rows[:remaining]
+            remaining -= len(page_rows)
+        yield page_rows
+        if max_rows and remaining <= 0:
             break
-        if next_url:
-            next_url = _next_url(payload, next_url)
 
-    return pd.DataFrame(rows)
+
+def _fetch_partitions(
+    provider_id: str,
+    namespace_id: str,
+    cfg: Config,
+    partitions: Sequence[SliceSpec],
+    max_workers: int,
+    timeout: int,
+    max_attempts: int,
+    prefetch: int = 0,
+    timings: Optional[List[PageTiming]] = None,
+    recorder: Optional[ResponseRecorder] = None,
+) -> ColumnarRows:
+    def _fetch_one(partition: SliceSpec) -> Tuple[ColumnarRows, List[PageTiming]]:
+        columns = ColumnarRows(categorical=_CATEGORICAL_DIMS)
+        page_timings: List[PageTiming] = []
+        for page_rows in iter_fact_pages(
+            provider_id,
+            namespace_id=namespace_id,
+            config=cfg,
+            slice_spec=partition,
+            timeout=timeout,
+            max_attempts=max_attempts,
+            prefetch=prefetch,
+            timings=page_timings if timings is not None else None,
+            recorder=recorder,
+        ):
+            columns.add_page(page_rows)
+        return columns, page_timings
+
+    workers = max(1, max_workers)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sac-partition") as pool:
+        # map() returns results in partition order, so the merge is deterministic.
+        results = list(pool.map(_fetch_one, partitions))
+
+    merged = ColumnarRows(categorical=_CATEGORICAL_DIMS)
+    for columns, page_timings in results:
+        merged.extend(columns)
+        if timings is not None:
+            timings.extend(page_timings)
+    return merged
+
+
+def fetch_timeseries(
+    provider_id: str,
+    namespace_id: str = "sac",
+    config: Optional[Config] = None,
+    slice_spec: SliceSpec = DEFAULT_SLICE,
+    max_rows: Optional[int] = None,
+    page_size: Optional[int] = None,
+    timeout: int = 30,
+    max_attempts: int = 5,
+    prefetch: int = 0,
+    timings: Optional[List[PageTiming]] = None,
+    partitions: Optional[Sequence[SliceSpec]] = None,
+    max_workers: int = 4,
+    recorder: Optional[ResponseRecorder] = None,
+    categorical_dims: bool = False,
+) -> pd.DataFrame:
+    """Fetch a slice as a DataFrame.
+
+    When `partitions` is given (see split_by_date/split_by_members) they replace
+    `slice_spec` and are fetched concurrently on up to `max_workers` threads; `prefetch`
+    applies to each partition and `timings` collects their pages in partition order.
+    Column dtypes match pd.DataFrame(rows); dimension members are interned,
+    and `categorical_dims=True` returns the dimension columns other than Date as pandas
+    categoricals.
+    """
+    if partitions:
+        cfg = config or load_config()
+        columns = _fetch_partitions(
+            provider_id,
+            namespace_id,
+            cfg,
+            partitions,
+            max_workers,
+            timeout,
+            max_attempts,
+            prefetch=prefetch,
+            timings=timings,
+            recorder=recorder,
+        )
+        df = columns.to_frame(categorical=categorical_dims)
+        if max_rows:
+            df = df.iloc[:max_rows].reset_index(drop=True)
+        return df
+
+    # Pages are folded into column lists as they arrive; only the current page's row dicts
+    # (from json.loads) are alive at any time.
+    columns = ColumnarRows(categorical=_CATEGORICAL_DIMS)
+    for page_rows in iter_fact_pages(
+        provider_id,
+        namespace_id=namespace_id,
+        config=config,
+        slice_spec=slice_spec,
+        max_rows=max_rows,
+        timeout=timeout,
+        max_attempts=max_attempts,
+        prefetch=prefetch,
+        timings=timings,
+        recorder=recorder,
+    ):
+        columns.add_page(page_rows)
+
+    return columns.to_frame(categorical=categorical_dims)
@@ -0,0 +1,98 @@
+import os
+
+import pandas as pd
+
+from pipeline.artifacts import ArtifactCache, cached_rows, get_artifact_cache
+from pipeline.cache import build_meta, load_cache, save_cache
+
+
+def _write(path, text):
+    path.write_text(text, encoding="utf-8")
+
+
+def test_artifact_cache_hits_until_file_changes(tmp_path):
+    path = tmp_path / "data.csv"
+    _write(path, "a\n1\n")
+    cache = ArtifactCache(max_bytes=1024 * 1024)
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return pd.read_csv(path)
+
+    cache.get("frame", [str(path)], loader)
+    cache.get("frame", [str(path)], loader)
+    assert len(calls) == 1
+    assert cache.hits == 1
+
+    _write(path, "a\n1\n2\n")
+    frame = cache.get("frame", [str(path)], loader)
+    assert len(calls) == 2
+    assert len(frame) == 2
+
+
+def test_artifact_cache_evicts_least_recently_used(tmp_path):
+    paths = []
+    for idx in range(3):
+        path = tmp_path / f"f{idx}.txt"
+        _write(path, "x")
+        paths.append(str(path))
+    cache = ArtifactCache(max_bytes=2 * len(b"x" * 2000) + 2 * 200)
+    for path in paths:
+        cache.get("blob", [path], lambda: b"x" * 2000)
+    assert cache.size_bytes <= cache.max_bytes
+    calls = []
+    cache.get("blob", [paths[0]], lambda: calls.append(1) or b"x" * 2000)
+    assert calls == [1]
+
+
+def test_artifact_cache_missing_file_bypasses(tmp_path):
+    cache = ArtifactCache()
+    missing = str(tmp_path / "missing.csv")
+    assert cache.get("frame", [missing], lambda: "loaded") == "loaded"
+    assert cache.size_bytes == 0
+
+
+def test_cached_rows_returns_independent_copies(tmp_path):
+    path = tmp_path / "rows.csv"
+    _write(path, "a\n1\n")
+    first = cached_rows("rows_test", [str(path)], lambda: [{"a": "1"}])
+    first[0]["a"] = "changed"
+    second = cached_rows("rows_test", [str(path)], lambda: [{"a": "other"}])
+    assert second == [{"a": "1"}]
+
+
+def test_save_cache_invalidates_loaded_rows(tmp_path):
+    data_path = str(tmp_path / "cache" / "data.csv")
+    meta_path = str(tmp_path / "cache" / "meta.json")
+    rows = [{"date": "2020-01-01", "value": 1.0}]
+    save_cache(rows, build_meta(rows, source="test"), data_path=data_path, meta_path=meta_path)
+    loaded, _ = load_cache(data_path=data_path, meta_path=meta_path)
+    assert loaded[0]["value"] == "1.0"
+
+    stat = os.stat(data_path)
+    rows = [{"date": "2020-01-01", "value": 2.0}]
+    save_cache(rows, build_meta(rows, source="test"), data_path=data_path, meta_path=meta_path)
+    # Same size and a pinned mtime must not serve the stale rows.
+    os.utime(data_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    loaded, _ = load_cache(data_path=data_path, meta_path=meta_path)
+    assert loaded[0]["value"] == "2.0"
+    get_artifact_cache().invalidate()
+
+
+def test_date_index_is_sized_by_its_frame(tmp_path):
+    from pipeline.cache import _date_index
+
+    path = tmp_path / "series.csv"
+    dates = pd.date_range("2000-01-01", periods=2000, freq="D").strftime("%Y-%m-%d")
+    pd.DataFrame({"date": dates[::-1], "value": range(2000)}).to_csv(path, index=False)
+    index = _date_index(str(path), "csv")
+    frame_bytes = index.frame.memory_usage(deep=True).sum()
+
+    cache = ArtifactCache(max_bytes=int(frame_bytes * 1.5))
+    cache.get("cache_date_index", [str(path)], lambda: index)
+    assert cache.size_bytes >= frame_bytes
+    cache.get("other", [str(path)], lambda: index)
+    # Two indexes exceed the budget, so the least recently used one is evicted.
+    assert cache.size_bytes < 2 * frame_bytes
+    get_artifact_cache().invalidate()
@@ -1,7 +1,15 @@
 import pandas as pd
 import pytest
 
-from forecast.baseline import BaselineConfig, run_baseline
+import forecast.baseline as baseline
+from forecast.baseline import BaselineConfig, run_baseline, run_baseline_batch
+
+
+@pytest.fixture(autouse=True)
+def _fit_cache_dir(tmp_path, monkeypatch):
+    root = tmp_path / "ets_fits"
+    monkeypatch.setattr("forecast.fit_cache.FIT_CACHE_DIR", str(root))
+    return root
 
 
 def _make_series(months: int, start_value: float = 100.0) -> pd.DataFrame:
@@ -61,3 +69,75 @@ def test_regression_fixture_tolerance():
     expected_min = last_obs * (1 + min_monthly_rate)
     assert result["yhat"].iloc[0] >= expected_min * 0.99
     assert list(result["yhat"]) == sorted(result["yhat"])
+
+
+def _long_frame() -> pd.DataFrame:
+    parts = []
+    for member, months in (("B", 36), ("A", 12), ("C", 30)):
+        parts.append(_make_series(months, start_value=50.0).assign(dim_cost_center=member))
+    return pd.concat(parts, ignore_index=True)
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_batch_matches_per_group_runs(max_workers):
+    frame = _long_frame()
+    result = run_baseline_batch(frame, horizon_months=3, max_workers=max_workers, chunk_size=1)
+    assert list(result.columns) == ["dim_cost_center", "date", "yhat", "method"]
+    assert list(result["dim_cost_center"]) == ["A"] * 3 + ["B"] * 3 + ["C"] * 3
+    for member, group in frame.groupby("dim_cost_center"):
+        expected = run_baseline(group[["date", "value"]], horizon_months=3)
+        actual = result[result["dim_cost_center"] == member].drop(columns="dim_cost_center")
+        pd.testing.assert_frame_equal(actual.reset_index(drop=True), expected)
+
+
+def test_batch_without_dims_and_failing_group():
+    single = _make_series(12)
+    pd.testing.assert_frame_equal(
+        run_baseline_batch(single, horizon_months=2), run_baseline(single, horizon_months=2)
+    )
+    broken = _long_frame().astype({"value": float})
+    broken.loc[broken["dim_cost_center"] == "C", "value"] = None
+    with pytest.raises(ValueError, match="C"):
+        run_baseline_batch(broken, horizon_months=2, max_workers=1)
+
+
+def test_fit_cache_reuses_state_for_unchanged_series(monkeypatch):
+    df = _make_series(36)
+    series = baseline._ensure_monthly(df)
+    reference = baseline.ExponentialSmoothing(
+        series, trend="add", seasonal=None, initialization_method="estimated"
+    ).fit(optimized=True)
+
+    fits = []
+    real_model = baseline.ExponentialSmoothing
+
+    def counting_model(*args, **kwargs):
+        fits.append(1)
+        return real_model(*args, **kwargs)
+
+    monkeypatch.setattr(baseline, "ExponentialSmoothing", counting_model)
+    cold = baseline._fit_ets(series, 6)
+    warm = baseline._fit_ets(series, 12)
+    assert len(fits) == 1
+    assert list(cold) == pytest.approx(list(reference.forecast(6)), rel=1e-12)
+    assert list(warm) == pytest.approx(list(reference.forecast(12)), rel=1e-12)
+
+    run_baseline(df.assign(value=df["value"] + 1.0), horizon_months=6, method="ets")
+    run_baseline(df, horizon_months=6, method="ets", config=BaselineConfig(cagr_damping=0.5))
+    assert len(fits) == 3
+
+
+def test_unwritable_fit_cache_keeps_ets(tmp_path, monkeypatch):
+    blocker = tmp_path / "notadir"
+    blocker.write_text("", encoding="utf-8")
+    monkeypatch.setattr("forecast.fit_cache.FIT_CACHE_DIR", str(blocker / "fits"))
+    result = run_baseline(_make_series(36), horizon_months=3, method="auto")
+    assert set(result["method"]) == {"ets"}
+
+
+def test_corrupt_fit_cache_entry_refits(_fit_cache_dir):
+    df = _make_series(36)
+    expected = run_baseline(df, horizon_months=3, method="ets")
+    (entry,) = _fit_cache_dir.glob("*/*.json")
+    entry.write_text("{not json", encoding="utf-8")
+    pd.testing.assert_frame_equal(run_baseline(df, horizon_months=3, method="ets"), expected)
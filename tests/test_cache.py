@@ -1,6 +1,15 @@
+import pandas as pd
 import pytest
 
-from pipeline.cache import CacheError, build_meta, load_cache, save_cache
+from pipeline.cache import (
+    CacheError,
+    build_meta,
+    frame_to_rows,
+    load_cache,
+    load_cache_frame,
+    load_cache_slice,
+    save_cache,
+)
 
 
 def test_save_then_load(tmp_path):
@@ -32,3 +41,258 @@ def test_corrupt_cache_raises(tmp_path):
         load_cache(data_path=str(data_path), meta_path=str(meta_path))
 
     assert "Delete data/cache" in str(exc.value)
+
+
+@pytest.mark.parametrize(
+    "body", ["date,value\n2024-13-01,1.0\n", "date,value\n2024-01-01,abc\n"]
+)
+def test_malformed_csv_values_raise_cache_error(tmp_path, body):
+    data_path, meta_path = tmp_path / "data.csv", tmp_path / "meta.json"
+    rows = [{"date": "2024-01-01", "value": 1.0}]
+    save_cache(rows, build_meta(rows, source="fixture"), str(data_path), str(meta_path))
+    data_path.write_text(body, encoding="utf-8")
+    meta_path.write_text(meta_path.read_text().replace('"generation"', '"old_generation"'))
+
+    with pytest.raises(CacheError, match="Delete data/cache"):
+        load_cache_frame(data_path=str(data_path), meta_path=str(meta_path))
+    with pytest.raises(CacheError, match="Delete data/cache"):
+        load_cache_slice(data_path=str(data_path), meta_path=str(meta_path), end="2024-06-01")
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "arrow"])
+def test_columnar_round_trip(tmp_path, fmt):
+    pytest.importorskip("pyarrow")
+    rows = [
+        {"date": "2024-01-01", "value": 1.5, "dim_region": "NA"},
+        {"date": "2024-02-01", "value": 2.0, "dim_region": "EU"},
+    ]
+    meta = build_meta(rows, source="fixture")
+    data_path = tmp_path / "data.csv"
+    meta_path = tmp_path / "meta.json"
+
+    save_cache(rows, meta, data_path=str(data_path), meta_path=str(meta_path), fmt=fmt)
+    assert not data_path.exists()
+    assert (tmp_path / f"data.{fmt}").exists()
+
+    frame, loaded_meta = load_cache_frame(data_path=str(data_path), meta_path=str(meta_path))
+    assert str(frame["date"].dtype).startswith("datetime64")
+    assert frame["value"].dtype == "float64"
+    assert loaded_meta.row_count == 2
+
+    loaded_rows, _ = load_cache(data_path=str(data_path), meta_path=str(meta_path))
+    assert loaded_rows == [
+        {"date": "2024-01-01", "value": "1.5", "dim_region": "NA"},
+        {"date": "2024-02-01", "value": "2.0", "dim_region": "EU"},
+    ]
+
+
+def test_csv_frame_is_typed(tmp_path):
+    rows = [{"date": "2024-01-01", "value": "1.0"}, {"date": "2024-02-01", "value": "2.5"}]
+    data_path = tmp_path / "data.csv"
+    meta_path = tmp_path / "meta.json"
+    save_cache(rows, build_meta(rows, source="fixture"), str(data_path), str(meta_path), fmt="csv")
+
+    frame, _ = load_cache_frame(data_path=str(data_path), meta_path=str(meta_path))
+    assert list(frame["value"]) == [1.0, 2.5]
+    assert frame["date"].iloc[1] == pd.Timestamp("2024-02-01")
+
+
+@pytest.mark.parametrize("fmt", ["csv", "arrow"])
+def test_slice_by_date_range(tmp_path, fmt):
+    if fmt == "arrow":
+        pytest.importorskip("pyarrow")
+    rows = [
+        {"date": f"2024-{month:02d}-01", "value": float(month)} for month in range(1, 13)
+    ]
+    data_path = tmp_path / "data.csv"
+    meta_path = tmp_path / "meta.json"
+    save_cache(rows, build_meta(rows, source="fixture"), str(data_path), str(meta_path), fmt=fmt)
+
+    frame, meta = load_cache_slice(
+        data_path=str(data_path), meta_path=str(meta_path), start="2024-03-01", end="2024-05-01"
+    )
+    assert list(frame["value"]) == [3.0, 4.0, 5.0]
+    assert meta.row_count == 12
+
+    tail, _ = load_cache_slice(data_path=str(data_path), meta_path=str(meta_path), start="2024-11-15")
+    assert frame_to_rows(tail) == [{"date": "2024-12-01", "value": "12.0"}]
+
+
+def _save_value(data_path, meta_path, value, **kwargs):
+    rows = [{"date": "2024-01-01", "value": value}]
+    save_cache(
+        rows, build_meta(rows, source="fixture"), data_path=str(data_path),
+        meta_path=str(meta_path), **kwargs
+    )
+
+
+def test_readers_pinned_to_meta_generation(tmp_path):
+    data_path = tmp_path / "data.csv"
+    meta_path = tmp_path / "meta.json"
+    _save_value(data_path, meta_path, 1.0)
+    old_meta = meta_path.read_text(encoding="utf-8")
+    _save_value(data_path, meta_path, 2.0)
+
+    # A reader holding the previous meta.json still gets the matching data.
+    meta_path.write_text(old_meta, encoding="utf-8")
+    rows, _ = load_cache(data_path=str(data_path), meta_path=str(meta_path))
+    assert rows[0]["value"] == "1.0"
+    assert "2.0" in data_path.read_text(encoding="utf-8")
+
+
+def test_failed_write_keeps_previous_generation(tmp_path, monkeypatch):
+    import pipeline.cache as cache_module
+
+    data_path = tmp_path / "data.csv"
+    meta_path = tmp_path / "meta.json"
+    _save_value(data_path, meta_path, 1.0)
+
+    def _crash(path, rows):
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write("date,val")
+        raise OSError("disk full")
+
+    monkeypatch.setattr(cache_module, "_write_csv", _crash)
+    with pytest.raises(OSError):
+        _save_value(data_path, meta_path, 2.0)
+
+    rows, _ = load_cache(data_path=str(data_path), meta_path=str(meta_path))
+    assert rows[0]["value"] == "1.0"
+    leftovers = [p.name for p in tmp_path.rglob("*.tmp")]
+    assert leftovers == []
+
+
+def test_generations_are_pruned(tmp_path, monkeypatch):
+    import pipeline.cache as cache_module
+
+    monkeypatch.setattr(cache_module, "CACHE_KEEP_GENERATIONS", 2)
+    data_path = tmp_path / "data.csv"
+    meta_path = tmp_path / "meta.json"
+    for value in (1.0, 2.0, 3.0, 4.0):
+        _save_value(data_path, meta_path, value)
+
+    generations = list((tmp_path / "generations").glob("data.*.csv"))
+    assert len(generations) == 2
+    rows, _ = load_cache(data_path=str(data_path), meta_path=str(meta_path))
+    assert rows[0]["value"] == "4.0"
+
+
+def test_committed_files_use_umask_mode(tmp_path):
+    import os
+    import stat
+
+    from pipeline.cache import atomic_output
+
+    umask = os.umask(0)
+    os.umask(umask)
+    expected = 0o666 & ~umask
+    _save_value(tmp_path / "data.csv", tmp_path / "meta.json", 1.0)
+    with atomic_output(str(tmp_path / "forecast.csv")) as tmp_output:
+        with open(tmp_output, "w", encoding="utf-8") as handle:
+            handle.write("date,value\n")
+
+    written = [path for path in tmp_path.rglob("*") if path.is_file()]
+    assert {"data.csv", "meta.json", "forecast.csv"} <= {path.name for path in written}
+    assert {stat.S_IMODE(path.stat().st_mode) for path in written} == {expected}
+
+
+def test_bulk_frame_and_columns_match_row_writes(tmp_path):
+    rows = [
+        {"date": "2024-01-01", "value": 1.25, "dim_region": "NA"},
+        {"date": "2024-02-01", "value": 2.0, "dim_region": "EU"},
+    ]
+    frame = pd.DataFrame(rows)
+    columns = {name: list(frame[name]) for name in frame.columns}
+    paths = {}
+    for name, payload in (("rows", rows), ("frame", frame), ("columns", columns)):
+        paths[name] = tmp_path / name / "data.csv"
+        meta = build_meta(payload, source="fixture")
+        assert (meta.row_count, meta.min_date, meta.max_date) == (2, "2024-01-01", "2024-02-01")
+        save_cache(payload, meta, str(paths[name]), str(tmp_path / name / "meta.json"), fmt="csv")
+
+    expected = paths["rows"].read_bytes()
+    assert paths["frame"].read_bytes() == expected
+    assert paths["columns"].read_bytes() == expected
+
+
+def test_column_mapping_is_converted_once(tmp_path, monkeypatch):
+    import pipeline.cache as cache_module
+
+    conversions = []
+    real_frame = cache_module.pd.DataFrame
+
+    class _CountingFrame(real_frame):
+        def __init__(self, data=None, *args, **kwargs):
+            if isinstance(data, dict):
+                conversions.append(1)
+            super().__init__(data, *args, **kwargs)
+
+    columns = {"date": ["2024-01-01", "2024-02-01"], "value": [1.0, 2.0]}
+    meta = build_meta(columns, source="fixture")
+    monkeypatch.setattr(cache_module.pd, "DataFrame", _CountingFrame)
+    save_cache(columns, meta, str(tmp_path / "data.csv"), str(tmp_path / "meta.json"), fmt="csv")
+    monkeypatch.undo()
+    assert len(conversions) == 1
+
+
+def test_bulk_payload_validation(tmp_path):
+    typed = pd.DataFrame({"date": pd.to_datetime(["2024-03-01", "2024-01-01"]), "value": [1, 2]})
+    meta = build_meta(typed, source="fixture")
+    assert (meta.min_date, meta.max_date) == ("2024-01-01", "2024-03-01")
+
+    with pytest.raises(CacheError):
+        save_cache({"date": ["2024-01-01"], "value": [1.0, 2.0]}, meta, str(tmp_path / "a.csv"))
+    with pytest.raises(CacheError):
+        build_meta(pd.DataFrame({"date": ["", None], "value": [1.0, 2.0]}), source="fixture")
+    with pytest.raises(CacheError):
+        save_cache(
+            [{"date": "2024-01-01", "value": 1}, {"date": "2024-02-01", "amount": 2}],
+            meta,
+            str(tmp_path / "b.csv"),
+            str(tmp_path / "meta.json"),
+        )
+
+
+def test_slice_uses_sorted_date_index(tmp_path, monkeypatch):
+    import pipeline.cache as cache_module
+
+    rows = [
+        {"date": "2024-03-01", "value": 3.0},
+        {"date": "2024-01-01", "value": 1.0},
+        {"date": "2024-02-01", "value": 2.0},
+    ]
+    data_path, meta_path = str(tmp_path / "data.csv"), str(tmp_path / "meta.json")
+    save_cache(rows, build_meta(rows, source="fixture"), data_path, meta_path, fmt="csv")
+
+    builds = []
+    real_read = cache_module._read_csv_frame
+    monkeypatch.setattr(
+        cache_module, "_read_csv_frame", lambda path: builds.append(path) or real_read(path)
+    )
+    first, _ = load_cache_slice(data_path, meta_path, start="2024-02-01")
+    second, _ = load_cache_slice(data_path, meta_path, end="2024-02-15")
+
+    assert frame_to_rows(first) == [
+        {"date": "2024-02-01", "value": "2.0"},
+        {"date": "2024-03-01", "value": "3.0"},
+    ]
+    assert frame_to_rows(second)[-1] == {"date": "2024-02-01", "value": "2.0"}
+    assert len(builds) == 1
+    empty, _ = load_cache_slice(data_path, meta_path, start="2025-01-01", end="2024-01-01")
+    assert empty.empty
+
+
+def test_slice_rows_match_written_csv_strings(tmp_path):
+    import csv
+
+    data_path, meta_path = tmp_path / "data.csv", tmp_path / "meta.json"
+    frame = pd.DataFrame({"date": ["2024-01-01", "2024-02-01"], "value": [100.0, 2.5]})
+    save_cache(frame, build_meta(frame, source="fixture"), str(data_path), str(meta_path))
+    with open(data_path, newline="", encoding="utf-8") as handle:
+        written = [dict(row) for row in csv.DictReader(handle)]
+
+    sliced, _ = load_cache_slice(data_path=str(data_path), meta_path=str(meta_path))
+    assert frame_to_rows(sliced) == written == [
+        {"date": "2024-01-01", "value": "100.0"},
+        {"date": "2024-02-01", "value": "2.5"},
+    ]
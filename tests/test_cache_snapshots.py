@@ -0,0 +1,101 @@
+import pandas as pd
+import pytest
+
+import pipeline.forecast_runner as forecast_runner
+from pipeline.cache import (
+    CacheError,
+    build_meta,
+    list_snapshots,
+    load_cache,
+    rollback_cache,
+    save_cache,
+)
+from pipeline.scenario_runner import run_scenarios
+
+
+def _save(data_path, meta_path, values):
+    rows = [
+        {"date": f"2024-{month:02d}-01", "value": value}
+        for month, value in enumerate(values, start=1)
+    ]
+    return save_cache(
+        rows, build_meta(rows, source="fixture"), data_path=str(data_path),
+        meta_path=str(meta_path)
+    )
+
+
+def test_save_cache_records_content_hash(tmp_path):
+    first = _save(tmp_path / "data.csv", tmp_path / "meta.json", [1.0, 2.0])
+    again = _save(tmp_path / "data.csv", tmp_path / "meta.json", [1.0, 2.0])
+    changed = _save(tmp_path / "data.csv", tmp_path / "meta.json", [1.0, 3.0])
+
+    assert len(first.content_hash) == 64
+    assert again.content_hash == first.content_hash
+    assert changed.content_hash != first.content_hash
+    _, loaded = load_cache(
+        data_path=str(tmp_path / "data.csv"), meta_path=str(tmp_path / "meta.json")
+    )
+    assert loaded.content_hash == changed.content_hash
+
+
+def test_rollback_restores_previous_snapshot(tmp_path):
+    data_path, meta_path = tmp_path / "data.csv", tmp_path / "meta.json"
+    first = _save(data_path, meta_path, [1.0])
+    _save(data_path, meta_path, [5.0])
+
+    snapshots = list_snapshots(data_path=str(data_path))
+    assert [snap["content_hash"] for snap in snapshots][-1] == first.content_hash
+
+    restored = rollback_cache(first.content_hash[:16], str(data_path), str(meta_path))
+    rows, meta = load_cache(data_path=str(data_path), meta_path=str(meta_path))
+    assert rows[0]["value"] == "1.0"
+    assert meta.content_hash == restored.content_hash == first.content_hash
+
+    with pytest.raises(CacheError):
+        rollback_cache("0" * 16, str(data_path), str(meta_path))
+
+
+def test_runners_skip_when_input_unchanged(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    calls = []
+    real_baseline = forecast_runner.run_baseline
+
+    def _counting(df, **kwargs):
+        calls.append(1)
+        return real_baseline(df, **kwargs)
+
+    monkeypatch.setattr(forecast_runner, "run_baseline", _counting)
+    _save("data/cache/sac_export.csv", "data/cache/meta.json", [float(v) for v in range(1, 13)])
+
+    first = forecast_runner.run_forecast(horizon_months=12)
+    second = forecast_runner.run_forecast(horizon_months=12)
+    assert (first["skipped"], second["skipped"]) == ("false", "true")
+    assert len(calls) == 1
+    assert forecast_runner.run_forecast(horizon_months=12, force=True)["skipped"] == "false"
+
+    scenarios_first = run_scenarios()
+    scenarios_second = run_scenarios()
+    assert (scenarios_first["skipped"], scenarios_second["skipped"]) == ("false", "true")
+    assert not pd.read_csv("data/cache/scenarios.csv").empty
+
+    _save("data/cache/sac_export.csv", "data/cache/meta.json", [float(v) for v in range(2, 14)])
+    assert forecast_runner.run_forecast(horizon_months=12)["skipped"] == "false"
+    assert run_scenarios()["skipped"] == "false"
+
+
+def test_forecast_skip_checks_config_before_loading(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _save("data/cache/sac_export.csv", "data/cache/meta.json", [float(v) for v in range(1, 13)])
+    assert forecast_runner.run_forecast(horizon_months=12)["skipped"] == "false"
+
+    def _no_load(**_kwargs):
+        raise AssertionError("skip check must not load the series")
+
+    monkeypatch.setattr(forecast_runner, "load_cache_frame", _no_load)
+    assert forecast_runner.run_forecast(horizon_months=12)["skipped"] == "true"
+    monkeypatch.undo()
+    monkeypatch.chdir(tmp_path)
+
+    changed = forecast_runner.BaselineConfig(baseline_growth_ppy=0.07)
+    assert forecast_runner.run_forecast(horizon_months=12, config=changed)["skipped"] == "false"
+    assert forecast_runner.run_forecast(horizon_months=12, config=changed)["skipped"] == "true"
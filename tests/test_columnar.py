@@ -0,0 +1,44 @@
+import json
+
+import pandas as pd
+
+from sac_connector.columnar import ColumnarRows
+
+
+def test_matches_dataframe_of_dicts():
+    pages = [
+        [{"Date": "202001", "SignedData": 1.0}, {"Date": "202002", "SignedData": 2.0}],
+        [{"Date": "202003", "SignedData": 3.0, "CostCenters": "CC1"}],
+        [],
+    ]
+    columns = ColumnarRows(categorical=["Date", "CostCenters"])
+    for page in pages:
+        columns.add_page(page)
+
+    expected = pd.DataFrame([row for page in pages for row in page])
+    pd.testing.assert_frame_equal(columns.to_frame(), expected)
+    result = columns.to_frame(categorical=True)
+    assert len(columns) == 3
+    assert list(result.columns) == list(expected.columns)
+    assert list(result["SignedData"]) == list(expected["SignedData"])
+    assert list(result["Date"].astype(str)) == list(expected["Date"])
+    assert result["CostCenters"].isna().tolist() == [True, True, False]
+    assert isinstance(result["Date"].dtype, pd.CategoricalDtype)
+
+
+def test_interns_dimension_values_across_pages():
+    columns = ColumnarRows(categorical=["Version"])
+    for _ in range(2):
+        columns.add_page(json.loads('[{"Version": "public.Actual"}, {"Version": "public.Actual"}]'))
+    values = columns._columns["Version"]
+    assert len({id(value) for value in values}) == 1
+
+
+def test_extend_preserves_order():
+    first = ColumnarRows()
+    first.add_page([{"a": 1}])
+    second = ColumnarRows()
+    second.add_page([{"a": 2, "b": "x"}])
+    first.extend(second)
+    expected = pd.DataFrame([{"a": 1}, {"a": 2, "b": "x"}])
+    pd.testing.assert_frame_equal(first.to_frame(), expected)
@@ -1,6 +1,11 @@
+import gzip
 import types
+import zlib
 from datetime import datetime, timezone
 
+import pandas as pd
+import pytest
+
 from sac_connector import export as export_module
 
 
@@ -61,3 +66,114 @@ def test_normalization_schema():
         rows, date_field="period", value_field="metric", dim_fields=["region"], grain="month"
     )
     assert normalized == [{"date": "2024-01-01", "value": 2.5, "dim_region": "NA"}]
+
+
+def _paged_payloads(count):
+    payloads = {}
+    for index in range(count):
+        payload = {"value": [{"page": index}]}
+        if index + 1 < count:
+            payload["@odata.nextLink"] = f"http://page/{index + 1}"
+        payloads[f"http://page/{index}"] = payload
+    return payloads
+
+
+def test_prefetch_preserves_order_and_records_timings(monkeypatch):
+    payloads = _paged_payloads(5)
+
+    def fake_request_json(url, headers, timeout):
+        return payloads[url]
+
+    monkeypatch.setattr(export_module, "_request_json", fake_request_json)
+
+    timings = []
+    pages = list(export_module.iter_pages("http://page/0", {}, prefetch=2, timings=timings))
+    assert [page[0]["page"] for page in pages] == [0, 1, 2, 3, 4]
+    assert [timing.page for timing in timings] == [0, 1, 2, 3, 4]
+    assert all(timing.rows == 1 for timing in timings)
+    assert all(timing.fetch_seconds >= 0 and timing.parse_seconds >= 0 for timing in timings)
+
+
+def test_prefetch_propagates_errors(monkeypatch):
+    payloads = _paged_payloads(3)
+
+    def fake_request_json(url, headers, timeout):
+        if url == "http://page/2":
+            raise export_module.ExportHttpError(400, "bad request")
+        return payloads[url]
+
+    monkeypatch.setattr(export_module, "_request_json", fake_request_json)
+
+    pages = export_module.iter_pages("http://page/0", {}, prefetch=1)
+    assert next(pages)[0]["page"] == 0
+    assert next(pages)[0]["page"] == 1
+    with pytest.raises(export_module.ExportError) as exc:
+        next(pages)
+    assert "400" in str(exc.value)
+
+
+def test_decode_chunks_handles_deflate_variants():
+    body = b'{"value": []}' * 100
+    raw = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+    raw_deflate = raw.compress(body) + raw.flush()
+
+    assert export_module._decode_chunks([zlib.compress(body)], "deflate") == body
+    assert export_module._decode_chunks([raw_deflate], "deflate") == body
+    assert export_module._decode_chunks([raw_deflate[:3], raw_deflate[3:]], "deflate") == body
+    gz = gzip.compress(body)
+    gz_chunks = [gz[i : i + 7] for i in range(0, len(gz), 7)]
+    assert export_module._decode_chunks(gz_chunks, "gzip") == body
+    assert export_module._decode_chunks([body[:10], body[10:]], None) == body
+    with pytest.raises(export_module.ExportError):
+        export_module._decode_chunks([body], "br")
+
+
+def test_normalize_frame_matches_rows_and_falls_back_per_row():
+    rows = [
+        {"period": "2024-01", "metric": "2.5", "region": "NA"},
+        {"period": "2024-02", "metric": 3, "region": None},
+        {"period": "2024Q2", "metric": "1"},
+        {"period": " 2024-03-05T10:00:00Z", "metric": 1.5, "region": 7},
+        {"period": "2024", "metric": "4"},
+    ]
+    frame = export_module.normalize_frame(
+        rows, date_field="period", value_field="metric", dim_fields=["region"]
+    )
+    expected = export_module.normalize_rows(
+        rows, date_field="period", value_field="metric", dim_fields=["region"]
+    )
+    assert frame.to_dict(orient="records") == expected
+
+    quarters = pd.DataFrame({"period": ["2024Q1", "2024-Q3"], "metric": [1.0, 2.0]})
+    result = export_module.normalize_frame(quarters, "period", "metric", [])
+    assert list(result["date"]) == ["2024-01-01", "2024-07-01"]
+
+    with pytest.raises(ValueError, match="Unrecognized date format: garbage"):
+        export_module.normalize_frame(
+            [{"period": "2024-01", "metric": 1}, {"period": "garbage", "metric": 1}],
+            "period",
+            "metric",
+            [],
+        )
+    with pytest.raises(export_module.ExportError):
+        export_module.normalize_frame([{"metric": 1}], "period", "metric", [])
+
+
+def test_normalize_frame_dimension_members_match_rows():
+    rows = [
+        {"period": "2024-01", "metric": 1, "CC": 1, "Flag": True, "Code": float("nan")},
+        {"period": "2024-02", "metric": 2, "CC": None, "Flag": 1, "Code": 1.0},
+        {"period": "2024-03", "metric": 3, "CC": 12, "Flag": 1.0, "Code": None},
+    ]
+    dims = ["CC", "Flag", "Code", "Missing"]
+    expected = export_module.normalize_rows(rows, "period", "metric", dims)
+    frame = export_module.normalize_frame(rows, "period", "metric", dims)
+    assert frame.to_dict(orient="records") == expected
+    assert list(frame["dim_CC"]) == ["1", "", "12"]
+    assert list(frame["dim_Code"]) == ["nan", "1.0", ""]
+
+    typed = pd.DataFrame(rows)
+    records = typed.to_dict(orient="records")
+    assert export_module.normalize_frame(typed, "period", "metric", dims).to_dict(
+        orient="records"
+    ) == export_module.normalize_rows(records, "period", "metric", dims)
@@ -0,0 +1,30 @@
+import pytest
+
+from demo.fake_des import FakeDesSettings, start_fake_des
+from sac_connector import ratelimit as ratelimit_module
+from sac_connector.ratelimit import AdaptiveRateLimiter
+from sac_connector.timeseries import fetch_timeseries
+
+
+@pytest.fixture()
+def fake_des(monkeypatch):
+    monkeypatch.setattr(ratelimit_module, "_LIMITER", AdaptiveRateLimiter(rate=1000))
+    settings = FakeDesSettings(
+        rows=240, page_size=50, months=24, error_rate_429=0.2, retry_after_seconds=0
+    )
+    server = start_fake_des(settings)
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_fetch_timeseries_against_fake_des(fake_des):
+    timings = []
+    df = fetch_timeseries("FAKE", config=fake_des.config(), prefetch=2, timings=timings)
+
+    assert len(df) == 240
+    assert len(timings) == 5
+    assert df["Date"].astype(str).min() == "201501"
+    assert set(df["Version"].astype(str)) == {"public.Actual"}
+    assert fake_des.counters["page_requests"] == 5
+    assert fake_des.counters["injected_429"] >= 1
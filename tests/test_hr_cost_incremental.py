@@ -0,0 +1,81 @@
+from types import SimpleNamespace
+
+import pandas as pd
+
+from pipeline import hr_cost_series as hr_module
+from pipeline.cache import load_cache, load_cache_meta_raw
+
+
+def _install_source(monkeypatch, months):
+    calls = []
+
+    def fake_iter_fact_pages(**kwargs):
+        slice_spec = kwargs["slice_spec"]
+        calls.append(slice_spec)
+        start = slice_spec.date_from or "000000"
+        rows = [
+            {"Date": month, "Cost": value}
+            for month, value in months.items()
+            if month >= start
+        ]
+        yield rows
+
+    monkeypatch.setattr(hr_module, "iter_fact_pages", fake_iter_fact_pages)
+    monkeypatch.setattr(
+        hr_module,
+        "load_config",
+        lambda: SimpleNamespace(provider_id="prov", namespace_id="sac", provider_name="Model"),
+    )
+    monkeypatch.setenv("HR_SERIES_MODE", "cost")
+    monkeypatch.setenv("HR_COST_MEASURE", "Cost")
+    return calls
+
+
+def test_incremental_refresh_pulls_tail_and_overwrites(tmp_path, monkeypatch):
+    cache_path = str(tmp_path / "series.csv")
+    meta_path = str(tmp_path / "meta.json")
+    months = {f"2023{m:02d}": float(m) for m in range(1, 13)}
+    calls = _install_source(monkeypatch, months)
+
+    hr_module.get_hr_cost_series(source="sac", cache_path=cache_path, meta_path=meta_path)
+    assert calls[-1].date_from is None
+
+    # Restate October and add a new month.
+    months["202310"] = 100.0
+    months["202401"] = 13.0
+    df, meta = hr_module.get_hr_cost_series(
+        source="sac",
+        cache_path=cache_path,
+        meta_path=meta_path,
+        incremental=True,
+        overlap_months=3,
+    )
+
+    assert calls[-1].date_from == "202309"
+    assert meta["refresh_mode"] == "incremental"
+    assert len(df) == 13
+    series = dict(zip(df["date"], df["value"]))
+    assert series["2023-10-01"] == 100.0
+    assert series["2024-01-01"] == 13.0
+    assert series["2023-01-01"] == 1.0
+
+    rows, cache_meta = load_cache(data_path=cache_path, meta_path=meta_path)
+    assert cache_meta.max_date == "2024-01-01"
+    assert cache_meta.row_count == 13
+    assert load_cache_meta_raw(meta_path)["incremental_from"] == "2023-09-01"
+
+
+def test_incremental_falls_back_to_full_when_mapping_changes(tmp_path, monkeypatch):
+    cache_path = str(tmp_path / "series.csv")
+    meta_path = str(tmp_path / "meta.json")
+    calls = _install_source(monkeypatch, {"202301": 1.0, "202302": 2.0})
+
+    hr_module.get_hr_cost_series(source="sac", cache_path=cache_path, meta_path=meta_path)
+    monkeypatch.setenv("HR_COST_FILTERS_JSON", '{"Version": "public.Actual"}')
+    _, meta = hr_module.get_hr_cost_series(
+        source="sac", cache_path=cache_path, meta_path=meta_path, incremental=True
+    )
+
+    assert calls[-1].date_from is None
+    assert meta["refresh_mode"] == "full"
+    assert len(pd.read_csv(cache_path)) == 2
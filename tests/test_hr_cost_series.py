@@ -6,7 +6,9 @@ from pipeline.hr_cost_series import get_hr_cost_series
 
 def test_hr_cost_series_fixture(tmp_path):
     cache_path = tmp_path / "series.csv"
-    df, meta = get_hr_cost_series(source="fixture", cache_path=str(cache_path))
+    df, meta = get_hr_cost_series(
+        source="fixture", cache_path=str(cache_path), meta_path=str(tmp_path / "meta.json")
+    )
     assert not df.empty
     assert set(df.columns) >= {"date", "value"}
     assert meta["metric_name"] == "hr_cost"
@@ -17,8 +19,105 @@ def test_hr_cost_series_fixture(tmp_path):
 def test_hr_cost_series_fixture_fte_mode(tmp_path, monkeypatch):
     monkeypatch.setenv("HR_SERIES_MODE", "fte")
     cache_path = tmp_path / "series.csv"
-    df, meta = get_hr_cost_series(source="fixture", cache_path=str(cache_path))
+    df, meta = get_hr_cost_series(
+        source="fixture", cache_path=str(cache_path), meta_path=str(tmp_path / "meta.json")
+    )
     assert not df.empty
     assert meta["metric_name"] == "fte"
     assert meta["currency"] == ""
     assert df["value"].iloc[0] == pytest.approx(100.0)
+
+
+def test_refresh_measure_cache_uses_filters_per_measure(tmp_path, monkeypatch):
+    from types import SimpleNamespace
+
+    from pipeline import hr_cost_series as hr_module
+    from pipeline.cache import load_cache_frame
+    from pipeline.metric_mapping import _DEFAULT_COST_FILTERS
+    from sac_connector.timeseries import DEFAULT_SLICE
+
+    calls = []
+
+    def fake_iter_fact_pages(**kwargs):
+        spec = kwargs["slice_spec"]
+        calls.append(spec)
+        values = {"SignedData": [2.0, 3.0], "Cost": [100.0, 150.0]}
+        yield [
+            {"Date": date, **{m: values[m][i] for m in (spec.measure, *spec.extra_measures)}}
+            for i, date in enumerate(["202401", "202402"])
+        ]
+
+    monkeypatch.delenv("HR_COST_FILTERS_JSON", raising=False)
+    monkeypatch.setattr(hr_module, "iter_fact_pages", fake_iter_fact_pages)
+    monkeypatch.setattr(
+        hr_module,
+        "load_config",
+        lambda: SimpleNamespace(provider_id="prov", namespace_id="sac", provider_name="Model"),
+    )
+    cache_path, meta_path = str(tmp_path / "measures.csv"), str(tmp_path / "meta.json")
+    df, meta = hr_module.refresh_measure_cache(cache_path=cache_path, meta_path=meta_path)
+
+    # FTE (SignedData) and cost use different slices, so they are fetched separately.
+    assert [(c.measure, c.extra_measures, c.filters) for c in calls] == [
+        ("SignedData", (), dict(DEFAULT_SLICE.filters)),
+        ("Cost", (), _DEFAULT_COST_FILTERS),
+    ]
+    assert meta["filters_used"] == {
+        "SignedData": dict(DEFAULT_SLICE.filters),
+        "Cost": _DEFAULT_COST_FILTERS,
+    }
+    assert set(df["measure"]) == {"SignedData", "Cost"}
+    assert set(df["grain"]) == {"month", "quarter", "year"}
+    assert (meta["min_date"], meta["max_date"]) == ("2024-01-01", "2024-02-01")
+    year_sum = [
+        entry
+        for entry in meta["series"]
+        if (entry["measure"], entry["grain"], entry["aggregate"]) == ("Cost", "year", "sum")
+    ]
+    assert year_sum == [
+        {
+            "measure": "Cost",
+            "grain": "year",
+            "aggregate": "sum",
+            "row_count": 1,
+            "min_date": "2024-01-01",
+            "max_date": "2024-01-01",
+        }
+    ]
+    cached, _ = load_cache_frame(data_path=cache_path, meta_path=meta_path)
+    assert len(cached) == len(df) == meta["row_count"]
+
+    calls.clear()
+    monkeypatch.setenv("HR_COST_FILTERS_JSON", '{"Version": "public.Actual"}')
+    hr_module.refresh_measure_cache(cache_path=cache_path, meta_path=meta_path)
+    assert [(c.measure, c.extra_measures) for c in calls] == [("SignedData", ("Cost",))]
+
+    with pytest.raises(hr_module.CacheError):
+        hr_module.refresh_measure_cache(measures=("Headcount",), cache_path=cache_path)
+
+
+@pytest.mark.parametrize("failure", ["export", "non_numeric_fte"])
+def test_refresh_measure_cache_reports_failures_as_cache_error(tmp_path, monkeypatch, failure):
+    from types import SimpleNamespace
+
+    from pipeline import hr_cost_series as hr_module
+
+    def fake_iter_fact_pages(**kwargs):
+        if failure == "export":
+            raise hr_module.ExportError("Missing SAC_TENANT_URL for timeseries fetch.")
+        yield [{"Date": "202401", "SignedData": "n/a"}]
+
+    monkeypatch.delenv("HR_COST_FILTERS_JSON", raising=False)
+    monkeypatch.setattr(hr_module, "iter_fact_pages", fake_iter_fact_pages)
+    monkeypatch.setattr(
+        hr_module,
+        "load_config",
+        lambda: SimpleNamespace(provider_id="prov", namespace_id="sac", provider_name="Model"),
+    )
+    expected = "SAC_TENANT_URL" if failure == "export" else "Non-numeric"
+    with pytest.raises(hr_module.CacheError, match=expected):
+        hr_module.refresh_measure_cache(
+            measures=("SignedData",),
+            cache_path=str(tmp_path / "measures.csv"),
+            meta_path=str(tmp_path / "meta.json"),
+        )
@@ -0,0 +1,103 @@
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from sac_connector import export as export_module
+from sac_connector.pool import ConnectionPool
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    peers = []
+    accept_encodings = []
+
+    def do_GET(self):
+        self.peers.append(self.client_address)
+        self.accept_encodings.append(self.headers.get("Accept-Encoding", ""))
+        status = 404 if self.path.startswith("/missing") else 200
+        body = json.dumps({"value": [{"path": self.path}]}).encode("utf-8")
+        if self.path.startswith("/big"):
+            body = b"x" * 200_000
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        if self.path.startswith("/gzip"):
+            body = gzip.compress(body)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args):
+        pass
+
+
+@pytest.fixture()
+def server():
+    _Handler.peers = []
+    _Handler.accept_encodings = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_pool_reuses_connection(server):
+    pool = ConnectionPool(max_per_host=2)
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    first = pool.request("GET", f"{base}/FactData?page=1")
+    second = pool.request("GET", f"{base}/FactData?page=2")
+    pool.close()
+
+    assert first.status == 200
+    assert json.loads(second.body)["value"][0]["path"] == "/FactData?page=2"
+    assert len({peer for peer in _Handler.peers}) == 1
+
+
+def test_stream_reads_body_incrementally(server):
+    pool = ConnectionPool(max_per_host=2)
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    with pool.stream("GET", f"{base}/big") as response:
+        chunks = list(response.iter_chunks(16 * 1024))
+    assert len(chunks) > 1 and sum(len(chunk) for chunk in chunks) == 200_000
+    # Drained: the connection went back to the pool.
+    pool.request("GET", f"{base}/FactData")
+    with pool.stream("GET", f"{base}/big") as response:
+        response.read(10)
+    # Abandoned mid-body: that connection is closed, not reused.
+    pool.request("GET", f"{base}/FactData")
+    pool.close()
+    assert len(set(_Handler.peers)) == 2
+
+
+def test_request_json_uses_pool_and_maps_errors(server, monkeypatch):
+    pool = ConnectionPool()
+    monkeypatch.setattr(export_module, "get_pool", lambda: pool)
+    monkeypatch.setattr(export_module, "uses_proxy", lambda _url: False)
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    payload = export_module._request_json(f"{base}/FactData", headers={}, timeout=5)
+    assert payload["value"][0]["path"] == "/FactData"
+
+    with pytest.raises(export_module.ExportHttpError) as exc:
+        export_module._request_json(f"{base}/missing", headers={}, timeout=5)
+    assert exc.value.status == 404
+    pool.close()
+
+
+def test_request_json_negotiates_gzip(server, monkeypatch):
+    pool = ConnectionPool()
+    monkeypatch.setattr(export_module, "get_pool", lambda: pool)
+    monkeypatch.setattr(export_module, "uses_proxy", lambda _url: False)
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    payload = export_module._request_json(f"{base}/gzip/FactData", headers={}, timeout=5)
+    assert payload["value"][0]["path"] == "/gzip/FactData"
+    assert _Handler.accept_encodings == ["gzip, deflate"]
+    pool.close()
@@ -1,7 +1,16 @@
 import pandas as pd
 import pytest
 
-from pipeline.normalize_timeseries import NormalizeError, NormalizeSpec, normalize_timeseries
+from pipeline.normalize_timeseries import (
+    MeasureSpec,
+    NormalizeError,
+    NormalizeSpec,
+    normalize_measures,
+    normalize_measures_pages,
+    normalize_timeseries,
+    normalize_timeseries_pages,
+    select_measure,
+)
 
 
 def test_parse_yyyymm_and_aggregate():
@@ -34,3 +43,96 @@ def test_allow_non_numeric_and_drop():
         spec=NormalizeSpec(allow_non_numeric=True),
     )
     assert list(result["value"]) == [10.0]
+
+
+def test_pages_match_single_pass():
+    pages = [
+        [
+            {"Date": "202001", "SignedData": 1, "CostCenters": "A"},
+            {"Date": "202002", "SignedData": 2, "CostCenters": "B"},
+        ],
+        [],
+        pd.DataFrame(
+            {
+                "Date": ["202001", "202003"],
+                "SignedData": [4, 5],
+                "CostCenters": ["A", "A"],
+            }
+        ),
+    ]
+    full = pd.concat([pd.DataFrame(page) for page in pages], ignore_index=True)
+    expected = normalize_timeseries(full, group_dims=["CostCenters"])
+    result = normalize_timeseries_pages(iter(pages), group_dims=["CostCenters"])
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_pages_reject_empty_stream():
+    with pytest.raises(NormalizeError):
+        normalize_timeseries_pages(iter([[], []]))
+
+
+def test_vectorized_dates_report_offending_values():
+    df = pd.DataFrame({"Date": ["202001", "2020-02", "202013", "bad"], "SignedData": [1, 2, 3, 4]})
+    with pytest.raises(NormalizeError, match="2020-02, bad"):
+        normalize_timeseries(df)
+    with pytest.raises(NormalizeError, match="Invalid Date month: 202013"):
+        normalize_timeseries(df.iloc[[0, 2]])
+
+
+def test_integer_and_categorical_dates():
+    expected = ["2019-12-01", "2020-01-01"]
+    ints = pd.DataFrame({"Date": [202001, 201912, 202001], "SignedData": [1.0, 2.0, 3.0]})
+    assert list(normalize_timeseries(ints)["date"]) == expected
+    cats = ints.assign(Date=ints["Date"].astype(str).astype("category"))
+    assert list(normalize_timeseries(cats)["value"]) == [2.0, 4.0]
+    with pytest.raises(NormalizeError, match="99"):
+        normalize_timeseries(ints.assign(Date=[202001, 99, 202001]))
+    nullable = ints.assign(Date=pd.array([202001, None, 99], dtype="Int64"))
+    with pytest.raises(NormalizeError, match="99, missing value"):
+        normalize_timeseries(nullable)
+    with pytest.raises(NormalizeError, match="bad, missing value"):
+        normalize_timeseries(ints.assign(Date=["202001", None, "bad"]))
+
+
+def test_measures_and_grains_in_one_pass():
+    df = pd.DataFrame(
+        {
+            "Date": ["202401", "202401", "202402", "202404"],
+            "SignedData": [1.0, 2.0, 3.0, 4.0],
+            "Cost": [10.0, 20.0, 30.0, 40.0],
+        }
+    )
+    spec = MeasureSpec(
+        measures=("SignedData", "Cost"),
+        grains=("month", "quarter", "year"),
+        aggregates=("sum", "mean", "last"),
+    )
+    result = normalize_measures(df, spec)
+
+    monthly = select_measure(result, "SignedData")
+    expected = normalize_timeseries(df[["Date", "SignedData"]])
+    pd.testing.assert_frame_equal(monthly, expected)
+
+    quarter = select_measure(result, "Cost", grain="quarter", aggregate="sum")
+    assert dict(zip(quarter["date"], quarter["value"])) == {"2024-01-01": 60.0, "2024-04-01": 40.0}
+    year_last = select_measure(result, "SignedData", grain="year", aggregate="last")
+    assert list(year_last["value"]) == [4.0]
+    year_mean = select_measure(result, "Cost", grain="year", aggregate="mean")
+    assert list(year_mean["value"]) == [pytest.approx(100.0 / 3)]
+
+
+def test_measure_pages_match_single_pass_and_validate():
+    pages = [
+        [{"Date": "202401", "SignedData": 1, "Cost": "x", "Function": "HR"}],
+        [{"Date": "202402", "SignedData": 2, "Cost": 5, "Function": "HR"}],
+    ]
+    spec = MeasureSpec(measures=("SignedData", "Cost"), grains=("quarter",), allow_non_numeric=True)
+    full = pd.concat([pd.DataFrame(page) for page in pages], ignore_index=True)
+    pd.testing.assert_frame_equal(
+        normalize_measures_pages(iter(pages), spec, group_dims=["Function"]),
+        normalize_measures(full, spec, group_dims=["Function"]),
+    )
+    with pytest.raises(NormalizeError):
+        normalize_measures(full, MeasureSpec(measures=("SignedData",), grains=("week",)))
+    with pytest.raises(NormalizeError):
+        normalize_measures(full, MeasureSpec(measures=("SignedData", "Cost")))
@@ -0,0 +1,65 @@
+import pandas as pd
+import pytest
+
+import pipeline.cache as cache_module
+from pipeline.cache import CacheError
+from pipeline.partitions import (
+    load_partition,
+    load_partition_manifest,
+    partition_paths,
+    save_partitioned_cache,
+)
+
+
+def _frame(members):
+    rows = []
+    for member in members:
+        for month in (1, 2, 3):
+            rows.append(
+                {"date": f"2024-0{month}-01", "value": float(month), "dim_CostCenters": member}
+            )
+    return pd.DataFrame(rows)
+
+
+def test_partitioned_round_trip_reads_only_member(tmp_path, monkeypatch):
+    root = str(tmp_path / "partitions")
+    partitions = save_partitioned_cache(_frame(["CC100", "CC/200"]), "CostCenters", root=root)
+
+    assert sorted(partitions) == ["CC/200", "CC100"]
+    manifest = load_partition_manifest(root)
+    assert manifest["dimension"] == "dim_CostCenters"
+    assert manifest["partitions"]["CC100"]["row_count"] == 3
+
+    opened = []
+    real_pinned = cache_module.load_pinned_data
+    monkeypatch.setattr(
+        cache_module,
+        "load_pinned_data",
+        lambda data_path, meta_path: opened.append(data_path) or real_pinned(data_path, meta_path),
+    )
+    frame, meta = load_partition("CC/200", root=root, start="2024-02-01")
+    assert list(frame["value"]) == [2.0, 3.0]
+    assert set(frame["dim_CostCenters"]) == {"CC/200"}
+    assert meta.content_hash == partitions["CC/200"].content_hash
+    assert opened == [partition_paths(root, "dim_CostCenters", "CC/200")[0]]
+
+
+def test_repartition_drops_stale_members(tmp_path):
+    root = tmp_path / "partitions"
+    save_partitioned_cache(_frame(["A", "B"]), "CostCenters", root=str(root))
+    other = root / "dim_Function=HR"
+    other.mkdir()
+    save_partitioned_cache(_frame(["B"]), "dim_CostCenters", root=str(root))
+
+    names = sorted(p.name for p in root.iterdir() if p.is_dir())
+    # Another dimension's partition directories are not treated as stale.
+    assert names == ["dim_CostCenters=B", "dim_Function=HR"]
+    with pytest.raises(CacheError, match="Unknown partition"):
+        load_partition("A", root=str(root))
+
+
+def test_partition_requires_dimension_column(tmp_path):
+    with pytest.raises(CacheError):
+        save_partitioned_cache(_frame(["A"]), "Function", root=str(tmp_path))
+    with pytest.raises(CacheError):
+        load_partition_manifest(str(tmp_path / "missing"))
@@ -0,0 +1,98 @@
+from sac_connector import export as export_module
+from sac_connector import ratelimit as ratelimit_module
+from sac_connector.ratelimit import AdaptiveRateLimiter, parse_retry_after
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("999", cap_seconds=10) == 10.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_bucket_waits_when_empty(monkeypatch):
+    clock = _Clock()
+    slept = []
+    monkeypatch.setattr(ratelimit_module.time, "sleep", slept.append)
+    limiter = AdaptiveRateLimiter(rate=2, burst=2, clock=clock)
+
+    assert limiter.acquire() == 0.0
+    assert limiter.acquire() == 0.0
+    assert limiter.acquire() == 0.5
+    assert slept == [0.5]
+    assert limiter.snapshot()["requests"] == 3
+
+
+def test_aimd_and_retry_after_pause(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(ratelimit_module.time, "sleep", lambda *_: None)
+    limiter = AdaptiveRateLimiter(rate=8, min_rate=1, increase=1, clock=clock)
+
+    limiter.record_throttle(429, retry_after=5)
+    assert limiter.rate == 4
+    assert limiter.acquire() == 5.0
+    limiter.record_throttle(503)
+    limiter.record_throttle(503)
+    limiter.record_throttle(503)
+    assert limiter.rate == 1
+    limiter.record_success()
+    assert limiter.rate == 2
+
+    stats = limiter.snapshot()
+    assert stats["throttled"] == 1
+    assert stats["server_errors"] == 3
+    assert stats["retry_after_honored"] == 1
+
+
+def test_retry_after_replaces_backoff(monkeypatch):
+    clock = _Clock()
+    backoff_sleeps = []
+    acquired = []
+    calls = {"count": 0}
+
+    def fake_request_json(url, headers, timeout):
+        calls["count"] += 1
+        if calls["count"] == 1:
+            raise export_module.ExportHttpError(429, "slow down", retry_after=2.0)
+        return {"value": []}
+
+    monkeypatch.setattr(export_module, "_request_json", fake_request_json)
+    monkeypatch.setattr(export_module.time, "sleep", backoff_sleeps.append)
+    limiter = AdaptiveRateLimiter(rate=10, clock=clock)
+    monkeypatch.setattr(limiter, "acquire", lambda: acquired.append(True) or 0.0)
+
+    payload = export_module.request_json_with_retry("http://x", {}, max_attempts=2, limiter=limiter)
+    assert payload == {"value": []}
+    assert backoff_sleeps == []
+    assert len(acquired) == 2
+    assert limiter.snapshot()["retry_after_honored"] == 1
+
+
+def test_short_retry_after_keeps_backoff(monkeypatch):
+    backoff_sleeps = []
+    calls = {"count": 0}
+
+    def fake_request_json(url, headers, timeout):
+        calls["count"] += 1
+        if calls["count"] < 3:
+            raise export_module.ExportHttpError(429, "slow down", retry_after=0.0)
+        return {"value": []}
+
+    monkeypatch.setattr(export_module, "_request_json", fake_request_json)
+    monkeypatch.setattr(export_module.time, "sleep", backoff_sleeps.append)
+    limiter = AdaptiveRateLimiter(rate=10, clock=_Clock())
+    monkeypatch.setattr(limiter, "acquire", lambda: 0.0)
+
+    payload = export_module.request_json_with_retry("http://x", {}, max_attempts=3, limiter=limiter)
+    assert payload == {"value": []}
+    # Retry-After: 0 must not turn the retries into an immediate loop.
+    assert backoff_sleeps == [1.0, 2.0]
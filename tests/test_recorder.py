@@ -0,0 +1,75 @@
+import pandas as pd
+import pytest
+
+from config import Config
+from demo.fake_des import FakeDesSettings, start_fake_des
+from sac_connector import ratelimit as ratelimit_module
+from sac_connector.export import ExportError, export_all
+from sac_connector.ratelimit import AdaptiveRateLimiter
+from sac_connector.recorder import ResponseRecorder, normalize_url, response_key
+from sac_connector.timeseries import fetch_timeseries
+
+
+def test_key_ignores_query_order_and_host_case():
+    first = "https://Tenant.example/FactData?$select=a&$filter=x%20eq%20'1'&$skiptoken=5"
+    second = "https://tenant.example/FactData?$skiptoken=5&$filter=x%20eq%20'1'&$select=a"
+    assert normalize_url(first) == normalize_url(second)
+    assert response_key(first) == response_key(second)
+    assert response_key(first) != response_key(first.replace("skiptoken=5", "skiptoken=6"))
+
+
+def test_record_then_replay_without_network(tmp_path, monkeypatch):
+    monkeypatch.setattr(ratelimit_module, "_LIMITER", AdaptiveRateLimiter(rate=1000))
+    server = start_fake_des(FakeDesSettings(rows=120, page_size=50, months=12))
+    config = server.config()
+    try:
+        recorded = fetch_timeseries(
+            "FAKE",
+            config=config,
+            recorder=ResponseRecorder(root=str(tmp_path), mode="record"),
+        )
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    replayed = fetch_timeseries(
+        "FAKE",
+        config=config,
+        recorder=ResponseRecorder(root=str(tmp_path), mode="replay"),
+    )
+    pd.testing.assert_frame_equal(replayed, recorded)
+    assert server.counters["page_requests"] == 3
+
+
+def test_replay_miss_raises(tmp_path):
+    config = Config(
+        tenant_url="http://127.0.0.1:9",
+        auth_url=None,
+        token_url="http://127.0.0.1:9/oauth/token",
+        client_id="id",
+        client_secret="secret",
+        dataexport_base_url=None,
+        namespace_id="sac",
+        provider_id="FAKE",
+    )
+    with pytest.raises(ExportError) as exc:
+        fetch_timeseries("FAKE", config=config, recorder=ResponseRecorder(str(tmp_path)))
+    assert "no recorded response" in str(exc.value)
+
+
+def test_invalid_cache_mode_raises_export_error(monkeypatch):
+    monkeypatch.setenv("SAC_RESPONSE_CACHE", "bogus")
+    config = Config(
+        tenant_url="http://127.0.0.1:9",
+        auth_url=None,
+        token_url="http://127.0.0.1:9/oauth/token",
+        client_id="id",
+        client_secret="secret",
+        dataexport_base_url=None,
+        namespace_id="sac",
+        provider_id="FAKE",
+    )
+    with pytest.raises(ExportError, match="Unsupported recorder mode .bogus."):
+        fetch_timeseries("FAKE", config=config)
+    with pytest.raises(ExportError, match="Unsupported recorder mode .bogus."):
+        export_all(config, "http://127.0.0.1:9/export")
@@ -1,10 +1,18 @@
-from demo.refresh import _refresh_from_fixture
+from functools import partial
+
+import demo.refresh as refresh_module
 from pipeline.cache import load_cache
 
 
-def test_refresh_from_fixture(tmp_path):
+def test_refresh_from_fixture(tmp_path, monkeypatch):
     output = tmp_path / "fixture.csv"
-    _refresh_from_fixture(str(output))
-    rows, meta = load_cache(data_path=str(output))
+    meta_path = str(tmp_path / "meta.json")
+    monkeypatch.setattr(
+        refresh_module,
+        "get_hr_cost_series",
+        partial(refresh_module.get_hr_cost_series, meta_path=meta_path),
+    )
+    refresh_module._refresh_from_fixture(str(output))
+    rows, meta = load_cache(data_path=str(output), meta_path=meta_path)
     assert rows
     assert meta.source == "fixture"
@@ -0,0 +1,104 @@
+import pandas as pd
+import pytest
+
+import mcp_server
+from pipeline.cache import CacheError, build_meta, save_cache
+from pipeline.sqlite_store import SqliteStore, series_table, string_rows
+
+
+def _seed_series(tmp_path, value_offset=0.0):
+    frame = pd.DataFrame(
+        {
+            "date": ["2024-01-01", "2024-01-01", "2024-02-01", "2024-02-01"],
+            "value": [1.0 + value_offset, 2.0, 3.0, 4.0],
+            "dim_Function": ["HR", "IT", "HR", "IT"],
+        }
+    )
+    data_path, meta_path = str(tmp_path / "series.csv"), str(tmp_path / "meta.json")
+    save_cache(frame, build_meta(frame, source="fixture"), data_path, meta_path)
+    return data_path, meta_path
+
+
+def test_series_filters_and_aggregates(tmp_path):
+    data_path, meta_path = _seed_series(tmp_path)
+    store = SqliteStore(str(tmp_path / "cache.sqlite"))
+    table = store.sync_series(data_path, meta_path)
+    assert table == series_table(data_path)
+
+    rows = store.query(table, start="2024-02-01", filters={"dim_Function": "HR"})
+    assert rows == [{"date": "2024-02-01", "value": 3.0, "dim_Function": "HR"}]
+    totals = store.query(table, aggregate="sum")
+    assert string_rows(totals) == [
+        {"date": "2024-01-01", "value": "3.0"},
+        {"date": "2024-02-01", "value": "7.0"},
+    ]
+    assert store.series_meta(data_path).row_count == 4
+    assert store._connect().execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    with pytest.raises(ValueError):
+        store.query(table, filters={"dim_Unknown": "x"})
+    with pytest.raises(ValueError):
+        store.query(table, aggregate="median")
+
+
+def test_series_table_rebuilt_only_when_snapshot_changes(tmp_path):
+    data_path, meta_path = _seed_series(tmp_path)
+    store = SqliteStore(str(tmp_path / "cache.sqlite"))
+    table = store.sync_series(data_path, meta_path)
+    first_version = store.version(table)
+    store.sync_series(data_path, meta_path)
+    assert store.version(table) == first_version
+
+    _seed_series(tmp_path, value_offset=10.0)
+    store.sync_series(data_path, meta_path)
+    assert store.version(table) != first_version
+    assert store.query(table, filters={"dim_Function": "HR"})[0]["value"] == 11.0
+
+
+def test_mcp_scenarios_served_from_sqlite(tmp_path, monkeypatch):
+    scenarios = tmp_path / "scenarios.csv"
+    pd.DataFrame(
+        {
+            "date": ["2024-01-01", "2024-02-01", "2024-01-01"],
+            "scenario": ["base", "base", "hiring_freeze"],
+            "yhat": [1.5, 2.5, 1.0],
+        }
+    ).to_csv(scenarios, index=False)
+    store = SqliteStore(str(tmp_path / "cache.sqlite"))
+    monkeypatch.setattr(mcp_server, "SCENARIOS_PATH", str(scenarios))
+    monkeypatch.setattr(mcp_server, "default_store", lambda: store)
+    monkeypatch.setattr(mcp_server, "PRESETS_V2", {"base": {}, "hiring_freeze": {}})
+
+    result = mcp_server.get_scenarios(scenario="base", start="2024-02-01")
+    assert result["rows"] == [{"date": "2024-02-01", "scenario": "base", "yhat": "2.5"}]
+    with pytest.raises(CacheError):
+        store.query("forecast")
+
+    # Unfiltered rows keep the CSV's per-scenario grouping, as the file fallback does.
+    served = mcp_server.get_scenarios()["rows"]
+    monkeypatch.setattr(mcp_server, "default_store", lambda: None)
+    assert served == mcp_server.get_scenarios()["rows"]
+    assert [row["scenario"] for row in served] == ["base", "base", "hiring_freeze"]
+
+
+def test_mcp_timeseries_served_per_cache_path(tmp_path, monkeypatch):
+    default_dir, other_dir = tmp_path / "default", tmp_path / "other"
+    default_dir.mkdir()
+    other_dir.mkdir()
+    default_path, default_meta = _seed_series(default_dir)
+    other_path, other_meta = _seed_series(other_dir, value_offset=10.0)
+    store = SqliteStore(str(tmp_path / "cache.sqlite"))
+    store.sync_series(default_path, default_meta)
+    monkeypatch.setattr(mcp_server, "default_store", lambda: store)
+
+    result = mcp_server.get_timeseries(
+        cache_path=other_path,
+        meta_path=other_meta,
+        filters={"dim_Function": "HR"},
+        end="2024-01-31",
+    )
+    assert result["rows"] == [{"date": "2024-01-01", "value": "11.0", "dim_Function": "HR"}]
+    assert result["meta"]["content_hash"] == store.series_meta(other_path).content_hash
+    assert result["meta"]["content_hash"] != store.series_meta(default_path).content_hash
+    default_rows = store.query(series_table(default_path), filters={"dim_Function": "HR"})
+    assert default_rows[0]["value"] == 1.0
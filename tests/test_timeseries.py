@@ -1,11 +1,19 @@
+from dataclasses import replace
 from datetime import datetime, timezone
 from types import SimpleNamespace
 from urllib import parse
 
 import pandas as pd
+import pytest
 
 from sac_connector import export as export_module
-from sac_connector.timeseries import fetch_timeseries
+from sac_connector.timeseries import (
+    DEFAULT_SLICE,
+    fetch_timeseries,
+    iter_fact_pages,
+    split_by_date,
+    split_by_members,
+)
 
 
 def _mock_token():
@@ -50,6 +58,13 @@ def test_pagination_collects_all(monkeypatch):
     df = fetch_timeseries("provider", config=config)
     assert isinstance(df, pd.DataFrame)
     assert len(df) == 4
+    expected = pd.DataFrame([row for payload in payloads for row in payload["value"]])
+    pd.testing.assert_frame_equal(df, expected)
+
+    calls["count"] = 0
+    categorical = fetch_timeseries("provider", config=config, categorical_dims=True)
+    assert isinstance(categorical["Version"].dtype, pd.CategoricalDtype)
+    assert categorical["Date"].dtype == expected["Date"].dtype
 
 
 def test_retry_on_429(monkeypatch):
@@ -92,3 +107,76 @@ def test_timeseries_ignores_page_size_param(monkeypatch):
     assert "$top" not in query
     assert "$skip" not in query
     assert "Prefer" not in headers
+
+
+def test_iter_fact_pages_yields_pages_and_truncates(monkeypatch):
+    payloads = [
+        {"value": [{"Date": "202001", "SignedData": 1}] * 3, "nextLink": "http://next"},
+        {"value": [{"Date": "202002", "SignedData": 2}] * 3, "nextLink": "http://next2"},
+        {"value": [{"Date": "202003", "SignedData": 3}] * 3},
+    ]
+    calls = {"count": 0}
+
+    def fake_request_json(url, headers, timeout):
+        value = payloads[calls["count"]]
+        calls["count"] += 1
+        return value
+
+    monkeypatch.setattr(export_module, "_request_json", fake_request_json)
+    monkeypatch.setattr(
+        "sac_connector.timeseries.request_token", lambda _cfg: _mock_token()
+    )
+
+    config = SimpleNamespace(tenant_url="https://example.sap")
+    pages = list(iter_fact_pages("provider", config=config, max_rows=5))
+    assert [len(page) for page in pages] == [3, 2]
+    assert calls["count"] == 2
+
+
+def test_split_by_date_is_contiguous_and_disjoint():
+    parts = split_by_date(DEFAULT_SLICE, "202311", "202404", 4)
+    assert [(p.date_from, p.date_to) for p in parts] == [
+        ("202311", "202312"),
+        ("202401", "202402"),
+        ("202403", "202403"),
+        ("202404", "202404"),
+    ]
+    assert all(p.filters == DEFAULT_SLICE.filters for p in parts)
+
+
+def test_partitioned_fetch_merges_in_partition_order(monkeypatch):
+    def fake_request_json(url, headers, timeout):
+        query = dict(parse.parse_qsl(parse.urlparse(url).query))
+        member = query["$filter"].split("CostCenters eq '")[1].split("'")[0]
+        return {"value": [{"Date": "202001", "SignedData": 1, "CostCenters": member}]}
+
+    monkeypatch.setattr(export_module, "_request_json", fake_request_json)
+    monkeypatch.setattr(
+        "sac_connector.timeseries.request_token", lambda _cfg: _mock_token()
+    )
+
+    config = SimpleNamespace(tenant_url="https://example.sap")
+    members = ["CC9", "CC1", "CC5"]
+    base = replace(
+        DEFAULT_SLICE,
+        filters={k: v for k, v in DEFAULT_SLICE.filters.items() if k != "CostCenters"},
+    )
+    partitions = split_by_members(base, "CostCenters", members)
+    timings = []
+    df = fetch_timeseries(
+        "provider",
+        config=config,
+        partitions=partitions,
+        max_workers=3,
+        prefetch=1,
+        timings=timings,
+    )
+    assert list(df["CostCenters"]) == members
+    assert [timing.rows for timing in timings] == [1, 1, 1]
+
+
+def test_split_by_members_rejects_conflicting_filter():
+    with pytest.raises(ValueError, match="CostCenters"):
+        split_by_members(DEFAULT_SLICE, "CostCenters", ["CC1", "CC2"])
+    parts = split_by_members(DEFAULT_SLICE, "CostCenters", ["#"])
+    assert parts[0].filters == DEFAULT_SLICE.filters
@@ -0,0 +1,168 @@
+import threading
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from sac_connector.auth import TokenCache, TokenInfo
+
+
+def _config(client_id="client"):
+    return SimpleNamespace(token_url="https://auth.example/oauth/token", client_id=client_id)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    def __call__(self):
+        return self.now
+
+
+def _fetcher(clock, calls, expires_in=3600):
+    def fetch(_config):
+        calls.append(clock())
+        return TokenInfo(
+            access_token=f"token-{len(calls)}",
+            token_type="Bearer",
+            expires_in=expires_in,
+            obtained_at=clock(),
+        )
+
+    return fetch
+
+
+def test_reuses_token_until_margin():
+    clock = _Clock()
+    calls = []
+    cache = TokenCache(margin_seconds=60, refresh_ahead_seconds=60, clock=clock)
+    fetch = _fetcher(clock, calls)
+
+    first = cache.get(_config(), fetch=fetch)
+    clock.now += timedelta(seconds=3000)
+    assert cache.get(_config(), fetch=fetch) is first
+    assert len(calls) == 1
+
+    clock.now += timedelta(seconds=560)
+    second = cache.get(_config(), fetch=fetch)
+    assert second.access_token == "token-2"
+    assert len(calls) == 2
+
+
+def test_keys_by_client_id():
+    clock = _Clock()
+    calls = []
+    cache = TokenCache(clock=clock)
+    fetch = _fetcher(clock, calls)
+
+    cache.get(_config("a"), fetch=fetch)
+    cache.get(_config("b"), fetch=fetch)
+    cache.get(_config("a"), fetch=fetch)
+    assert len(calls) == 2
+
+
+def test_refresh_ahead_runs_in_background():
+    clock = _Clock()
+    calls = []
+    refreshed = threading.Event()
+    cache = TokenCache(margin_seconds=60, refresh_ahead_seconds=600, clock=clock)
+    base_fetch = _fetcher(clock, calls)
+
+    def fetch(config):
+        token = base_fetch(config)
+        if len(calls) > 1:
+            refreshed.set()
+        return token
+
+    first = cache.get(_config(), fetch=fetch)
+    clock.now += timedelta(seconds=3100)
+    assert cache.get(_config(), fetch=fetch) is first
+    assert refreshed.wait(timeout=5)
+    # Wait for the background thread to publish the new token.
+    for _ in range(100):
+        token = cache.get(_config(), fetch=fetch)
+        if token.access_token == "token-2":
+            break
+        threading.Event().wait(0.01)
+    assert token.access_token == "token-2"
+    assert len(calls) == 2
+
+
+def test_short_lived_token_is_not_refreshed_on_every_call():
+    clock = _Clock()
+    calls = []
+    refreshed = threading.Event()
+    cache = TokenCache(clock=clock)
+    base_fetch = _fetcher(clock, calls, expires_in=240)
+
+    def fetch(config):
+        token = base_fetch(config)
+        if len(calls) > 1:
+            refreshed.set()
+        return token
+
+    first = cache.get(_config(), fetch=fetch)
+    for _ in range(20):
+        assert cache.get(_config(), fetch=fetch) is first
+    assert len(calls) == 1
+
+    # Refresh-ahead is capped at half the lifetime, so the refresh starts after 120s.
+    clock.now += timedelta(seconds=130)
+    assert cache.get(_config(), fetch=fetch) is first
+    assert refreshed.wait(timeout=5)
+
+
+def test_concurrent_callers_share_one_request():
+    clock = _Clock()
+    calls = []
+    cache = TokenCache(clock=clock)
+    fetch = _fetcher(clock, calls)
+    results = []
+
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get(_config(), fetch=fetch)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert len({token.access_token for token in results}) == 1
+
+
+def test_config_without_token_url_bypasses_cache():
+    clock = _Clock()
+    calls = []
+    cache = TokenCache(clock=clock)
+    fetch = _fetcher(clock, calls)
+
+    cache.get(SimpleNamespace(), fetch=fetch)
+    cache.get(SimpleNamespace(), fetch=fetch)
+    assert len(calls) == 2
+
+
+def test_background_refresh_failure_allows_retry():
+    clock = _Clock()
+    calls = []
+    attempts = []
+    cache = TokenCache(margin_seconds=60, refresh_ahead_seconds=600, clock=clock)
+    base_fetch = _fetcher(clock, calls)
+
+    def fetch(config):
+        attempts.append(1)
+        if len(attempts) == 2:
+            raise TimeoutError("token endpoint timed out")
+        return base_fetch(config)
+
+    first = cache.get(_config(), fetch=fetch)
+    clock.now += timedelta(seconds=3100)
+    assert cache.get(_config(), fetch=fetch) is first
+    # The failed refresh must clear the in-flight flag so the next call starts another one.
+    token = first
+    for _ in range(200):
+        token = cache.get(_config(), fetch=fetch)
+        if token.access_token == "token-2":
+            break
+        threading.Event().wait(0.01)
+    assert token.access_token == "token-2"
+    assert len(attempts) == 3